@@ -12,8 +12,7 @@ class HPAppWeb:
 
     def login(self, username, password):
         self.login_page.open()
-        self.login_page.enter_username(username)
-        self.login_page.enter_password(password)
+        self.login_page.fill_credentials(username, password)
         self.login_page.click_login()
         assert self.login_page.is_login_successful(), "Login unsuccessful"
     
@@ -0,0 +1,136 @@
+"""
+Framework overhead benchmarks, offline, against an in-process fake driver.
+
+Times BasePage._safe_action (happy path, retry, stale recovery, self-heal,
+batched form fill), WaitUtils, SelfHealingEngine and logging against
+FakeDriverManager (benchmarks/fake_driver.py), which serves the static HTML
+fixtures in benchmarks/fixtures padded to several sizes. No browser,
+device or app under test is needed.
+
+With zero injected latency the numbers are pure framework overhead;
+--latency / --jitter add a per-command delay to see how round trips add
+up, and --flaky-rate injects random stale-element failures.
+
+Every run is stored in benchmarks/results/NNNN_<commit>.json. --compare
+checks the run against a stored one (the latest by default) and exits
+with status 1 when a median regressed by more than --threshold percent.
+
+Usage:
+    python -m benchmarks.bench_framework
+    python -m benchmarks.bench_framework --filter healing --nodes 0 10000
+    python -m benchmarks.bench_framework --compare            # vs latest stored run
+    python -m benchmarks.bench_framework --compare 0003 --threshold 15
+    python -m benchmarks.bench_framework --latency 2 --no-save
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+from benchmarks.harness import ResultStore, commit_info, compare, measure, summarize
+from core.configManager import ConfigManager
+
+
+def prepare_environment():
+    """Run in a scratch directory with console logging off.
+
+    Heals, journals, screenshots and logs land in the scratch directory,
+    and healed locators are not persisted, so every round takes the same
+    path. Must run before the framework is imported.
+    """
+    workdir = tempfile.mkdtemp(prefix="agentra-bench-")
+    os.chdir(workdir)
+    ConfigManager.load()
+    ConfigManager._config.setdefault("logging", {})["console"] = False
+    ConfigManager._config.setdefault("healing", {})["store_enabled"] = False
+    return workdir
+
+
+def expand(cases, sizes, selected):
+    for case in cases:
+        for nodes in (sizes if case.sized else (None,)):
+            name = f"{case.group}/{case.name}" + (f"[{nodes}]" if nodes is not None else "")
+            if not selected or any(part in name for part in selected):
+                yield name, case, nodes
+
+
+def run(args):
+    from benchmarks.framework_cases import CASES
+
+    results = []
+    print(f"{'benchmark':<34} | {'median':>10} | {'mean':>10} | {'stddev':>9} | {'ops/s':>9} | {'cmds/op':>7}")
+    print("-" * 96)
+    for name, case, nodes in expand(CASES, args.nodes, args.filter):
+        scenario = case.func(args) if nodes is None else case.func(args, nodes)
+        rounds = args.rounds or case.rounds
+        samples = measure(scenario.run, rounds, warmup=args.warmup, setup=scenario.setup)
+
+        stats = summarize(samples)
+        if scenario.driver is not None:
+            stats["commands_per_op"] = sum(scenario.driver.commands.values()) / (rounds + args.warmup)
+        results.append({"name": name, "group": case.group, "params": {"nodes": nodes}, "stats": stats})
+
+        commands = f"{stats['commands_per_op']:>7.1f}" if "commands_per_op" in stats else f"{'-':>7}"
+        print(f"{name:<34} | {stats['median'] * 1e6:>8.1f}us | {stats['mean'] * 1e6:>8.1f}us | "
+              f"{stats['stddev'] * 1e6:>7.1f}us | {stats['ops']:>9.0f} | {commands}")
+    return results
+
+
+def report(rows, regressions, baseline, threshold):
+    print(f"\nCompared with {os.path.basename(baseline['path'])} (threshold {threshold:.0%}):")
+    for name, before, after, change in rows:
+        if change is None:
+            print(f"  {name:<34} {'new':>10}   {after * 1e6:>8.1f}us")
+            continue
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"  {name:<34} {before * 1e6:>8.1f}us → {after * 1e6:>8.1f}us  {change:>+7.1%}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", nargs="+", default=None,
+                        help="Only benchmarks whose name contains one of these strings")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[0, 1000, 10000],
+                        help="Extra fixture elements for size-dependent benchmarks")
+    parser.add_argument("--rounds", type=int, default=None, help="Rounds per benchmark (default: per case)")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.0, help="Injected latency per command (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency per command (ms)")
+    parser.add_argument("--flaky-rate", type=float, default=0.0,
+                        help="Probability that an element action fails with a stale element")
+    parser.add_argument("--compare", nargs="?", const="latest", default=None,
+                        help="Stored run to compare against: number, path or 'latest'")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Median slowdown (percent) reported as a regression")
+    parser.add_argument("--no-save", action="store_true", help="Do not store this run")
+    args = parser.parse_args()
+
+    store = ResultStore()
+    baseline = store.load(args.compare) if args.compare else None
+    if args.compare and baseline is None:
+        parser.error(f"No stored run matches '{args.compare}' in {store.directory}")
+    commit = commit_info()
+
+    workdir = prepare_environment()
+    try:
+        results = run(args)
+    finally:
+        from core.logger import LoggingPipeline
+        LoggingPipeline.stop()
+        os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if not args.no_save:
+        options = {key: getattr(args, key) for key in ("nodes", "rounds", "warmup", "latency", "jitter", "flaky_rate")}
+        print(f"\nSaved {store.save(results, options, commit)}")
+
+    if baseline is not None:
+        rows, regressions = compare(results, baseline, args.threshold / 100)
+        report(rows, regressions, baseline, args.threshold / 100)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
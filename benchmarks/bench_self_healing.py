@@ -0,0 +1,108 @@
+"""
+Micro-benchmark: exhaustive vs pre-filtered fuzzy locator healing.
+
+Builds synthetic DOM attribute sets of 1k / 10k / 100k nodes and times the
+old exhaustive ``SequenceMatcher`` scan (what ``_heal_by_similarity`` used
+to do) against ``CandidateIndex``. Every query also checks that the top-k
+results of both paths are identical.
+
+Usage:
+    python -m benchmarks.bench_self_healing
+    python -m benchmarks.bench_self_healing --sizes 1000 10000 --queries 20 --top-k 3
+"""
+import argparse
+import random
+import string
+import time
+from difflib import SequenceMatcher
+
+from utils.fuzzy_index import CandidateIndex
+
+WORDS = [
+    "user", "name", "password", "email", "submit", "login", "btn", "input",
+    "form", "field", "nav", "menu", "item", "header", "footer", "card",
+    "shipping", "address", "city", "zip", "phone", "printer", "enroll", "code",
+]
+
+
+def synthetic_ids(node_count, seed=7):
+    """Attribute values shaped like real SPA ids: ``login-form-field-123``."""
+    rng = random.Random(seed)
+    values = []
+    for n in range(node_count):
+        parts = rng.sample(WORDS, rng.randint(1, 3))
+        suffix = "".join(rng.choices(string.ascii_lowercase + string.digits, k=rng.randint(0, 4)))
+        values.append("-".join(parts) + (f"-{suffix}" if suffix else "") + f"-{n % 97}")
+    return values
+
+
+def mutate(value, rng):
+    """Simulate a renamed locator: drop, swap or add a couple of characters."""
+    chars = list(value)
+    for _ in range(rng.randint(1, 2)):
+        op = rng.choice(("drop", "swap", "add"))
+        i = rng.randrange(len(chars))
+        if op == "drop" and len(chars) > 1:
+            chars.pop(i)
+        elif op == "swap":
+            chars[i] = rng.choice(string.ascii_lowercase)
+        else:
+            chars.insert(i, rng.choice(string.ascii_lowercase))
+    return "".join(chars)
+
+
+def exhaustive_top_k(values, query, k=1, threshold=0.7):
+    """Reference implementation: score every value, best first, doc order on ties."""
+    scored = []
+    seen = set()
+    for position, value in enumerate(values):
+        if value in seen:
+            continue
+        seen.add(value)
+        score = SequenceMatcher(None, query.lower(), value.lower()).ratio()
+        if score > threshold:
+            scored.append((-score, position, value))
+    scored.sort()
+    return [(value, -neg_score) for neg_score, _, value in scored[:k]]
+
+
+def run(sizes, query_count, top_k):
+    rng = random.Random(11)
+    print(f"{'nodes':>8} | {'index build':>11} | {'exhaustive/query':>16} | {'indexed/query':>13} | {'speedup':>7}")
+    print("-" * 68)
+
+    for size in sizes:
+        values = synthetic_ids(size)
+        distinct = list(dict.fromkeys(values))
+        queries = [mutate(rng.choice(distinct), rng) for _ in range(query_count)]
+
+        start = time.perf_counter()
+        index = CandidateIndex(distinct)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = [exhaustive_top_k(values, query, top_k) for query in queries]
+        old = (time.perf_counter() - start) / query_count
+
+        start = time.perf_counter()
+        actual = [index.top_k(query, top_k) for query in queries]
+        new = (time.perf_counter() - start) / query_count
+
+        if actual != expected:
+            raise AssertionError(f"Indexed results diverge from exhaustive scan at {size} nodes")
+
+        print(f"{size:>8} | {build * 1000:>9.1f}ms | {old * 1000:>14.2f}ms | "
+              f"{new * 1000:>11.2f}ms | {old / new if new else float('inf'):>6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--top-k", type=int, default=1)
+    args = parser.parse_args()
+    run(args.sizes, args.queries, args.top_k)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""
+In-process fake driver for offline framework benchmarks.
+
+FakeWebDriver stands in for a raw Selenium driver: it serves a static HTML
+page (benchmarks/fixtures) parsed once with BeautifulSoup and answers the
+commands the framework sends (find_element, page_source, screenshots,
+element click / typing / visibility, the DOM snapshot token script). Every command is counted and can be
+slowed down or made to fail:
+
+    latency / jitter   seconds added to every command (uniform jitter)
+    fail(command, exc) fail the next N calls of one command
+    flaky_rate         fail any element action with this probability
+
+FakeDriverManager is the BaseDriver implementation page objects use, the
+same way WebDriverManager wraps a Selenium session.
+
+Usage:
+    manager = FakeDriverManager(nodes=1000, latency=0.002).get_driver()
+    LoginPage(manager).enter_username("student")
+"""
+import os
+import random
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+
+from core.base_driver import BaseDriver
+from core.dom_scripts import SNAPSHOT_TOKEN_JS
+from core.wait_engine import EventWaitEngine
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# Smallest valid PNG (1x1, transparent)
+BLANK_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+
+# //tag[predicate] with the predicates our locators use
+_XPATH = re.compile(r"^//(?P<tag>\*|[\w-]+)(?:\[(?P<predicate>.+)\])?$")
+_ATTR_EQUALS = re.compile(r"^@([\w-]+)=['\"](.*)['\"]$")
+_TEXT_EQUALS = re.compile(r"^text\(\)=['\"](.*)['\"]$")
+_CONTAINS = re.compile(r"^contains\((@[\w-]+|text\(\)),\s*['\"](.*)['\"]\)$")
+
+
+@lru_cache(maxsize=None)
+def fixture_html(nodes=0, name="login.html"):
+    """Fixture page padded with ``nodes`` extra elements (deterministic).
+
+    The padding uses the same SPA-style ids as bench_self_healing, so
+    healing has realistic near-miss candidates to rank.
+    """
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        html = f.read()
+    if not nodes:
+        return html
+
+    from benchmarks.bench_self_healing import synthetic_ids
+    cards = "\n".join(
+        f'    <div class="card" id="{value}" data-row="{n}"><span name="{value}-label">{value}</span></div>'
+        for n, value in enumerate(synthetic_ids(nodes // 2))
+    )
+    return html.replace('  <main id="main-container">', f'  <main id="main-container">\n{cards}', 1)
+
+
+class FakeElement:
+    """WebElement stand-in backed by a BeautifulSoup tag."""
+
+    def __init__(self, driver, tag):
+        self._driver = driver
+        self._tag = tag
+
+    @property
+    def tag_name(self):
+        self._driver._command("getElementTagName")
+        return self._tag.name
+
+    @property
+    def text(self):
+        self._driver._command("getElementText")
+        return self._tag.get_text(strip=True)
+
+    def get_attribute(self, name):
+        self._driver._command("getElementAttribute")
+        if name == "value":
+            return self._driver.values.get(id(self._tag), self._tag.get("value"))
+        return self._tag.get(name)
+
+    def is_displayed(self):
+        self._driver._command("isElementDisplayed")
+        for tag in [self._tag, *self._tag.parents]:
+            if tag.name is None:
+                continue
+            style = (tag.get("style") or "").replace(" ", "")
+            if tag.has_attr("hidden") or "display:none" in style or tag.get("type") == "hidden":
+                return False
+        return True
+
+    def is_enabled(self):
+        self._driver._command("isElementEnabled")
+        return not self._tag.has_attr("disabled")
+
+    def click(self):
+        self._driver._command("clickElement", action=True)
+        self._driver.clicks.append(self._tag.get("id"))
+
+    def clear(self):
+        self._driver._command("clearElement", action=True)
+        self._driver.values[id(self._tag)] = ""
+
+    def send_keys(self, *value):
+        self._driver._command("sendKeysToElement", action=True)
+        if not self.is_displayed():
+            raise ElementNotInteractableException("element not interactable")
+        self._driver.values[id(self._tag)] = self._driver.values.get(id(self._tag), "") + "".join(value)
+
+
+class FakeWebDriver:
+    """Raw Selenium-like driver over one static page.
+
+    Attributes:
+        commands (Counter): Commands sent, by W3C command name.
+        clicks (list): ids of clicked elements, in order.
+        values (dict): Text typed into each element.
+    """
+
+    def __init__(self, html, url="https://bench.local/login", latency=0.0, jitter=0.0,
+                 flaky_rate=0.0, flaky_exception=StaleElementReferenceException, seed=7):
+        self._html = html
+        self._url = url
+        self.capabilities = {}
+        self.latency = latency
+        self.jitter = jitter
+        self.flaky_rate = flaky_rate
+        self.flaky_exception = flaky_exception
+        self.commands = Counter()
+        self.clicks = []
+        self.values = {}
+        self._failures = {}
+        self._rng = random.Random(seed)
+        self._soup = BeautifulSoup(html, "html.parser")
+
+    # ------------------------------------------------------------------
+    # FAULT / LATENCY INJECTION
+    # ------------------------------------------------------------------
+    def fail(self, command, exception=StaleElementReferenceException, times=1):
+        """Make the next ``times`` calls of ``command`` raise ``exception``."""
+        self._failures[command] = (exception, times)
+
+    def _command(self, name, action=False):
+        self.commands[name] += 1
+        if self.latency or self.jitter:
+            time.sleep(self.latency + self._rng.uniform(0, self.jitter))
+
+        failure = self._failures.get(name)
+        if failure is not None:
+            exception, times = failure
+            if times <= 1:
+                del self._failures[name]
+            else:
+                self._failures[name] = (exception, times - 1)
+            raise exception(f"Injected failure in {name}")
+        if action and self.flaky_rate and self._rng.random() < self.flaky_rate:
+            raise self.flaky_exception(f"Injected flaky {name}")
+
+    # ------------------------------------------------------------------
+    # SELENIUM SURFACE
+    # ------------------------------------------------------------------
+    @property
+    def page_source(self):
+        self._command("getPageSource")
+        return self._html
+
+    @property
+    def current_url(self):
+        self._command("getCurrentUrl")
+        return self._url
+
+    @property
+    def title(self):
+        self._command("getTitle")
+        return self._soup.title.get_text() if self._soup.title else ""
+
+    def get(self, url):
+        self._command("get")
+        self._url = url
+
+    def execute_script(self, script, *args):
+        """Only the DOM snapshot token; the static page never mutates."""
+        self._command("executeScript")
+        if script == SNAPSHOT_TOKEN_JS:
+            return ["fake-document", 0, self._url]
+        raise JavascriptException("FakeWebDriver runs no page scripts")
+
+    def get_screenshot_as_png(self):
+        self._command("screenshot")
+        return BLANK_PNG
+
+    def find_element(self, by=By.ID, value=None):
+        self._command("findElement")
+        tags = self._select(by, value, first=True)
+        if not tags:
+            raise NoSuchElementException(f"Unable to locate element: {{\"method\":\"{by}\",\"selector\":\"{value}\"}}")
+        return FakeElement(self, tags[0])
+
+    def find_elements(self, by=By.ID, value=None):
+        self._command("findElements")
+        return [FakeElement(self, tag) for tag in self._select(by, value)]
+
+    def quit(self):
+        self._command("quit")
+
+    def _select(self, by, value, first=False):
+        limit = 1 if first else None
+        if by == By.ID:
+            return self._soup.find_all(id=value, limit=limit)
+        if by == By.NAME:
+            return self._soup.find_all(attrs={"name": value}, limit=limit)
+        if by == By.CLASS_NAME:
+            return self._soup.find_all(class_=value, limit=limit)
+        if by == By.TAG_NAME:
+            return self._soup.find_all(value, limit=limit)
+        if by == By.CSS_SELECTOR:
+            return self._soup.select(value, limit=limit or 0)
+        if by == By.XPATH:
+            return self._xpath(value, limit)
+        raise InvalidSelectorException(f"Unsupported locator strategy: {by}")
+
+    def _xpath(self, value, limit):
+        match = _XPATH.match(value)
+        if not match:
+            raise InvalidSelectorException(f"Unsupported XPath: {value}")
+        name = True if match.group("tag") == "*" else match.group("tag")
+        predicate = match.group("predicate")
+        if predicate is None:
+            return self._soup.find_all(name, limit=limit)
+
+        attr = _ATTR_EQUALS.match(predicate)
+        if attr:
+            return self._soup.find_all(name, attrs={attr.group(1): attr.group(2)}, limit=limit)
+
+        text = _TEXT_EQUALS.match(predicate)
+        if text:
+            return [tag for tag in self._soup.find_all(name)
+                    if tag.get_text(strip=True) == text.group(1)][:limit]
+
+        contains = _CONTAINS.match(predicate)
+        if contains:
+            target, needle = contains.groups()
+            if target == "text()":
+                found = [tag for tag in self._soup.find_all(name) if needle in tag.get_text()]
+            else:
+                found = [tag for tag in self._soup.find_all(name, attrs={target[1:]: True})
+                         if needle in " ".join(tag.get_attribute_list(target[1:]))]
+            return found[:limit]
+
+        raise InvalidSelectorException(f"Unsupported XPath predicate: {value}")
+
+
+class FakeDriverManager(BaseDriver):
+    """BaseDriver over FakeWebDriver, shaped like WebDriverManager.
+
+    Args:
+        html (str): Page to serve (defaults to the login fixture).
+        nodes (int): Extra elements padded into the default fixture.
+        poll_frequency (float): Wait polling interval (seconds).
+        **options: FakeWebDriver latency / failure injection settings.
+    """
+
+    def __init__(self, html=None, nodes=0, poll_frequency=0.01, **options):
+        self.driver = None
+        self.html = html if html is not None else fixture_html(nodes)
+        self.poll_frequency = poll_frequency
+        self.options = options
+
+    def get_driver(self):
+        self.driver = FakeWebDriver(self.html, **self.options)
+        return self
+
+    @property
+    def wait_engine(self):
+        engine = getattr(self, "_wait_engine", None)
+        if engine is None or engine.driver is not self.driver:
+            engine = self._wait_engine = EventWaitEngine(self.driver, self.poll_frequency)
+        return engine
+
+    def get(self, url):
+        self.driver.get(url)
+
+    def _locate(self, locator_type, locator_value):
+        return lambda: self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+
+    def find_element(self, locator_type, locator_value):
+        return self.resolved((locator_type, locator_value), self._locate(locator_type, locator_value))
+
+    def get_text(self, locator_type, locator_value):
+        return self.read(
+            (locator_type, locator_value),
+            self._locate(locator_type, locator_value),
+            lambda el: el.text
+        )
+
+    def click(self, locator_type, locator_value):
+        self.act(
+            (locator_type, locator_value),
+            self._locate(locator_type, locator_value),
+            lambda el: el.click()
+        )
+
+    def send_keys(self, locator_type, locator_value, text):
+        def type_text(el):
+            el.clear()
+            el.send_keys(text)
+
+        self.act((locator_type, locator_value), self._locate(locator_type, locator_value), type_text)
+
+    def wait_for_element(self, locator_type, locator_value, timeout=10):
+        cached = self.cached((locator_type, locator_value))
+        if cached is not None:
+            return cached
+        el = self.wait_engine.wait(getattr(By, locator_type.upper()), locator_value, "present", timeout)
+        return self.remember((locator_type, locator_value), el)
+
+    def resolve_elements(self, locators):
+        """One "round trip" for many locators, like WebDriverManager's script."""
+        self.driver._command("executeScript")
+        elements = []
+        for locator_type, locator_value in locators:
+            tags = self.driver._select(getattr(By, locator_type.upper()), locator_value, first=True)
+            elements.append(FakeElement(self.driver, tags[0]) if tags else None)
+        return elements
+
+    def quit(self):
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
@@ -0,0 +1,185 @@
+"""
+Benchmark cases for bench_framework, run against FakeDriverManager.
+
+Imported only after bench_framework has prepared the environment (scratch
+working directory, quiet logging), since importing the framework starts
+the logging pipeline.
+
+Each case builds its page / driver once and returns a Scenario: the
+callable timed per round, an optional untimed per-round setup, and the
+fake driver whose command counter gives round trips per operation.
+Cases marked ``sized`` run once per fixture size (--nodes).
+"""
+from collections import namedtuple
+
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from benchmarks.fake_driver import FakeDriverManager
+from core.logger import get_logger
+from pages.base_page import BasePage
+from utils.dom_snapshot import DomSnapshotCache
+from utils.retry_policy import RetryPolicy
+from utils.self_healing import SelfHealingEngine
+from utils.waits import WaitUtils
+
+Case = namedtuple("Case", "group name func rounds sized")
+Scenario = namedtuple("Scenario", "run setup driver", defaults=(None, None))
+
+CASES = []
+
+USERNAME = ("id", "username")
+PASSWORD = ("id", "password")
+SUBMIT = ("id", "submit")
+RENAMED_SUBMIT = ("xpath", "//button[@id='submit1']")
+
+
+def case(group, rounds=200, sized=False):
+    def register(func):
+        CASES.append(Case(group, func.__name__, func, rounds, sized))
+        return func
+    return register
+
+
+def bench_policy():
+    """Retries without backoff sleeps and single-lookup waits, so a round
+    measures the framework, not configured delays."""
+    return RetryPolicy(max_retries=3, base_delay=0, jitter=0, attempt_timeout=0, deadline=None)
+
+
+def _driver(options, nodes=0):
+    return FakeDriverManager(
+        nodes=nodes,
+        latency=options.latency / 1000,
+        jitter=options.jitter / 1000,
+        flaky_rate=options.flaky_rate,
+    ).get_driver()
+
+
+def _page(options, nodes=0):
+    manager = _driver(options, nodes)
+    page = BasePage(manager)
+    page.retry_policy = bench_policy()
+    return manager, page
+
+
+# ----------------------------------------------------------------------
+# BasePage._safe_action
+# ----------------------------------------------------------------------
+@case("safe_action")
+def click_happy(options):
+    manager, page = _page(options)
+    return Scenario(lambda: page.click(*SUBMIT), driver=manager.driver)
+
+
+@case("safe_action")
+def enter_text_happy(options):
+    manager, page = _page(options)
+    return Scenario(lambda: page.enter_text(*USERNAME, "student"), driver=manager.driver)
+
+
+@case("safe_action")
+def click_retry(options):
+    """First click fails with a non-locator error: one retry (zero backoff)."""
+    manager, page = _page(options)
+    return Scenario(
+        lambda: page.click(*SUBMIT),
+        setup=lambda: manager.driver.fail("clickElement", WebDriverException),
+        driver=manager.driver,
+    )
+
+
+@case("safe_action")
+def click_stale_recovery(options):
+    """Stale handle on click: re-resolved inside the attempt, no retry."""
+    manager, page = _page(options)
+    return Scenario(
+        lambda: page.click(*SUBMIT),
+        setup=lambda: manager.driver.fail("clickElement", StaleElementReferenceException),
+        driver=manager.driver,
+    )
+
+
+@case("safe_action", rounds=50, sized=True)
+def click_heal(options, nodes):
+    """Renamed locator: failed attempt, self-heal, successful retry."""
+    manager, page = _page(options, nodes)
+    return Scenario(lambda: page.click(*RENAMED_SUBMIT), driver=manager.driver)
+
+
+@case("safe_action")
+def fill_form(options):
+    manager, page = _page(options)
+    fields = {USERNAME: "student", PASSWORD: "Password123"}
+    return Scenario(lambda: page.fill_form(fields), driver=manager.driver)
+
+
+# ----------------------------------------------------------------------
+# WaitUtils
+# ----------------------------------------------------------------------
+@case("waits")
+def wait_visible(options):
+    manager = _driver(options)
+    waits = WaitUtils(manager)
+    return Scenario(
+        lambda: waits.wait_until_visible(By.ID, "username", timeout=1, poll_frequency=0.01),
+        driver=manager.driver,
+    )
+
+
+@case("waits")
+def wait_for_any(options):
+    manager = _driver(options)
+    waits = WaitUtils(manager)
+    conditions = [
+        (By.ID, "success", "visible", None, "success"),
+        (By.ID, "username", "visible", None, "form"),
+    ]
+    return Scenario(lambda: waits.wait_for_any(conditions, timeout=1), driver=manager.driver)
+
+
+@case("waits")
+def wait_for_all(options):
+    manager = _driver(options)
+    waits = WaitUtils(manager)
+    conditions = [(By.ID, "username", "visible"), (By.ID, "password", "visible")]
+    return Scenario(lambda: waits.wait_for_all(conditions, timeout=1), driver=manager.driver)
+
+
+# ----------------------------------------------------------------------
+# SelfHealingEngine
+# ----------------------------------------------------------------------
+@case("healing", rounds=20, sized=True)
+def heal_cold(options, nodes):
+    """New page state: parse + index the DOM, then rank candidates."""
+    manager = _driver(options, nodes)
+    healer = SelfHealingEngine(manager)
+    return Scenario(
+        lambda: healer.self_heal_locator(("id", "usernme")),
+        setup=DomSnapshotCache.clear,
+        driver=manager.driver,
+    )
+
+
+@case("healing", rounds=100, sized=True)
+def heal_warm(options, nodes):
+    """Same page state: snapshot reused from DomSnapshotCache."""
+    manager = _driver(options, nodes)
+    healer = SelfHealingEngine(manager)
+    return Scenario(lambda: healer.self_heal_locator(("id", "usernme")), driver=manager.driver)
+
+
+# ----------------------------------------------------------------------
+# Logging
+# ----------------------------------------------------------------------
+@case("logging", rounds=5000)
+def log_info(options):
+    logger = get_logger("bench.framework")
+    return Scenario(lambda: logger.info("Entering text into %s", USERNAME))
+
+
+@case("logging", rounds=5000)
+def log_hot_path_filtered(options):
+    """Per-attempt line below logging.hot_path_level (the healthy-run cost)."""
+    logger = get_logger("bench.framework.steps", hot_path=True)
+    return Scenario(lambda: logger.info("%s - Attempt %d", "Clicking element", 1))
@@ -0,0 +1,156 @@
+"""
+Minimal pytest-benchmark style harness: timing, stored runs, comparison.
+
+Each benchmark is timed for a number of rounds (after warm-up rounds that
+are discarded) and summarised as min / max / mean / stddev / median / IQR /
+ops. A run is stored as benchmarks/results/NNNN_<commit>.json, so the
+results of two commits can be compared, and ``compare`` flags every
+benchmark whose median got slower than a threshold.
+"""
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def measure(func, rounds, warmup=1, setup=None):
+    """Time ``func()`` for ``rounds`` rounds; ``setup()`` runs untimed before each."""
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func()
+
+    samples = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    quartiles = statistics.quantiles(ordered, n=4) if len(ordered) > 1 else [ordered[0]] * 3
+    mean = statistics.fmean(ordered)
+    return {
+        "rounds": len(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": mean,
+        "stddev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "median": statistics.median(ordered),
+        "iqr": quartiles[2] - quartiles[0],
+        "ops": 1 / mean if mean else float("inf"),
+    }
+
+
+def commit_info():
+    """(short commit id, dirty) of the working tree, ("unknown", False) outside git."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True
+        ).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+class ResultStore:
+    """Numbered JSON runs in one directory (pytest-benchmark's storage layout).
+
+    Methods:
+        save(benchmarks, options, commit): Store a run; returns its path.
+            commit is a commit id or an (id, dirty) pair as returned by
+            commit_info(); by default the working tree's.
+        runs(): Stored run paths, oldest first.
+        load(ref): A run by path, number (e.g. "0003") or "latest".
+    """
+
+    def __init__(self, directory=RESULTS_DIR):
+        self.directory = directory
+
+    def runs(self):
+        return sorted(glob.glob(os.path.join(self.directory, "[0-9][0-9][0-9][0-9]_*.json")))
+
+    def save(self, benchmarks, options=None, commit=None):
+        os.makedirs(self.directory, exist_ok=True)
+        if commit is None:
+            commit, dirty = commit_info()
+        elif isinstance(commit, str):
+            dirty = False
+        else:
+            commit, dirty = commit
+        runs = self.runs()
+        number = int(os.path.basename(runs[-1])[:4]) + 1 if runs else 1
+        path = os.path.join(self.directory, f"{number:04d}_{commit}{'_dirty' if dirty else ''}.json")
+        run = {
+            "datetime": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": {"id": commit, "dirty": dirty},
+            "machine": machine_info(),
+            "options": options or {},
+            "benchmarks": benchmarks,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+        return path
+
+    def load(self, ref="latest"):
+        if os.path.isfile(ref):
+            path = ref
+        else:
+            runs = self.runs()
+            if ref == "latest":
+                matches = runs[-1:]
+            else:
+                matches = [p for p in runs if os.path.basename(p).startswith(str(ref).zfill(4))]
+            if not matches:
+                return None
+            path = matches[-1]
+        with open(path, "r", encoding="utf-8") as f:
+            run = json.load(f)
+        run["path"] = path
+        return run
+
+
+def compare(current, baseline, threshold=0.10):
+    """Median change per benchmark; returns (rows, regressions).
+
+    rows: (name, baseline median, current median, relative change), with
+    None for benchmarks missing from the baseline. A regression is a
+    median slower than baseline by more than ``threshold`` (fraction).
+    """
+    previous = {bench["name"]: bench for bench in baseline["benchmarks"]}
+    rows = []
+    regressions = []
+    for bench in current:
+        old = previous.get(bench["name"])
+        if old is None:
+            rows.append((bench["name"], None, bench["stats"]["median"], None))
+            continue
+        before, after = old["stats"]["median"], bench["stats"]["median"]
+        change = (after - before) / before if before else 0.0
+        rows.append((bench["name"], before, after, change))
+        if change > threshold:
+            regressions.append(bench["name"])
+    return rows, regressions
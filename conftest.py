@@ -6,6 +6,47 @@ from core.configManager import ConfigManager
 # =========================================================
 # SESSION INITIALIZATION
 # =========================================================
+def pytest_configure(config):
+    """
+    Remembers when the run started, for the session-end log merge, turns
+    on WebDriver command tracing for --trace-commands and points web URLs
+    at the local fixture server when it is enabled.
+    """
+    import time
+    config._agentra_started = time.time()
+
+    if config.getoption("--trace-commands"):
+        from core.command_tracer import CommandTracer
+        CommandTracer.enable()
+
+    _start_fixture_server(config)
+
+
+def _start_fixture_server(config):
+    """
+    The controller (or a non-xdist run) starts the snapshot server once;
+    workers reuse it through the URL handed over in workerinput.
+    """
+    from core.fixture_server import FixtureServer
+    if hasattr(config, "workerinput"):
+        url = config.workerinput.get("fixture_server_url")
+        if url:
+            FixtureServer.use(url)
+        return
+
+    ConfigManager.load()
+    if config.getoption("--fixture-server") or FixtureServer.enabled():
+        FixtureServer.use(FixtureServer.start())
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Passes the fixture server URL to each xdist worker."""
+    from core.fixture_server import FixtureServer
+    if FixtureServer.url:
+        node.workerinput["fixture_server_url"] = FixtureServer.url
+
+
 @pytest.fixture(scope="session", autouse=True)
 def initialize_config():
     """
@@ -15,6 +56,222 @@ def initialize_config():
     ConfigManager.load()
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Persists healed-locator hit counters collected during the run, closes
+    unclaimed warm-up and pooled browser sessions and gives back leased
+    devices.
+    Runs in every xdist worker as well as the controller.
+
+    On the controller (or a non-xdist run) the per-worker healing
+    journals are compacted into reports/healing_log.json, test
+    durations are folded into the timing store, step profiles are merged
+    into reports/step_profile.json, the fixture server is stopped and the
+    per-worker JSON-lines logs are merged into logs/run.jsonl.
+    """
+    from utils.healed_locator_store import HealedLocatorStore
+    HealedLocatorStore.flush()
+
+    from core.driver_warmup import DriverWarmup
+    DriverWarmup.shutdown()
+
+    from core.profiler import StepProfiler
+    StepProfiler.save()
+
+    from utils.attachments import AttachmentSink
+    AttachmentSink.flush()
+
+    from core.session_pool import SessionPool
+    SessionPool.shutdown()
+
+    from core.resource_pool import ResourcePool
+    ResourcePool.release_all()
+
+    if not hasattr(session.config, "workerinput"):
+        from utils.healing_journal import HealingJournal
+        HealingJournal.compact()
+
+        from utils.timing_store import TimingStore
+        if TimingStore.enabled():
+            TimingStore.save(_timing_profile(session.config))
+
+        StepProfiler.merge()
+
+        from core.fixture_server import FixtureServer
+        FixtureServer.stop()
+
+    from core.logger import LoggingPipeline
+    LoggingPipeline.flush()
+    if not hasattr(session.config, "workerinput") and ConfigManager.get("logging", "merge") is not False:
+        LoggingPipeline.merge(since=session.config._agentra_started)
+
+
+# =========================================================
+# DURATION-AWARE ORDERING
+# =========================================================
+def _timing_profile(config):
+    """Timing store profile: <platform>:<env> ("matrix" for --matrix runs)."""
+    from utils.timing_store import TimingStore
+    platform = "matrix" if config.getoption("--matrix") else config.getoption("--platform")
+    return TimingStore.profile(platform, config.getoption("--env"))
+
+
+def _schedule_chunk(config, count):
+    """
+    Tests each worker receives back to back when xdist starts the run:
+    LoadScheduling (--dist load) sends every worker a consecutive chunk
+    of at least 2 tests, loadgroup sends one work unit at a time.
+    """
+    workers = getattr(config, "workerinput", {}).get("workercount", 1)
+    if workers < 2 or config.getoption("dist", "no") != "load" or count < 2 * workers:
+        return workers, 1
+    maxschedchunk = config.getoption("maxschedchunk", None) or count
+    return workers, max(min(count // workers // 4, maxschedchunk), 2)
+
+
+def pytest_runtest_logreport(report):
+    """
+    Collects phase durations of driver tests for the timing store (unit
+    tests of the framework itself would skew the estimate for unknown
+    tests). Under xdist the controller receives every worker's reports,
+    so it alone saves them.
+    """
+    if not getattr(report, "uses_driver", False):
+        return
+    from utils.timing_store import TimingStore
+    TimingStore.record(report)
+
+
+# =========================================================
+# ALLURE ATTACHMENT WRITER
+# =========================================================
+@pytest.fixture(autouse=True)
+def attachment_writer():
+    """
+    Waits at teardown until the background writer has put this test's
+    Allure attachments on disk, so each result is complete when the test
+    finishes.
+
+    Fixtures that attach at teardown request it explicitly, so it is set
+    up before them and torn down after them; pytest orders autouse
+    fixtures of one scope by name, not by definition order.
+    """
+    yield
+    from utils.attachments import AttachmentSink
+    AttachmentSink.flush()
+
+
+# =========================================================
+# RETRY METRICS
+# =========================================================
+@pytest.fixture(autouse=True)
+def retry_metrics(request):
+    """
+    Reports how much time step retries cost the current test.
+
+    Totals are collected by RetryMetrics from every BasePage._safe_action
+    call and stored in the test report's user_properties.
+    """
+    yield
+    from utils.retry_policy import RetryMetrics
+    totals = RetryMetrics.pop(request.node.nodeid)
+    if totals:
+        for key, value in totals.items():
+            request.node.user_properties.append((key, round(value, 3)))
+
+
+# =========================================================
+# FAILURE SCREENSHOT RING BUFFER
+# =========================================================
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Exposes each phase's report as item.rep_<phase> for fixtures and
+    flags reports of tests that use a driver (uses_driver travels with
+    the report from xdist workers to the controller).
+    """
+    outcome = yield
+    report = outcome.get_result()
+    report.uses_driver = "driver" in item.fixturenames
+    setattr(item, f"rep_{report.when}", report)
+
+
+@pytest.fixture(autouse=True)
+def screenshot_buffer(request, attachment_writer):
+    """
+    Attaches buffered screenshots (screenshots.policy: ring_buffer)
+    only when the test failed; otherwise they are dropped.
+    """
+    yield
+    from utils.screenshots import ScreenshotRecorder
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.failed:
+        ScreenshotRecorder.flush_buffer()
+    else:
+        ScreenshotRecorder.discard_buffer()
+
+
+# =========================================================
+# STEP PROFILE
+# =========================================================
+@pytest.fixture(autouse=True)
+def step_profile(request, attachment_writer):
+    """
+    Times the test's steps (StepProfiler spans) and attaches a flame-style
+    breakdown to Allure: app latency vs retries vs healing vs reporting
+    vs framework overhead.
+
+    Tests without a driver (such as the framework's own unit tests) are
+    not profiled, so they add nothing to reports/step_profile.json.
+    """
+    if "driver" not in request.fixturenames:
+        yield
+        return
+
+    from core.profiler import StepProfiler
+    StepProfiler.begin(request.node.nodeid)
+    yield
+    profile = StepProfiler.end()
+    if profile is not None:
+        import allure
+        from utils.attachments import AttachmentSink
+        breakdown = profile["breakdown_s"]
+        for key, value in breakdown.items():
+            request.node.user_properties.append((f"profile_{key}_s", value))
+        AttachmentSink.attach(
+            StepProfiler.summary(profile),
+            name="Step Profile",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+
+# =========================================================
+# WEBDRIVER COMMAND TRACE
+# =========================================================
+@pytest.fixture(autouse=True)
+def command_trace(request, attachment_writer):
+    """
+    With tracing enabled (--trace-commands or tracing.enabled), attaches
+    the test's WebDriver command report to Allure: per-command counts and
+    latency, a latency histogram, the slowest commands and redundant
+    round trips (e.g. a findElement right after a wait on the same
+    locator).
+    """
+    yield
+    from core.command_tracer import CommandTracer
+    report = CommandTracer.pop(request.node.nodeid)
+    if report is not None:
+        import allure
+        from utils.attachments import AttachmentSink
+        request.node.user_properties.append(("webdriver_commands", report["commands"]))
+        request.node.user_properties.append(("webdriver_redundant", sum(report["redundant"].values())))
+        AttachmentSink.attach(
+            CommandTracer.summary(report),
+            name="WebDriver Commands",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+
 # =========================================================
 # PYTEST CLI ARGUMENTS
 # =========================================================
@@ -26,6 +283,14 @@ def pytest_addoption(parser):
         --platform: web | mobile | desktop
         --env: dev | qa | staging | prod
         --browser: chrome | firefox
+        --launch-profile: browser launch profile from config.yaml
+        --session-pool: reuse warm browser sessions across tests
+        --session-max-uses: tests per pooled session before recycling
+        --matrix: run every test on several platforms/browsers in one
+                  session ("all" or e.g. web:chrome,web:firefox,mobile)
+        --trace-commands: record every WebDriver command per test
+        --fixture-server: serve recorded page snapshots locally instead
+                          of the public site
     """
     parser.addoption("--platform", action="store", default="web",
                      help="Platform: web | mobile | desktop")
@@ -33,39 +298,259 @@ def pytest_addoption(parser):
                      help="Environment: dev | qa | staging | prod")
     parser.addoption("--browser", action="store", default="chrome",
                      help="Browser: chrome | firefox")
+    parser.addoption("--launch-profile", action="store", default=None,
+                     help="Browser launch profile from config.yaml browser_profiles "
+                          "(default: browser.profile)")
+    parser.addoption("--session-pool", action="store_true", default=False,
+                     help="Reuse warm browser sessions across tests (per worker)")
+    parser.addoption("--session-max-uses", action="store", type=int, default=None,
+                     help="Tests per pooled session before it is recycled "
+                          "(default: session_pool.max_uses in config.yaml)")
+    parser.addoption("--matrix", action="store", default=None,
+                     help="Run on several targets in one session: 'all' (matrix.targets "
+                          "in config.yaml) or e.g. web:chrome,web:firefox,mobile,desktop")
+    parser.addoption("--trace-commands", action="store_true", default=False,
+                     help="Trace WebDriver commands per test (latency histogram, slowest "
+                          "commands, redundant round trips) into the Allure report")
+    parser.addoption("--fixture-server", action="store_true", default=False,
+                     help="Serve recorded page snapshots (resources/snapshots) from a local "
+                          "HTTP server shared by all workers instead of the public site")
 
 
 # =========================================================
-# DRIVER FIXTURE
+# EXECUTION MATRIX
 # =========================================================
-@pytest.fixture(scope="function")
-def driver(request):
+def _matrix_targets(config):
+    spec = config.getoption("--matrix")
+    if not spec:
+        return None
+    from core.execution_matrix import ExecutionMatrix
+    ConfigManager.load()
+    return ExecutionMatrix.targets(spec)
+
+
+def pytest_generate_tests(metafunc):
     """
-    Creates and yields a platform driver based on CLI arguments.
+    With --matrix, parametrizes every driver-based test over the matrix
+    targets that match its platform markers.
+    """
+    if "matrix_target" not in metafunc.fixturenames:
+        return
+    targets = _matrix_targets(metafunc.config)
+    if targets is None:
+        return
 
-    Behavior:
-        - Instantiates WebDriverManager / MobileDriverManager /
-          DesktopDriverManager.
-        - Applies SingletonDriver internally.
-        - Ensures proper teardown.
+    from core.execution_matrix import ExecutionMatrix
+    markers = {mark.name for mark in metafunc.definition.iter_markers()}
+    targets = ExecutionMatrix.applicable(targets, markers)
+    metafunc.parametrize("matrix_target", targets, ids=[t.id for t in targets], indirect=True)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
     """
-    platform = request.config.getoption("--platform")
+    Orders tests longest-first from recorded durations (TimingStore),
+    then pins device-bound tests to one worker group per inventory
+    resource (ResourcePool) and the remaining tests of worker-limited
+    matrix platforms (matrix.workers, ``matrix-<platform>-N`` groups).
+    Groups are filled round-robin in that order, so long tests are
+    spread over the groups too.
+
+    Runs first so the xdist_group markers exist before xdist turns them
+    into nodeid suffixes (``--dist loadgroup`` in pytest.ini).
+    """
+    from core.resource_pool import ResourcePool
+    from utils.timing_store import TimingStore
+    ConfigManager.load()
+
+    if TimingStore.enabled():
+        TimingStore.order(items, _timing_profile(config), *_schedule_chunk(config, len(items)))
+
+    def xdist_group(group):
+        return pytest.mark.xdist_group(name=group)
+
+    ResourcePool.assign_groups(items, config.getoption("--platform"), xdist_group)
+    if config.getoption("--matrix"):
+        from core.execution_matrix import ExecutionMatrix
+        ExecutionMatrix.assign_groups(items, xdist_group)
+
+
+@pytest.fixture
+def matrix_target(request):
+    """
+    The MatrixTarget this test instance runs on, or None without --matrix.
+    Matrix results are filed under the target in the Allure report.
+    """
+    target = getattr(request, "param", None)
+    if target is not None:
+        import allure
+        allure.dynamic.parent_suite(target.id)
+        allure.dynamic.tag(target.id)
+    return target
+
+
+@pytest.fixture
+def resource(request, matrix_target):
+    """
+    Device / slot leased from the resource inventory for this test (the
+    one its xdist group is pinned to), or None when the test needs no
+    pool. The worker keeps the lease for the rest of the session.
+    """
+    from core.resource_pool import ResourcePool
+    platform, _ = _target(request, matrix_target)
+    pool = ResourcePool.required_pool(request.node, platform)
+    if not pool:
+        return None
+    return ResourcePool.lease(pool, ResourcePool.group_index(request.node, pool))
+
+
+def _target(request, matrix_target):
+    """(platform, browser) from the matrix target or the CLI options."""
+    if matrix_target is not None:
+        return matrix_target.platform, matrix_target.browser
+    return request.config.getoption("--platform"), request.config.getoption("--browser")
+
+
+# =========================================================
+# DRIVER WARM-UP
+# =========================================================
+WARMUP_PLATFORMS = ("web", "mobile")
+
+
+def _session_key(platform, browser):
+    """Pool / warm-up key: one per browser for web, per platform otherwise."""
+    return f"{platform}-{browser}" if platform == "web" else platform
 
+
+def _runs_tests_here(config):
+    """False on the xdist controller, which only schedules."""
+    return hasattr(config, "workerinput") or not getattr(config.option, "numprocesses", None)
+
+
+def _warmup_platform(config):
+    """The --platform to warm up in this process, or None when warm-up is off."""
+    from core.driver_warmup import DriverWarmup
+    platform = config.getoption("--platform")
+    if not DriverWarmup.enabled() or config.option.collectonly or config.getoption("--matrix") \
+            or platform not in WARMUP_PLATFORMS or not _runs_tests_here(config):
+        return None
+    return platform
+
+
+def _start_warmup(config):
+    """
+    Starts pre-spawning sessions for the CLI platform / browser (warmup
+    in config.yaml). Skipped for --collect-only, --matrix runs, desktop,
+    and device pools under xdist (a worker's later tests may belong to
+    another device's group).
+    """
+    platform = _warmup_platform(config)
+    if platform is None:
+        return
+
+    from core.resource_pool import ResourcePool
+    resource = None
+    if ResourcePool.resources(platform):
+        if hasattr(config, "workerinput"):
+            return
+        resource = ResourcePool.lease(platform)
+
+    from core.driver_warmup import DriverWarmup
+    browser = config.getoption("--browser")
+    DriverWarmup.start(
+        _session_key(platform, browser),
+        lambda: _create_driver(platform, config, browser, resource),
+        1 if config.getoption("--session-pool") else None
+    )
+
+
+def pytest_sessionstart(session):
+    """
+    In a plain run, starts warm-up so the first sessions launch while
+    collection is still running. xdist workers start it from the driver
+    fixture, once the scheduler has handed them a driver test.
+    """
+    if not hasattr(session.config, "workerinput"):
+        ConfigManager.load()
+        _start_warmup(session.config)
+
+
+def pytest_collection_finish(session):
+    """Caps a plain run's warm-up at its driver tests."""
+    config = session.config
+    if hasattr(config, "workerinput") or _warmup_platform(config) is None:
+        return
+
+    from core.driver_warmup import DriverWarmup
+    driver_tests = sum(1 for item in session.items if "driver" in item.fixturenames)
+    if config.getoption("--session-pool"):
+        driver_tests = min(driver_tests, 1)
+    DriverWarmup.limit(_session_key(config.getoption("--platform"), config.getoption("--browser")), driver_tests)
+
+
+# =========================================================
+# DRIVER FIXTURE
+# =========================================================
+def _create_driver(platform, config, browser=None, resource=None):
+    """Instantiates the platform driver manager and starts its session."""
     if platform == "web":
         from core.web_driver import WebDriverManager
-        drv = WebDriverManager().get_driver()
+        return WebDriverManager(
+            browser=browser or config.getoption("--browser"),
+            profile=config.getoption("--launch-profile")
+        ).get_driver()
 
     elif platform == "mobile":
         from core.mobile_driver import MobileDriverManager
-        drv = MobileDriverManager().get_driver()
+        return MobileDriverManager(resource).get_driver()
 
     elif platform == "desktop":
         from core.desktop_driver import DesktopDriverManager
-        drv = DesktopDriverManager().get_driver()
+        return DesktopDriverManager().get_driver()
 
     else:
         raise ValueError(f"Unknown platform: {platform}")
 
+
+@pytest.fixture(scope="function")
+def driver(request, matrix_target, resource):
+    """
+    Creates and yields a platform driver based on CLI arguments.
+
+    Behavior:
+        - Instantiates WebDriverManager / MobileDriverManager /
+          DesktopDriverManager.
+        - Applies SingletonDriver internally.
+        - Ensures proper teardown.
+        - With --session-pool, borrows a warm session from SessionPool
+          and resets it on release instead of quitting.
+        - With --matrix, the platform and browser come from the test's
+          matrix target.
+        - Device-bound platforms run on the resource leased for this
+          worker (resources in config.yaml).
+        - Takes a session pre-spawned by DriverWarmup when one is ready;
+          an xdist worker starts warm-up with its first driver test.
+    """
+    from core.driver_warmup import DriverWarmup
+    platform, browser = _target(request, matrix_target)
+    key = _session_key(platform, browser)
+    if hasattr(request.config, "workerinput") and not DriverWarmup.started(key):
+        _start_warmup(request.config)
+
+    def create():
+        return DriverWarmup.take(key) or _create_driver(platform, request.config, browser, resource)
+
+    if request.config.getoption("--session-pool"):
+        from core.session_pool import SessionPool
+        session = SessionPool.acquire(platform, create, key=key)
+
+        yield session.manager
+
+        SessionPool.release(session, request.config.getoption("--session-max-uses"))
+        return
+
+    drv = create()
+
     yield drv
 
     # Teardown (ensures browser/app is closed)
@@ -79,12 +564,12 @@ def driver(request):
 # HP APP FIXTURE (PLATFORM AGNOSTIC APP CONTROLLER)
 # =========================================================
 @pytest.fixture(scope="function")
-def hpApp(request, driver):
+def hpApp(request, driver, matrix_target):
     """
     Returns the appropriate HPApp implementation
-    based on platform CLI option.
+    based on platform CLI option (or the matrix target).
     """
-    platform = request.config.getoption("--platform")
+    platform, _ = _target(request, matrix_target)
 
     if platform == "web":
         from apps.hp_web_app import HPAppWeb
@@ -1,14 +1,248 @@
+"""
+api_client.py
+
+HTTP client for seeding and tearing down test data.
+
+APIClient wraps one requests.Session with:
+
+    - a sized keep-alive connection pool (api.pool_connections /
+      api.pool_maxsize), so concurrent calls reuse connections instead of
+      queueing on one
+    - default (connect, read) timeouts on every call
+    - retry with exponential backoff for idempotent methods on connection
+      errors and retryable statuses (429 / 5xx), honouring Retry-After
+    - bulk(): many requests at once on a thread pool sized to the
+      connection pool, results in call order
+    - per-endpoint latency metrics (APIMetrics); ids in paths are folded
+      so /users/42 and /users/43 count as /users/{id}
+
+Settings come from the ``api`` section of config.yaml; keyword arguments
+override them per client.
+
+Example:
+    with APIClient(base_url, token) as api:
+        users = api.bulk([("POST", "/users", {"json": user}) for user in seed])
+        print(api.metrics.report())
+"""
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+from core.profiler import StepProfiler
+
+logger = get_logger(__name__)
+
+DEFAULTS = {
+    "pool_connections": 10,
+    "pool_maxsize": 32,
+    "connect_timeout": 5,
+    "read_timeout": 30,
+    "retries": 3,
+    "backoff_factor": 0.3,
+    "retry_statuses": [429, 500, 502, 503, 504],
+    "retry_methods": ["GET", "HEAD", "OPTIONS", "PUT", "DELETE"],
+    "max_workers": None,
+}
+
+_ID_SEGMENT = re.compile(
+    r"/(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{24,})(?=/|$)"
+)
+
+
+class APIMetrics:
+    """Latency per (method, endpoint) for one client (thread-safe).
+
+    Methods:
+        record(method, endpoint, seconds, status): Add one call.
+        summary(): {"GET /users/{id}": {count, errors, mean_ms, p50_ms,
+            p95_ms, max_ms}, ...}
+        report(): summary() as aligned text, slowest total first.
+    """
+
+    def __init__(self):
+        self._samples = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_key(method, endpoint):
+        path = endpoint.split("?", 1)[0]
+        return f"{method.upper()} {_ID_SEGMENT.sub('/{id}', path)}"
+
+    def record(self, method, endpoint, seconds, status=None):
+        key = self.endpoint_key(method, endpoint)
+        with self._lock:
+            self._samples.setdefault(key, []).append(seconds)
+            if status is None or status >= 400:
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def summary(self):
+        with self._lock:
+            samples = {key: sorted(values) for key, values in self._samples.items()}
+            errors = dict(self._errors)
+
+        def percentile(values, fraction):
+            return values[min(len(values) - 1, int(fraction * len(values)))]
+
+        return {
+            key: {
+                "count": len(values),
+                "errors": errors.get(key, 0),
+                "total_ms": round(sum(values) * 1000, 1),
+                "mean_ms": round(sum(values) / len(values) * 1000, 1),
+                "p50_ms": round(percentile(values, 0.50) * 1000, 1),
+                "p95_ms": round(percentile(values, 0.95) * 1000, 1),
+                "max_ms": round(values[-1] * 1000, 1),
+            }
+            for key, values in samples.items()
+        }
+
+    def report(self):
+        summary = sorted(self.summary().items(), key=lambda kv: -kv[1]["total_ms"])
+        lines = [f"{'endpoint':<40} {'count':>6} {'errors':>6} {'mean':>9} {'p50':>9} {'p95':>9} {'max':>9}"]
+        for key, stats in summary:
+            lines.append(
+                f"{key:<40} {stats['count']:>6} {stats['errors']:>6} {stats['mean_ms']:>7.1f}ms "
+                f"{stats['p50_ms']:>7.1f}ms {stats['p95_ms']:>7.1f}ms {stats['max_ms']:>7.1f}ms"
+            )
+        return "\n".join(lines)
+
 
 class APIClient:
-    def __init__(self, base_url, token=None):
+    """Pooled, retrying requests.Session bound to one base URL.
+
+    Args:
+        base_url (str): Prefix for every endpoint.
+        token (str): Bearer token sent with every request.
+        **settings: Overrides for the ``api`` section of config.yaml
+            (pool_maxsize, read_timeout, retries, max_workers, ...).
+
+    Attributes:
+        session: The underlying requests.Session.
+        metrics (APIMetrics): Per-endpoint latency of this client's calls.
+
+    Methods:
+        request(method, endpoint, **kwargs): Any method; timeout defaults
+            to (connect_timeout, read_timeout).
+        get / post / put / patch / delete: Shorthands for request().
+        bulk(calls, max_workers, raise_on_error): Run many calls concurrently.
+        close(): Close pooled connections.
+    """
+
+    def __init__(self, base_url, token=None, **settings):
         self.base_url = base_url
+        self.settings = {
+            key: settings.get(key, self._setting(key, default)) for key, default in DEFAULTS.items()
+        }
+        self.timeout = (self.settings["connect_timeout"], self.settings["read_timeout"])
+        self.metrics = APIMetrics()
+
         self.session = requests.Session()
         if token:
             self.session.headers.update({'Authorization': f'Bearer {token}'})
 
-    def post(self, endpoint, payload, **kwargs):
-        return self.session.post(self.base_url + endpoint, json=payload, **kwargs)
+        adapter = HTTPAdapter(
+            pool_connections=self.settings["pool_connections"],
+            pool_maxsize=self.settings["pool_maxsize"],
+            max_retries=Retry(
+                total=self.settings["retries"],
+                backoff_factor=self.settings["backoff_factor"],
+                status_forcelist=self.settings["retry_statuses"],
+                allowed_methods=frozenset(m.upper() for m in self.settings["retry_methods"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @staticmethod
+    def _setting(key, default):
+        value = ConfigManager.get("api", key)
+        return default if value is None else value
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # REQUESTS
+    # ------------------------------------------------------------------
+    def request(self, method, endpoint, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        status = None
+        start = time.perf_counter()
+        try:
+            with StepProfiler.span("api", APIMetrics.endpoint_key(method, endpoint)):
+                response = self.session.request(method, self.base_url + endpoint, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.record(method, endpoint, elapsed, status)
+            logger.debug(f"{method.upper()} {endpoint} → {status or 'error'} in {elapsed * 1000:.0f}ms")
 
     def get(self, endpoint, **kwargs):
-        return self.session.get(self.base_url + endpoint, **kwargs)
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, payload=None, **kwargs):
+        return self.request("POST", endpoint, json=payload, **kwargs)
+
+    def put(self, endpoint, payload=None, **kwargs):
+        return self.request("PUT", endpoint, json=payload, **kwargs)
+
+    def patch(self, endpoint, payload=None, **kwargs):
+        return self.request("PATCH", endpoint, json=payload, **kwargs)
+
+    def delete(self, endpoint, **kwargs):
+        return self.request("DELETE", endpoint, **kwargs)
+
+    # ------------------------------------------------------------------
+    # BULK
+    # ------------------------------------------------------------------
+    def bulk(self, calls, max_workers=None, raise_on_error=False):
+        """
+        Run many requests concurrently over the pooled connections.
+
+        calls: (method, endpoint) or (method, endpoint, kwargs) tuples.
+        Returns responses in call order. A call that raised yields its
+        exception in place of a response, unless raise_on_error is set
+        (the first error is raised once every call has finished).
+        """
+        calls = [call if len(call) == 3 else (*call, {}) for call in calls]
+        if not calls:
+            return []
+        workers = max_workers or self.settings["max_workers"] or self.settings["pool_maxsize"]
+        workers = min(workers, len(calls))
+
+        def run(call):
+            method, endpoint, kwargs = call
+            try:
+                return self.request(method, endpoint, **kwargs)
+            except Exception as e:
+                return e
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-bulk") as executor:
+            results = list(executor.map(run, calls))
+        failures = [result for result in results if isinstance(result, Exception)]
+        logger.info(
+            f"Bulk: {len(calls)} request(s) on {workers} thread(s) in "
+            f"{time.perf_counter() - start:.2f}s, {len(failures)} failed"
+        )
+
+        if raise_on_error and failures:
+            raise failures[0]
+        return results
+
+    def close(self):
+        self.session.close()
@@ -1,6 +1,131 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
-class BaseDriver(ABC):
+from core.profiler import StepProfiler
+
+# Exception class names meaning "the element handle went away, look it up again"
+STALE_EXCEPTIONS = (
+    "StaleElementReferenceException",   # Selenium / Appium
+    "ElementNotAvailable",              # pywinauto
+    "ElementNotFoundError",             # pywinauto
+)
+
+
+class ResolvedElementCache:
+    """Step-scoped cache of located elements, shared by all platform drivers.
+
+    Inside ``step_scope()`` the element found by ``wait_for_element`` is
+    remembered and reused by the following find/click/send_keys on the
+    same locator, instead of being looked up again. If a cached handle
+    turns stale, the element is re-resolved once and the action (act) or
+    read (read) retried.
+
+    Outside a step scope nothing is cached and every call locates afresh.
+
+    Drivers exposing a ``page_cache`` (PageElementCache) can additionally
+    keep elements across steps: ``step_scope(page_cache=True)`` consults it
+    before locating and feeds it whatever gets located. Every step starts
+    by re-checking the page token, so a page that changed between steps
+    (a timer, a redirect) never serves elements from before the change.
+    The token moves on removed nodes and on style/class/hidden/disabled
+    changes, so an element hidden or disabled since it was cached is
+    located afresh as well.
+
+    Methods:
+        step_scope(page_cache): Context manager bounding the cache lifetime.
+        remember(key, element): Cache an element for the current step.
+        cached(key): Cached element or None, without locating.
+        resolved(key, locate): Cached element or locate() (then cached).
+        act(key, locate, action): Run action(element) with stale recovery.
+        read(key, locate, getter): getter(element) with stale recovery, for
+            reads that leave the page as it is.
+    """
+
+    @contextmanager
+    def step_scope(self, page_cache=False):
+        previous = getattr(self, "_resolved", None), getattr(self, "_use_page_cache", False)
+        self._resolved = {}
+        self._use_page_cache = page_cache
+        active = self._active_page_cache()
+        if active is not None:
+            active.mark_dirty()
+        try:
+            yield
+        finally:
+            self._resolved, self._use_page_cache = previous
+
+    def _active_page_cache(self):
+        if getattr(self, "_use_page_cache", False):
+            return getattr(self, "page_cache", None)
+        return None
+
+    def remember(self, key, element):
+        cache = getattr(self, "_resolved", None)
+        if cache is not None and element is not None:
+            cache[key] = element
+            page_cache = self._active_page_cache()
+            if page_cache is not None:
+                page_cache.put(key, element)
+        return element
+
+    def forget(self, key):
+        cache = getattr(self, "_resolved", None)
+        if cache is not None:
+            cache.pop(key, None)
+        page_cache = self._active_page_cache()
+        if page_cache is not None:
+            page_cache.evict(key)
+
+    def cached(self, key):
+        cache = getattr(self, "_resolved", None)
+        if cache is None:
+            return None
+        if key in cache:
+            return cache[key]
+        page_cache = self._active_page_cache()
+        if page_cache is not None:
+            element = page_cache.get(key)
+            if element is not None:
+                cache[key] = element
+                return element
+        return None
+
+    def resolved(self, key, locate):
+        element = self.cached(key)
+        if element is not None:
+            return element
+        with StepProfiler.span("find"):
+            return self.remember(key, locate())
+
+    def act(self, key, locate, action):
+        try:
+            return self._with_element(key, locate, action)
+        finally:
+            # Clicks and typing may change the page; re-check before the next hit
+            page_cache = self._active_page_cache()
+            if page_cache is not None:
+                page_cache.mark_dirty()
+
+    def read(self, key, locate, getter):
+        return self._with_element(key, locate, getter)
+
+    def _with_element(self, key, locate, func):
+        element = self.resolved(key, locate)
+        try:
+            with StepProfiler.span("action"):
+                return func(element)
+        except Exception as e:
+            if type(e).__name__ not in STALE_EXCEPTIONS:
+                raise
+            # Cached handle went away: drop it everywhere and look it up again
+            self.forget(key)
+            with StepProfiler.span("find"):
+                element = self.remember(key, locate())
+            with StepProfiler.span("action"):
+                return func(element)
+
+
+class BaseDriver(ResolvedElementCache, ABC):
     """Abstract base class for all platform drivers.
 
     This class defines the common driver interface that all concrete
@@ -17,8 +142,12 @@ class BaseDriver(ABC):
         find_element(locator_type, locator_value): Locate element.
         click(locator_type, locator_value): Click on element.
         send_keys(locator_type, locator_value, text): Type text.
-        wait_for_element(locator_type, locator_value, timeout): Explicit wait.
+        wait_for_element(locator_type, locator_value, timeout): Explicit wait;
+            returns the located element.
         quit(): Terminate driver session.
+
+    Located elements are cached for the duration of a step (see
+    ResolvedElementCache), so wait → click/type costs one lookup.
     """
     @abstractmethod
     def get(self, url: str):
@@ -0,0 +1,180 @@
+"""
+browser_options.py
+
+Builds Selenium browser options from named launch profiles in config.yaml.
+
+A launch profile is a set of switches under ``browser_profiles.<name>``:
+
+    headless:               true → Chrome ``--headless=new`` / Firefox ``-headless``
+    window_size:            "1920,1080"
+    page_load_strategy:     normal | eager | none
+    disable_images:         skip image downloads
+    disable_fonts:          skip web font downloads
+    disable_extensions:     no extensions / add-ons
+    user_data_dir_template: profile directory copied per session, so every
+                            browser starts from the same preloaded state
+    disk_cache_dir:         HTTP cache root, kept across sessions; every live
+                            browser gets a slot of its own
+                            (<dir>/<worker>/<slot>), since concurrent
+                            browsers (warm-up, session pool, xdist) cannot
+                            share one cache; a quit browser's slot is
+                            reused by the next session
+    arguments:              extra Chrome command-line switches
+    firefox_arguments:      extra Firefox command-line switches
+
+The active profile comes from ``--launch-profile`` or ``browser.profile``
+in config.yaml; values not set in the profile fall back to ``default``.
+"""
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+
+from selenium import webdriver
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BrowserOptionsBuilder:
+    """Translates a launch profile into Chrome / Firefox options.
+
+    Methods:
+        profile(name): Resolve a profile dict (merged over "default").
+        build(browser, profile_name): Return browser options.
+        attach_user_data_dir(options, browser, profile_name): Copy the
+            profile's user-data-dir template for one session; returns the
+            temp dir to remove once the browser has quit (or None).
+        attach_disk_cache(options, browser, profile_name): Point one session
+            at a free disk cache slot; returns the slot to give back with
+            release_disk_cache() once the browser has quit (or None).
+        release_disk_cache(slot): Make a slot available to the next session.
+    """
+    SUPPORTED_BROWSERS = ("chrome", "firefox")
+
+    _cache_slots = set()
+    _cache_lock = threading.Lock()
+
+    @staticmethod
+    def profile(name=None):
+        profiles = ConfigManager.get("browser_profiles") or {}
+        name = name or ConfigManager.get("browser", "profile") or "default"
+        if name not in profiles:
+            raise ValueError(f"Unknown launch profile: {name}")
+
+        settings = dict(profiles.get("default") or {})
+        settings.update(profiles[name] or {})
+        settings["name"] = name
+        return settings
+
+    @classmethod
+    def build(cls, browser="chrome", profile_name=None):
+        browser = (browser or "chrome").lower()
+        if browser not in cls.SUPPORTED_BROWSERS:
+            raise ValueError(f"Unsupported browser: {browser}")
+
+        settings = cls.profile(profile_name)
+        logger.info(f"Using launch profile '{settings['name']}' for {browser}")
+
+        if browser == "chrome":
+            options = cls._chrome(settings)
+        else:
+            options = cls._firefox(settings)
+
+        if settings.get("page_load_strategy"):
+            options.page_load_strategy = settings["page_load_strategy"]
+
+        return options
+
+    @classmethod
+    def attach_user_data_dir(cls, options, browser="chrome", profile_name=None):
+        # Called right before launch so only sessions actually started pay for the copy
+        template = cls.profile(profile_name).get("user_data_dir_template")
+        if not template:
+            return None
+
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        target = tempfile.mkdtemp(prefix=f"{browser}-{worker}-")
+        shutil.copytree(template, target, dirs_exist_ok=True)
+
+        if (browser or "chrome").lower() == "firefox":
+            options.add_argument("-profile")
+            options.add_argument(target)
+        else:
+            options.add_argument(f"--user-data-dir={target}")
+        return target
+
+    @classmethod
+    def attach_disk_cache(cls, options, browser="chrome", profile_name=None):
+        # Called right before launch, like attach_user_data_dir: the slot is
+        # held only while the browser is alive
+        root = cls.profile(profile_name).get("disk_cache_dir")
+        if not root:
+            return None
+
+        with cls._cache_lock:
+            slot = next(n for n in itertools.count() if n not in cls._cache_slots)
+            cls._cache_slots.add(slot)
+
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        cache_dir = os.path.join(os.path.abspath(root), worker, str(slot))
+        os.makedirs(cache_dir, exist_ok=True)
+
+        if (browser or "chrome").lower() == "firefox":
+            options.set_preference("browser.cache.disk.parent_directory", cache_dir)
+        else:
+            options.add_argument(f"--disk-cache-dir={cache_dir}")
+        return slot
+
+    @classmethod
+    def release_disk_cache(cls, slot):
+        with cls._cache_lock:
+            cls._cache_slots.discard(slot)
+
+    @staticmethod
+    def _chrome(settings):
+        options = webdriver.ChromeOptions()
+
+        if settings.get("headless"):
+            options.add_argument("--headless=new")
+        if settings.get("window_size"):
+            options.add_argument(f"--window-size={settings['window_size']}")
+        if settings.get("disable_images"):
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        if settings.get("disable_fonts"):
+            options.add_argument("--disable-remote-fonts")
+        if settings.get("disable_extensions"):
+            options.add_argument("--disable-extensions")
+
+        for argument in settings.get("arguments") or []:
+            options.add_argument(argument)
+
+        return options
+
+    @staticmethod
+    def _firefox(settings):
+        options = webdriver.FirefoxOptions()
+
+        if settings.get("headless"):
+            options.add_argument("-headless")
+        if settings.get("window_size"):
+            width, height = str(settings["window_size"]).split(",")
+            options.add_argument(f"--width={width.strip()}")
+            options.add_argument(f"--height={height.strip()}")
+        if settings.get("disable_images"):
+            options.set_preference("permissions.default.image", 2)
+        if settings.get("disable_fonts"):
+            options.set_preference("gfx.downloadable_fonts.enabled", False)
+        if settings.get("disable_extensions"):
+            options.set_preference("extensions.enabledScopes", 0)
+
+        for argument in settings.get("firefox_arguments") or []:
+            options.add_argument(argument)
+
+        return options
@@ -0,0 +1,291 @@
+"""
+command_tracer.py
+
+Opt-in tracing of WebDriver / Appium HTTP commands.
+
+CommandTracer.install(driver) wraps ``driver.command_executor.execute`` so
+every command the session sends is recorded with its name, latency and
+payload size under the running test. At teardown conftest turns the
+records into a per-test report:
+
+    - count and total latency per command
+    - latency histogram (all commands)
+    - top-N slowest commands
+    - redundant round trips:
+        find-after-wait  a findElement for a locator an in-page wait
+                         (executeAsyncScript) just returned
+        repeated find    the same findElement twice with nothing that may
+                         have changed the page (click, typing, navigation,
+                         any script but the framework's own read-only
+                         ones) in between
+
+Enable with ``tracing.enabled: true`` in config.yaml or ``--trace-commands``.
+"""
+import heapq
+import json
+import os
+import threading
+import time
+
+from core.configManager import ConfigManager
+from core.dom_scripts import RESOLVE_ELEMENTS_JS, SNAPSHOT_TOKEN_JS
+from core.logger import get_logger
+from core.page_element_cache import PAGE_TOKEN_JS
+
+logger = get_logger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open
+HISTOGRAM_MS = (10, 25, 50, 100, 250, 500, 1000, 2500)
+
+FIND_COMMANDS = ("findElement", "findElements")
+
+# Commands that cannot change the page; anything else invalidates earlier finds
+READ_ONLY_COMMANDS = FIND_COMMANDS + (
+    "findChildElement", "findChildElements", "getElementText", "getElementAttribute",
+    "getElementProperty", "getElementTagName", "getElementRect", "isElementDisplayed",
+    "isElementEnabled", "isElementSelected", "getElementValueOfCssProperty",
+    "getCurrentUrl", "getTitle", "getPageSource", "screenshot", "elementScreenshot",
+    "getWindowHandles", "w3cGetWindowHandles", "getCurrentWindowHandle",
+    "w3cGetCurrentWindowHandle", "getWindowRect", "getAllCookies", "getCookie", "status",
+)
+
+# Scripts may change the page, except the framework's own lookups
+SCRIPT_COMMANDS = ("executeScript", "w3cExecuteScript")
+READ_ONLY_SCRIPTS = frozenset((RESOLVE_ELEMENTS_JS, PAGE_TOKEN_JS, SNAPSHOT_TOKEN_JS))
+
+ASYNC_SCRIPT_COMMANDS = ("executeAsyncScript", "w3cExecuteScriptAsync")
+
+
+def w3c_locator(by, value):
+    """Locator as Selenium sends it over the wire (id/name/class → CSS)."""
+    by = by.lower().replace("_", " ")
+    if by == "id":
+        return "css selector", f'[id="{value}"]'
+    if by == "name":
+        return "css selector", f'[name="{value}"]'
+    if by == "class name":
+        return "css selector", f".{value}"
+    if by == "tag name":
+        return "css selector", value
+    return by, value
+
+
+class CommandTrace:
+    """Commands recorded for one test."""
+
+    def __init__(self, test_id):
+        self.test_id = test_id
+        self.commands = {}
+        self.histogram = [0] * (len(HISTOGRAM_MS) + 1)
+        self.slowest = []
+        self.redundant = {}
+        self.count = 0
+        self.total = 0.0
+        self._located = {}
+        self._order = 0
+
+    def record(self, command, params, duration, payload_size, response):
+        self.count += 1
+        self.total += duration
+        stats = self.commands.setdefault(command, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "bytes": 0})
+        ms = duration * 1000
+        stats["count"] += 1
+        stats["total_ms"] += ms
+        stats["max_ms"] = max(stats["max_ms"], ms)
+        stats["bytes"] += payload_size
+
+        bucket = next((i for i, bound in enumerate(HISTOGRAM_MS) if ms < bound), len(HISTOGRAM_MS))
+        self.histogram[bucket] += 1
+
+        self._order += 1
+        entry = (ms, -self._order, command, self._describe(command, params))
+        if len(self.slowest) < CommandTracer.top_n():
+            heapq.heappush(self.slowest, entry)
+        else:
+            heapq.heappushpop(self.slowest, entry)
+
+        self._track_redundancy(command, params, response)
+
+    @staticmethod
+    def _describe(command, params):
+        if not isinstance(params, dict):
+            return None
+        if "using" in params:
+            return f"{params['using']}={params.get('value')}"
+        if "url" in params:
+            return params["url"]
+        return None
+
+    def _flag(self, kind, locator):
+        key = f"{kind}: {locator[0]}={locator[1]}"
+        self.redundant[key] = self.redundant.get(key, 0) + 1
+
+    def _track_redundancy(self, command, params, response):
+        if command in FIND_COMMANDS and isinstance(params, dict):
+            locator = (params.get("using"), params.get("value"))
+            source = self._located.get(locator)
+            if source is not None:
+                self._flag("find-after-wait" if source == "wait" else "repeated find", locator)
+            if _found(response):
+                self._located[locator] = "find"
+            return
+
+        if command in ASYNC_SCRIPT_COMMANDS and isinstance(params, dict):
+            # EventWaitEngine: args = [[[by, value, condition, text], ...], mode, timeout_ms]
+            args = params.get("args") or []
+            specs = args[0] if args and isinstance(args[0], list) else []
+            for spec in _located_specs(specs, response):
+                if isinstance(spec, list) and len(spec) >= 2 and spec[2:3] != ["absent"]:
+                    self._located[w3c_locator(spec[0], spec[1])] = "wait"
+            return
+
+        if command in SCRIPT_COMMANDS and isinstance(params, dict) \
+                and params.get("script") in READ_ONLY_SCRIPTS:
+            return
+        if command not in READ_ONLY_COMMANDS:
+            self._located.clear()
+
+    def report(self):
+        return {
+            "test": self.test_id,
+            "commands": self.count,
+            "total_ms": round(self.total * 1000, 1),
+            "by_command": {
+                name: {key: round(value, 1) if isinstance(value, float) else value
+                       for key, value in stats.items()}
+                for name, stats in sorted(self.commands.items(), key=lambda kv: -kv[1]["total_ms"])
+            },
+            "histogram_ms": {
+                (f"<{bound}" if i < len(HISTOGRAM_MS) else f">={HISTOGRAM_MS[-1]}"): self.histogram[i]
+                for i, bound in enumerate(HISTOGRAM_MS + (None,))
+            },
+            "slowest": [
+                {"command": command, "ms": round(ms, 1), "target": target}
+                for ms, _, command, target in sorted(self.slowest, reverse=True)
+            ],
+            "redundant": dict(sorted(self.redundant.items(), key=lambda kv: -kv[1])),
+        }
+
+
+def _found(response):
+    """Whether a find response located something.
+
+    RemoteConnection.execute returns a dict for errors too, e.g.
+    ``{"status": 404, "value": {"error": "no such element", ...}}`` for a
+    failed poll, and an empty list when findElements matched nothing.
+    """
+    if not isinstance(response, dict) or response.get("status") not in (None, 0, 200):
+        return False
+    value = response.get("value")
+    if isinstance(value, dict) and "error" in value:
+        return False
+    return bool(value)
+
+
+def _located_specs(specs, response):
+    """Wait specs whose element the in-page wait handed back."""
+    value = response.get("value") if isinstance(response, dict) else None
+    if not isinstance(value, dict):
+        return []
+    if "elements" in value:
+        return specs
+    index = value.get("index")
+    if isinstance(index, int) and 0 <= index < len(specs):
+        return [specs[index]]
+    return []
+
+
+class CommandTracer:
+    """Installs the tracing wrapper and collects traces per running test.
+
+    Methods:
+        enabled(): tracing.enabled in config.yaml (or --trace-commands).
+        install(driver): Wrap the session's command executor (idempotent).
+        pop(test_id): Remove and return the test's report dict (or None).
+        summary(report): Compact text for the Allure attachment.
+    """
+    _traces = {}
+    _lock = threading.Lock()
+    _forced = False
+
+    @classmethod
+    def enabled(cls):
+        return cls._forced or bool(ConfigManager.get("tracing", "enabled"))
+
+    @classmethod
+    def enable(cls):
+        cls._forced = True
+
+    @staticmethod
+    def top_n():
+        return ConfigManager.get("tracing", "top_n") or 10
+
+    @staticmethod
+    def _current_test():
+        current = os.environ.get("PYTEST_CURRENT_TEST")
+        return current.rsplit(" ", 1)[0] if current else None
+
+    @classmethod
+    def install(cls, driver):
+        executor = getattr(driver, "command_executor", None)
+        if executor is None or getattr(executor, "_agentra_traced", False):
+            return
+        execute = executor.execute
+
+        def traced(command, params):
+            start = time.perf_counter()
+            response = None
+            try:
+                response = execute(command, params)
+                return response
+            finally:
+                duration = time.perf_counter() - start
+                cls._record(command, params, duration, response)
+
+        executor.execute = traced
+        executor._agentra_traced = True
+        logger.info("WebDriver command tracing enabled for this session")
+
+    @classmethod
+    def _record(cls, command, params, duration, response):
+        test_id = cls._current_test()
+        if test_id is None:
+            return
+        try:
+            payload_size = len(json.dumps(params, default=str)) if params else 0
+        except Exception:
+            payload_size = 0
+        with cls._lock:
+            trace = cls._traces.get(test_id)
+            if trace is None:
+                trace = cls._traces[test_id] = CommandTrace(test_id)
+            trace.record(command, params, duration, payload_size, response)
+
+    @classmethod
+    def pop(cls, test_id):
+        with cls._lock:
+            trace = cls._traces.pop(test_id, None)
+        return trace.report() if trace is not None else None
+
+    @staticmethod
+    def summary(report):
+        lines = [f"{report['commands']} WebDriver commands, {report['total_ms']:.0f} ms total", ""]
+        lines.append("By command (count / total ms / max ms):")
+        for name, stats in report["by_command"].items():
+            lines.append(f"  {name:<32} {stats['count']:>5} {stats['total_ms']:>10.1f} {stats['max_ms']:>8.1f}")
+        lines.append("")
+        lines.append("Latency histogram:")
+        peak = max(report["histogram_ms"].values()) or 1
+        for bucket, count in report["histogram_ms"].items():
+            lines.append(f"  {bucket:>7} ms {'█' * round(20 * count / peak):<20} {count}")
+        lines.append("")
+        lines.append("Slowest:")
+        for entry in report["slowest"]:
+            target = f" ({entry['target']})" if entry["target"] else ""
+            lines.append(f"  {entry['ms']:>8.1f} ms  {entry['command']}{target}")
+        if report["redundant"]:
+            lines.append("")
+            lines.append("Redundant round trips:")
+            for key, count in report["redundant"].items():
+                lines.append(f"  {count:>3} x {key}")
+        return "\n".join(lines)
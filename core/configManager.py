@@ -22,6 +22,10 @@ class ConfigManager:
     def get_url(cls, key):
         return cls._config["urls"].get(key)
 
+    @classmethod
+    def set_url(cls, key, url):
+        cls._config["urls"][key] = url
+
     @classmethod
     def get_credential(cls, key):
         return cls._config["credentials"].get(key)
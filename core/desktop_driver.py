@@ -4,8 +4,9 @@ import time
 import subprocess
 from pywinauto import Application, Desktop
 from pywinauto.findwindows import ElementNotFoundError
+from core.base_driver import ResolvedElementCache
 
-class DesktopDriverManager:
+class DesktopDriverManager(ResolvedElementCache):
     
     def __init__(self):
         self.app = None
@@ -45,18 +46,26 @@ class DesktopDriverManager:
         """Return the driver manager itself."""
         return self
     
+    @staticmethod
+    def _key(locator_dict):
+        return str(sorted(locator_dict.items()))
+
     def wait_for_element(self, locator_dict, timeout=20):
         el = self.main_window.child_window(**locator_dict)
         el.wait("exists ready", timeout=timeout)
-        return el
+        # Resolve the spec once; the wrapper is reused for the rest of the step
+        return self.remember(self._key(locator_dict), el.wrapper_object())
 
     def find_element(self, locator_dict):
         return self.main_window.child_window(**locator_dict)
 
     def click(self, locator_dict):
-        el = self.find_element(locator_dict)
-        el.wait("ready", timeout=10)
-        el.click_input()
+        def locate():
+            el = self.find_element(locator_dict)
+            el.wait("ready", timeout=10)
+            return el.wrapper_object()
+
+        self.act(self._key(locator_dict), locate, lambda el: el.click_input())
 
     def quit(self):
         if self.main_window:
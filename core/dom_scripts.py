@@ -0,0 +1,148 @@
+"""
+dom_scripts.py
+
+In-page JavaScript shared by the web driver layer.
+
+All scripts take Selenium locator strategies ("id", "xpath",
+"css selector", ...) and resolve them with native DOM APIs, so a locator
+means the same thing in a script as it does in find_element.
+"""
+
+# resolve(by, value) → first matching element or null; throws on unknown
+# strategies and invalid selectors so callers can fall back to WebDriver.
+RESOLVE_FN = """
+function first(list) { return list && list.length ? list[0] : null; }
+function resolve(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'name': return first(document.getElementsByName(value));
+        case 'css selector': return document.querySelector(value);
+        case 'class name': return first(document.getElementsByClassName(value));
+        case 'tag name': return first(document.getElementsByTagName(value));
+        case 'xpath':
+            return document.evaluate(value, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'link text':
+            return Array.from(document.links).find(a => a.textContent.trim() === value) || null;
+        case 'partial link text':
+            return Array.from(document.links).find(a => a.textContent.includes(value)) || null;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+"""
+
+# Resolves a list of [strategy, value] pairs in one round trip.
+# Missing elements come back as null; unknown strategies too.
+RESOLVE_ELEMENTS_JS = RESOLVE_FN + """
+return arguments[0].map(function (loc) {
+    try { return resolve(loc[0], loc[1]); } catch (e) { return null; }
+});
+"""
+
+# execute_async_script(WAIT_FOR_CONDITIONS_JS, specs, mode, timeout_ms)
+#
+# specs is a list of [by, value, condition, text]; condition is one of:
+#     present   - element is in the DOM
+#     visible   - element is rendered with a non-empty box
+#     clickable - visible and not disabled
+#     text      - element text contains ``text``
+#     absent    - element missing or not visible (yields true)
+#
+# mode "any" resolves {index, element} for the first spec that holds (specs
+# are checked in order, so on a tie the earlier one wins); mode "all"
+# resolves {elements: [...]} once every spec holds at the same time.
+#
+# Re-checks are driven by a MutationObserver (coalesced per animation frame)
+# plus a slow interval for changes that produce no mutations (CSS
+# transitions, layout). Resolves {timeout: true} when timeout_ms elapses and
+# {error: message} if a locator cannot be evaluated in-page.
+WAIT_FOR_CONDITIONS_JS = RESOLVE_FN + """
+var specs = arguments[0], mode = arguments[1], timeoutMs = arguments[2],
+    done = arguments[arguments.length - 1];
+
+function isVisible(el) {
+    if (!el || !el.isConnected) return false;
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none') return false;
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+
+function holds(spec) {
+    var el = resolve(spec[0], spec[1]);
+    switch (spec[2]) {
+        case 'present': return el;
+        case 'visible': return isVisible(el) ? el : null;
+        case 'clickable': return isVisible(el) && !el.disabled ? el : null;
+        case 'text': return el && (el.textContent || '').indexOf(spec[3]) !== -1 ? el : null;
+        case 'absent': return isVisible(el) ? null : true;
+    }
+    throw new Error('Unsupported wait condition: ' + spec[2]);
+}
+
+function check() {
+    if (mode === 'all') {
+        var elements = [];
+        for (var i = 0; i < specs.length; i++) {
+            var result = holds(specs[i]);
+            if (!result) return null;
+            elements.push(result);
+        }
+        return {elements: elements};
+    }
+    for (var j = 0; j < specs.length; j++) {
+        var found = holds(specs[j]);
+        if (found) return {index: j, element: found};
+    }
+    return null;
+}
+
+var finished = false, observer = null, interval = null, timer = null, frame = null;
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    if (interval) clearInterval(interval);
+    if (timer) clearTimeout(timer);
+    if (frame) cancelAnimationFrame(frame);
+    done(result);
+}
+
+function evaluate() {
+    frame = null;
+    try {
+        var result = check();
+        if (result) finish(result);
+    } catch (e) {
+        finish({error: String(e && e.message || e)});
+    }
+}
+
+evaluate();
+if (!finished) {
+    observer = new MutationObserver(function () {
+        if (!frame) frame = requestAnimationFrame(evaluate);
+    });
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    interval = setInterval(evaluate, 100);
+    timer = setTimeout(function () { finish({timeout: true}); }, timeoutMs);
+}
+"""
+
+
+# Returns [document id, snapshot version, URL]. The observer (installed on
+# first use) bumps the version on every structural change and on changes to
+# the attributes self-healing matches on, so an unchanged token means a
+# parsed DomSnapshot of this document is still accurate.
+SNAPSHOT_TOKEN_JS = """
+if (window.__agentraSnapshotVersion === undefined) {
+    window.__agentraSnapshotVersion = 0;
+    window.__agentraSnapshotId = Math.random().toString(36).slice(2);
+    new MutationObserver(function () { window.__agentraSnapshotVersion++; }).observe(document, {
+        childList: true, subtree: true,
+        attributes: true, attributeFilter: ['id', 'name', 'placeholder', 'aria-label']
+    });
+}
+return [window.__agentraSnapshotId, window.__agentraSnapshotVersion, location.href];
+"""
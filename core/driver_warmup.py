@@ -0,0 +1,168 @@
+"""
+driver_warmup.py
+
+Background pre-spawning of driver sessions.
+
+Without warm-up every test starts its browser / Appium session inside the
+``driver`` fixture, serially on the critical path (Appium alone takes
+10-20 s per device). DriverWarmup starts sessions on background threads
+and the fixture takes a ready one instead of launching its own:
+
+    - a plain run starts ``warmup.ahead`` sessions at session start, so
+      they launch while collection is still running; once collection is
+      done the spawn budget is capped at the run's driver tests (1 with
+      --session-pool, since one session is reused) and extra queued
+      sessions are quit
+    - an xdist worker does not know which tests the scheduler will hand
+      it, so it starts spawning only when it receives its first driver
+      test, without a cap
+    - every take() refills the queue to ``warmup.ahead``, so while a test
+      runs the sessions for the next tests are already starting
+
+Sessions are created under a SingletonDriver owner token, so they are not
+tied to the id of the thread that built them. Sessions left unclaimed at
+session end are quit.
+"""
+import itertools
+import threading
+from collections import deque
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+from core.singleton_driver import SingletonDriver
+
+logger = get_logger(__name__)
+
+
+class _Spawn:
+    """One session being created on its own background thread."""
+
+    def __init__(self, key, factory, token):
+        self.key = key
+        self.manager = None
+        self.error = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(factory, token), name=f"warmup-{token}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, factory, token):
+        try:
+            with SingletonDriver.owner(token):
+                self.manager = factory()
+        except Exception as e:
+            self.error = e
+        finally:
+            self._done.set()
+
+    def result(self, timeout=None):
+        self._done.wait(timeout)
+        return self.manager
+
+
+class DriverWarmup:
+    """Per-worker queue of pre-spawned driver managers.
+
+    Methods:
+        enabled(): warmup.enabled in config.yaml.
+        start(key, factory, total): Begin spawning ``warmup.ahead`` sessions,
+            at most ``total`` over the run (None = no cap).
+        started(key): Whether warm-up runs for ``key``.
+        limit(key, total): Cap the sessions spawned for ``key`` this run;
+            queued sessions over the cap are quit.
+        take(key): A ready manager (waits for one in flight) or None.
+        shutdown(): Quit sessions nobody claimed.
+    """
+    _queues = {}
+    _factories = {}
+    _started = {}
+    _allowed = {}
+    _tokens = itertools.count(1)
+    _lock = threading.Lock()
+
+    @staticmethod
+    def enabled():
+        return bool(ConfigManager.get("warmup", "enabled"))
+
+    @staticmethod
+    def ahead():
+        return ConfigManager.get("warmup", "ahead") or 1
+
+    @classmethod
+    def start(cls, key, factory, total=None):
+        with cls._lock:
+            cls._factories[key] = factory
+            cls._queues.setdefault(key, deque())
+            cls._started.setdefault(key, 0)
+            cls._allowed[key] = total
+        logger.info(f"Warm-up: pre-spawning {key} sessions" + (f" (at most {total})" if total is not None else ""))
+        cls._fill(key)
+
+    @classmethod
+    def started(cls, key):
+        with cls._lock:
+            return key in cls._factories
+
+    @classmethod
+    def limit(cls, key, total):
+        with cls._lock:
+            if key not in cls._factories:
+                return
+            cls._allowed[key] = total
+            queue = cls._queues[key]
+            extra = []
+            while queue and cls._started[key] > total:
+                cls._started[key] -= 1
+                extra.append(queue.pop())
+        logger.info(f"Warm-up: {key} limited to {total} session(s) this run")
+        cls._discard(extra)
+
+    @classmethod
+    def take(cls, key):
+        with cls._lock:
+            queue = cls._queues.get(key)
+            spawn = queue.popleft() if queue else None
+        if spawn is None:
+            return None
+
+        cls._fill(key)
+        manager = spawn.result()
+        if manager is None:
+            logger.warning(f"Warm-up: {key} session failed to start ({spawn.error}), launching inline")
+        return manager
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            pending = [spawn for queue in cls._queues.values() for spawn in queue]
+            cls._queues.clear()
+            cls._factories.clear()
+            cls._started.clear()
+            cls._allowed.clear()
+        cls._discard(pending)
+
+    @staticmethod
+    def _discard(spawns):
+        for spawn in spawns:
+            manager = spawn.result()
+            if manager is None:
+                continue
+            try:
+                manager.quit()
+            except Exception as e:
+                logger.warning(f"Warm-up: could not quit unused {spawn.key} session: {e}")
+        if spawns:
+            logger.info(f"Warm-up: closed {len(spawns)} unused session(s)")
+
+    @classmethod
+    def _fill(cls, key):
+        with cls._lock:
+            factory = cls._factories.get(key)
+            if factory is None:
+                return
+            queue = cls._queues[key]
+            allowed = cls._allowed[key]
+            while len(queue) < cls.ahead() and (allowed is None or cls._started[key] < allowed):
+                cls._started[key] += 1
+                queue.append(_Spawn(key, factory, f"warmup-{next(cls._tokens)}"))
@@ -0,0 +1,119 @@
+"""
+execution_matrix.py
+
+Multi-platform execution matrix for a single pytest session.
+
+Without a matrix every session runs one ``--platform``, so covering web,
+mobile and desktop takes three pytest runs back to back. With ``--matrix``
+each test that uses the ``driver`` fixture is parametrized over the matrix
+targets instead, e.g.::
+
+    pytest --matrix web:chrome,web:firefox,mobile,desktop
+    pytest --matrix all            # matrix.targets from config.yaml
+
+and the targets run side by side on the xdist workers, so the session takes
+as long as the slowest platform rather than the sum of all of them.
+
+Platforms backed by a fixed number of devices (one phone, one desktop
+host) are kept on dedicated workers. With a resource pool (``resources``
+in config.yaml) ResourcePool owns that: one ``xdist_group`` per device, and
+the worker leases that device. ``matrix.workers`` covers platforms without
+a pool: their tests are split round-robin into that many
+``matrix-<platform>-N`` groups (a prefix of its own, so they never collide
+with pool groups), and each group is kept on one worker by xdist's
+loadgroup scheduling. Platforms with neither (web by default) are spread
+over all workers.
+
+All workers write to the same ``--alluredir``, so a single Allure report
+covers the whole matrix; each result is filed under its target as the
+parent suite.
+"""
+from collections import namedtuple
+
+from core.configManager import ConfigManager
+
+PLATFORMS = ("web", "mobile", "desktop")
+
+
+class MatrixTarget(namedtuple("MatrixTarget", "platform browser")):
+    """One platform (and browser, for web) of the matrix."""
+
+    @property
+    def id(self):
+        return f"{self.platform}-{self.browser}" if self.browser else self.platform
+
+
+class ExecutionMatrix:
+    """Parses matrix targets and assigns per-platform worker groups.
+
+    Methods:
+        targets(spec): MatrixTargets from "all" or "web:chrome,mobile,...".
+        applicable(targets, markers): Targets a test may run on, given its
+            platform markers (unmarked tests run on every target).
+        worker_limit(platform): Workers reserved for a platform (None = any).
+        assign_groups(items, marker_factory): Add xdist_group markers to
+            worker-limited platforms without a resource pool.
+    """
+
+    @staticmethod
+    def targets(spec):
+        if spec == "all":
+            entries = ConfigManager.get("matrix", "targets") or list(PLATFORMS)
+        else:
+            entries = [entry.strip() for entry in spec.split(",") if entry.strip()]
+
+        targets = []
+        for entry in entries:
+            platform, _, browser = entry.lower().partition(":")
+            if platform not in PLATFORMS:
+                raise ValueError(f"Unknown matrix platform: {platform}")
+            if platform == "web":
+                browser = browser or "chrome"
+            elif browser:
+                raise ValueError(f"Only web targets take a browser: {entry}")
+            target = MatrixTarget(platform, browser or None)
+            if target not in targets:
+                targets.append(target)
+
+        if not targets:
+            raise ValueError(f"Empty execution matrix: {spec!r}")
+        return targets
+
+    @staticmethod
+    def applicable(targets, markers):
+        platforms = {name for name in markers if name in PLATFORMS}
+        if not platforms:
+            return list(targets)
+        return [target for target in targets if target.platform in platforms]
+
+    @staticmethod
+    def worker_limit(platform):
+        limit = ConfigManager.get("matrix", "workers", platform)
+        return int(limit) if limit else None
+
+    @classmethod
+    def assign_groups(cls, items, marker_factory):
+        """Marks items of worker-limited platforms with ``marker_factory(group)``.
+
+        Runs after ResourcePool.assign_groups: items it already pinned to
+        a device group are left alone, so ``matrix.workers`` only applies
+        to platforms that have no resource pool.
+
+        Args:
+            items: Collected pytest items (parametrized with matrix_target).
+            marker_factory: Builds the xdist_group marker for a group name.
+        """
+        counters = {}
+        for item in items:
+            callspec = getattr(item, "callspec", None)
+            target = callspec.params.get("matrix_target") if callspec else None
+            if target is None or item.get_closest_marker("xdist_group"):
+                continue
+
+            limit = cls.worker_limit(target.platform)
+            if not limit:
+                continue
+
+            index = counters.get(target.platform, 0)
+            counters[target.platform] = index + 1
+            item.add_marker(marker_factory(f"matrix-{target.platform}-{index % limit}"))
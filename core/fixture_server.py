@@ -0,0 +1,243 @@
+"""
+fixture_server.py
+
+Local HTTP server for recorded page snapshots (offline web runs).
+
+With ``--fixture-server`` (or ``fixture_server.enabled``) web tests hit a
+threaded HTTP server on 127.0.0.1 instead of the public site:
+
+    - resources/snapshots/ mirrors the site's paths
+      (/practice-test-login/ → practice-test-login/index.html)
+    - config ``urls`` under one of ``fixture_server.sites`` are rewritten
+      to the local server, so page objects need no changes
+    - responses can be delayed (``delay_ms`` + ``jitter_ms``, per-path
+      ``route_delays_ms``) to model a slow application deterministically
+
+The server runs once per session: the xdist controller (or a plain run)
+starts it in pytest_configure and hands its URL to every worker through
+workerinput, so hundreds of browsers share one server. Files are read
+once and kept in memory; responses use HTTP/1.1 keep-alive.
+
+Record a new snapshot from the live site:
+    python -m core.fixture_server record https://practicetestautomation.com/practice-test-login/
+Serve the snapshots standalone (e.g. for load tests):
+    python -m core.fixture_server serve --port 8000
+"""
+import argparse
+import mimetypes
+import os
+import posixpath
+import random
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "resources", "snapshots"))
+
+
+class _ThreadingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Room for bursts of connections from many parallel browsers
+    request_queue_size = 1024
+
+
+class _SnapshotHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "AgentraFixtureServer/1.0"
+
+    def do_GET(self):
+        self._respond(body=True)
+
+    def do_HEAD(self):
+        self._respond(body=False)
+
+    def _respond(self, body):
+        path = unquote(urlsplit(self.path).path)
+        delay = FixtureServer.delay(path)
+        if delay:
+            time.sleep(delay)
+
+        page = FixtureServer.page(path)
+        if page is None:
+            content, content_type, status = b"Not found", "text/plain; charset=utf-8", 404
+        else:
+            (content, content_type), status = page, 200
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if body:
+            self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class FixtureServer:
+    """The session's snapshot server and the URL rewrite that points tests at it.
+
+    Methods:
+        enabled(): fixture_server.enabled in config.yaml.
+        start(port): Start the server (free port unless configured); returns its URL.
+        use(base_url): Rewrite config urls under fixture_server.sites to base_url.
+        stop(): Shut the server down.
+        page(path): (bytes, content type) for a request path, or None.
+        delay(path): Seconds to hold the response for a request path.
+        record(url, root): Save a live page as a snapshot.
+    """
+    url = None
+    _server = None
+    _thread = None
+    _pages = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _setting(key, default):
+        value = ConfigManager.get("fixture_server", key)
+        return default if value is None else value
+
+    @classmethod
+    def enabled(cls):
+        return bool(cls._setting("enabled", False))
+
+    @classmethod
+    def root(cls):
+        root = cls._setting("root", None)
+        return os.path.abspath(root) if root else ROOT
+
+    # ------------------------------------------------------------------
+    # LIFECYCLE
+    # ------------------------------------------------------------------
+    @classmethod
+    def start(cls, port=None):
+        with cls._lock:
+            if cls._server is not None:
+                return cls.url
+            host = cls._setting("host", "127.0.0.1")
+            port = cls._setting("port", 0) if port is None else port
+            cls._server = _ThreadingServer((host, port), _SnapshotHandler)
+            cls.url = f"http://{host}:{cls._server.server_address[1]}"
+            cls._thread = threading.Thread(
+                target=cls._server.serve_forever, name="fixture-server", daemon=True
+            )
+            cls._thread.start()
+        logger.info(f"Fixture server serving {cls.root()} at {cls.url}")
+        return cls.url
+
+    @classmethod
+    def stop(cls):
+        with cls._lock:
+            server, cls._server = cls._server, None
+            cls._pages.clear()
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            logger.info("Fixture server stopped")
+
+    @classmethod
+    def use(cls, base_url):
+        """Point every configured URL on a recorded site at ``base_url``."""
+        ConfigManager.load()
+        cls.url = base_url
+        sites = [site.rstrip("/") for site in cls._setting("sites", [])]
+        for key, url in (ConfigManager.get("urls") or {}).items():
+            site = next((site for site in sites if url == site or url.startswith(site + "/")), None)
+            if site is not None:
+                ConfigManager.set_url(key, base_url + url[len(site):])
+
+    # ------------------------------------------------------------------
+    # CONTENT
+    # ------------------------------------------------------------------
+    @classmethod
+    def _file(cls, path):
+        root = cls.root()
+        relative = posixpath.normpath("/" + path).lstrip("/")
+        candidate = os.path.join(root, *relative.split("/")) if relative else root
+        if os.path.isdir(candidate):
+            candidate = os.path.join(candidate, "index.html")
+        elif not os.path.exists(candidate) and not os.path.splitext(candidate)[1]:
+            candidate = os.path.join(candidate, "index.html")
+        return candidate if os.path.isfile(candidate) else None
+
+    @classmethod
+    def page(cls, path):
+        with cls._lock:
+            if path in cls._pages:
+                return cls._pages[path]
+
+        page = None
+        file_path = cls._file(path)
+        if file_path is not None:
+            with open(file_path, "rb") as f:
+                content = f.read()
+            content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+            if content_type.startswith("text/") or content_type == "application/javascript":
+                content_type += "; charset=utf-8"
+            page = (content, content_type)
+
+        with cls._lock:
+            cls._pages[path] = page
+        return page
+
+    @classmethod
+    def delay(cls, path):
+        routes = cls._setting("route_delays_ms", {}) or {}
+        # Longest matching path prefix wins, then the global delay
+        route = max((prefix for prefix in routes if path.startswith(prefix)), key=len, default=None)
+        delay_ms = routes[route] if route is not None else cls._setting("delay_ms", 0)
+        jitter_ms = cls._setting("jitter_ms", 0)
+        return (delay_ms + (random.uniform(0, jitter_ms) if jitter_ms else 0)) / 1000
+
+    @classmethod
+    def record(cls, url, root=None):
+        """Save the page at ``url`` under the snapshot root (path preserved)."""
+        root = root or cls.root()
+        path = urlsplit(url).path or "/"
+        target = os.path.join(root, *[part for part in path.split("/") if part])
+        if path.endswith("/") or not os.path.splitext(target)[1]:
+            target = os.path.join(target, "index.html")
+
+        request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (snapshot recorder)"})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            content = response.read()
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "wb") as f:
+            f.write(content)
+        logger.info(f"Recorded {url} → {target}")
+        return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or serve page snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="Save live pages as snapshots")
+    record.add_argument("urls", nargs="+")
+    serve = commands.add_parser("serve", help="Serve the snapshots until interrupted")
+    serve.add_argument("--port", type=int, default=None)
+    args = parser.parse_args()
+
+    ConfigManager.load()
+    if args.command == "record":
+        for url in args.urls:
+            FixtureServer.record(url)
+        return
+
+    print(f"Serving {FixtureServer.root()} at {FixtureServer.start(args.port)} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        FixtureServer.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,217 @@
+"""
+logger.py
+
+Non-blocking logging pipeline shared by the framework.
+
+Loggers from get_logger() only put records on an in-memory queue
+(QueueHandler); one background QueueListener per process does the I/O:
+
+    - logs/<worker>.jsonl   structured JSON lines, one file per xdist
+                            worker ("main" outside xdist), size-rotated
+    - console               the familiar text format
+
+so a test thread never waits on a disk write, and xdist workers never
+interleave writes into the same file. At session end the controller merges
+every worker's file into logs/run.jsonl in timestamp order.
+
+Levels (logging in config.yaml):
+    level:          level for regular loggers
+    hot_path_level: level for per-attempt step loggers
+                    (get_logger(..., hot_path=True)), typically WARNING so
+                    the busiest call sites cost nothing in a healthy run
+"""
+import atexit
+import glob
+import heapq
+import json
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
 import allure
 
+from core.configManager import ConfigManager
+
 LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
+MERGED_LOG = "run.jsonl"
+TEXT_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-def get_logger(name):
-    logger = logging.getLogger(name)
 
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record, tagged with worker and current test."""
+
+    def format(self, record):
+        entry = {
+            "ts": record.created,
+            "time": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": getattr(record, "worker", None),
+            "test": getattr(record, "test", None),
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _ContextQueueHandler(QueueHandler):
+    """Captures worker / test context on the emitting thread."""
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        current = os.environ.get("PYTEST_CURRENT_TEST")
+        record.test = current.rsplit(" ", 1)[0] if current else None
+        return record
+
+
+class LoggingPipeline:
+    """Process-wide queue, listener and level settings behind get_logger().
+
+    Methods:
+        start(): Start the background listener (done on first get_logger).
+        register(logger, hot_path): Attach the queue handler and level.
+        flush(): Block until every queued record has been written.
+        stop(): Flush and stop the listener (atexit).
+        merge(since): Merge worker files into logs/run.jsonl.
+    """
+    _queue = None
+    _handler = None
+    _listener = None
+    _loggers = {}
+    _lock = threading.Lock()
 
-        # File handler
-        file_handler = logging.FileHandler(os.path.join(LOG_DIR, f"{name}.log"))
-        file_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-            "%Y-%m-%d %H:%M:%S"
-        )
-        file_handler.setFormatter(formatter)
+    @staticmethod
+    def _setting(key, default):
+        value = ConfigManager.get("logging", key)
+        return default if value is None else value
 
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
+    @classmethod
+    def level(cls, hot_path=False):
+        level = cls._setting("level", "INFO")
+        if hot_path:
+            level = cls._setting("hot_path_level", level)
+        return logging.getLevelName(str(level).upper())
 
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
-        logger.propagate = False
+    @classmethod
+    def worker_log(cls):
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        return os.path.join(LOG_DIR, f"{worker}.jsonl")
 
+    @classmethod
+    def start(cls):
+        with cls._lock:
+            if cls._listener is not None:
+                return
+            ConfigManager.load()
+            os.makedirs(LOG_DIR, exist_ok=True)
+
+            # Fresh file per process; rotated backups of an earlier run go too
+            path = cls.worker_log()
+            for old in glob.glob(f"{path}*"):
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+
+            file_handler = RotatingFileHandler(
+                path,
+                maxBytes=cls._setting("max_bytes", 10 * 1024 * 1024),
+                backupCount=cls._setting("backup_count", 5),
+                encoding="utf-8",
+            )
+            file_handler.setFormatter(JsonLinesFormatter())
+            handlers = [file_handler]
+
+            if cls._setting("console", True):
+                console_handler = logging.StreamHandler()
+                console_handler.setFormatter(logging.Formatter(TEXT_FORMAT, DATE_FORMAT))
+                handlers.append(console_handler)
+
+            cls._queue = queue.Queue()
+            cls._handler = _ContextQueueHandler(cls._queue)
+            cls._listener = QueueListener(cls._queue, *handlers, respect_handler_level=False)
+            cls._listener.start()
+            atexit.register(cls.stop)
+
+    @classmethod
+    def register(cls, logger, hot_path=False):
+        cls.start()
+        with cls._lock:
+            if cls._handler not in logger.handlers:
+                logger.addHandler(cls._handler)
+            logger.setLevel(cls.level(hot_path))
+            logger.propagate = False
+            cls._loggers[logger.name] = hot_path
+
+    @classmethod
+    def flush(cls):
+        if cls._listener is not None:
+            cls._queue.join()
+
+    @classmethod
+    def stop(cls):
+        with cls._lock:
+            listener, cls._listener = cls._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    @classmethod
+    def merge(cls, since=None):
+        """Merge every worker's JSON-lines log (and its rotated backups) into
+        logs/run.jsonl, ordered by timestamp. ``since`` (epoch seconds) drops
+        entries older than the current session. Returns the merged path."""
+        output = os.path.join(LOG_DIR, MERGED_LOG)
+        streams = []
+        for path in sorted(glob.glob(os.path.join(LOG_DIR, "*.jsonl"))):
+            if os.path.basename(path) == MERGED_LOG:
+                continue
+            # RotatingFileHandler: <file>.N is the oldest, <file> the newest
+            backups = sorted(glob.glob(f"{path}.[0-9]*"),
+                             key=lambda p: int(p.rsplit(".", 1)[1]), reverse=True)
+            streams.append(cls._read_entries(backups + [path], since))
+
+        tmp_path = f"{output}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            for _, line in heapq.merge(*streams, key=lambda entry: entry[0]):
+                out.write(line)
+        os.replace(tmp_path, output)
+        return output
+
+    @staticmethod
+    def _read_entries(paths, since):
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            ts = json.loads(line)["ts"]
+                        except (ValueError, KeyError):
+                            continue
+                        if since is None or ts >= since:
+                            yield ts, line if line.endswith("\n") else line + "\n"
+            except OSError:
+                continue
+
+
+def get_logger(name, hot_path=False):
+    """Logger feeding the shared pipeline.
+
+    hot_path=True marks per-attempt / per-command loggers that use
+    logging.hot_path_level instead of logging.level.
+    """
+    logger = logging.getLogger(name)
+    if name not in LoggingPipeline._loggers:
+        LoggingPipeline.register(logger, hot_path)
     return logger
 
 
 def log_allure(message):
-    """Attach log message to Allure report"""
-    allure.attach(message, name="Log", attachment_type=allure.attachment_type.TEXT)
+    """Attach log message to Allure report (written in the background)"""
+    from utils.attachments import AttachmentSink
+    AttachmentSink.attach(message, name="Log", attachment_type=allure.attachment_type.TEXT)
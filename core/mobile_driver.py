@@ -3,6 +3,7 @@ from appium.webdriver.common.appiumby import AppiumBy
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from core.base_driver import BaseDriver
+from core.command_tracer import CommandTracer
 from core.singleton_driver import SingletonDriver
 
 class MobileDriverManager(BaseDriver):
@@ -12,9 +13,8 @@ class MobileDriverManager(BaseDriver):
     the standard BaseDriver interface for page interactions.
 
     Args:
-        device_name (str): Name of target mobile device.
-        app_path (str): Path to APK/IPA for installation.
-        platform (str): "android" or "ios".
+        resource (Resource): Leased device from ResourcePool; its endpoint
+            and capabilities override the local defaults.
 
     Methods:
         get_driver(): Start Appium session with capabilities.
@@ -24,43 +24,74 @@ class MobileDriverManager(BaseDriver):
         wait_for_element(...): Mobile explicit waits.
         quit(): End Appium session.
     """
-    def __init__(self):
+    DEFAULT_ENDPOINT = "http://localhost:4723/wd/hub"
+
+    def __init__(self, resource=None):
         self.driver = None
+        self.resource = resource
+        self._registry_key = None
 
     def get_driver(self):
+        desired_caps = {
+            "platformName": "Android",
+            "deviceName": "AndroidDevice",
+            "automationName": "UiAutomator2",
+            "noReset": True
+        }
+        endpoint = self.DEFAULT_ENDPOINT
+        if self.resource is not None:
+            desired_caps.update(self.resource.capabilities)
+            endpoint = self.resource.endpoint or endpoint
+
         def create():
-            desired_caps = {
-                "platformName": "Android",
-                "deviceName": "AndroidDevice",
-                "automationName": "UiAutomator2",
-                "noReset": True
-            }
-            return webdriver.Remote("http://localhost:4723/wd/hub", desired_caps)
-        self.driver = SingletonDriver.get_instance('mobile', create)
+            return webdriver.Remote(endpoint, desired_caps)
+
+        self._registry_key = SingletonDriver.make_key('mobile', desired_caps)
+        self.driver = SingletonDriver.get_instance(self._registry_key, create)
+        if CommandTracer.enabled():
+            CommandTracer.install(self.driver)
         return self
 
     def get(self, url):
         pass
 
+    def _locate(self, locator_type, locator_value):
+        return lambda: self.driver.find_element(getattr(AppiumBy, locator_type.upper()), locator_value)
+
     def find_element(self, locator_type, locator_value):
-        return self.driver.find_element(getattr(AppiumBy, locator_type.upper()), locator_value)
+        return self.resolved((locator_type, locator_value), self._locate(locator_type, locator_value))
+
+    def get_text(self, locator_type, locator_value):
+        return self.read(
+            (locator_type, locator_value),
+            self._locate(locator_type, locator_value),
+            lambda el: el.text
+        )
 
     def click(self, locator_type, locator_value):
-        self.find_element(locator_type, locator_value).click()
+        self.act(
+            (locator_type, locator_value),
+            self._locate(locator_type, locator_value),
+            lambda el: el.click()
+        )
 
     def send_keys(self, locator_type, locator_value, text):
-        el = self.find_element(locator_type, locator_value)
-        el.clear()
-        el.send_keys(text)
+        def type_text(el):
+            el.clear()
+            el.send_keys(text)
+
+        self.act((locator_type, locator_value), self._locate(locator_type, locator_value), type_text)
 
     def wait_for_element(self, locator_type, locator_value, timeout=10):
-        WebDriverWait(self.driver, timeout).until(
+        el = WebDriverWait(self.driver, timeout).until(
             EC.presence_of_element_located((getattr(AppiumBy, locator_type.upper()), locator_value))
         )
+        return self.remember((locator_type, locator_value), el)
 
     def quit(self):
         if self.driver:
             try:
                 self.driver.quit()
             finally:
-                SingletonDriver.reset()
+                SingletonDriver.release(self._registry_key or 'mobile')
+                self.driver = None
@@ -0,0 +1,110 @@
+"""
+page_element_cache.py
+
+Page-scoped element cache with staleness detection (web only).
+
+Unlike the per-step cache in ResolvedElementCache, entries here survive
+across steps for as long as the page has not changed. "Changed" means:
+
+    - navigation through the driver (WebDriverManager.get)
+    - a new document (a page id stored on ``window`` is gone / different)
+    - DOM mutations that can detach or disable a cached element: removed
+      nodes, and changes to the style/class/hidden/disabled attributes
+      (an element hidden by a class change, a re-rendered disabled
+      state), counted by a MutationObserver injected once per document
+    - a StaleElementReferenceException on a cached element (evicted)
+
+Checking the page token costs one execute_script round trip, so it is only
+done for the first cache hit of a step and the first one after something
+that may have changed the page (a click, typing, navigation). Further hits
+in between are served without talking to the browser at all.
+
+Visibility changes that touch none of those attributes (a stylesheet
+swapped in, a media query) are not seen; actions on such an element fail
+the way they would on a freshly located one.
+"""
+
+# Installs the observer on first use and returns [page id, DOM version].
+PAGE_TOKEN_JS = """
+if (window.__agentraDomVersion === undefined) {
+    window.__agentraDomVersion = 0;
+    window.__agentraPageId = Math.random().toString(36).slice(2);
+    new MutationObserver(function (records) {
+        for (var i = 0; i < records.length; i++) {
+            if (records[i].type === 'attributes' || records[i].removedNodes.length) {
+                window.__agentraDomVersion++;
+                return;
+            }
+        }
+    }).observe(document, {
+        childList: true, subtree: true,
+        attributes: true, attributeFilter: ['style', 'class', 'hidden', 'disabled']
+    });
+}
+return [window.__agentraPageId, window.__agentraDomVersion];
+"""
+
+
+class PageElementCache:
+    """Locator → element cache valid for one page state.
+
+    Args:
+        driver: Raw Selenium WebDriver (needs execute_script).
+
+    Methods:
+        get(key): Cached element if the page is unchanged, else None.
+        put(key, element): Cache an element for the current page state.
+        evict(key): Drop one entry (stale element).
+        mark_dirty(): Re-validate the page token on the next lookup.
+        clear(): Drop everything (navigation).
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._elements = {}
+        self._token = None
+        self._verified = False
+
+    def _page_token(self):
+        try:
+            return tuple(self.driver.execute_script(PAGE_TOKEN_JS))
+        except Exception:
+            return None
+
+    def _validate(self):
+        if self._verified:
+            return
+        token = self._page_token()
+        if token is None or token != self._token:
+            self._elements.clear()
+        self._token = token
+        self._verified = token is not None
+
+    def get(self, key):
+        if key not in self._elements:
+            return None
+        self._validate()
+        return self._elements.get(key)
+
+    def put(self, key, element):
+        # No round trip here once the page's token is known: the next get()
+        # validates the token first and drops everything if the page moved
+        # on. The DOM version only grows, so an unchanged token proves the
+        # element is still attached. The first put on a page records the
+        # token, else the first get() could never match it.
+        if element is None:
+            return
+        if self._token is None:
+            self._validate()
+        self._elements[key] = element
+
+    def evict(self, key):
+        self._elements.pop(key, None)
+
+    def mark_dirty(self):
+        self._verified = False
+
+    def clear(self):
+        self._elements.clear()
+        self._token = None
+        self._verified = False
@@ -0,0 +1,272 @@
+"""
+profiler.py
+
+Step-level timing spans and per-test performance profiles.
+
+Hot-path code wraps its work in ``StepProfiler.span(category, name)``:
+
+    step        BasePage._safe_action (one per page action)
+    attempt     one try of a step (marked failed when it raised)
+    retry_sleep backoff between attempts
+    heal        self-healing lookup
+    wait        element waits (EventWaitEngine)
+    find        element lookups (ResolvedElementCache)
+    api         APIClient requests (test data setup / teardown)
+    action      click / type on a located element
+    screenshot  failure screenshot capture
+    attachment  queuing an Allure attachment
+
+Spans nest per thread under the running test's root span. At teardown the
+tree is split by *self* time (time not spent in a child span) into buckets
+that add up to the time spent in steps, which answers why a test was slow:
+
+    app         wait + find + action + api — the application / driver responding
+    retries     retry_sleep + everything inside failed attempts
+    healing     heal
+    reporting   screenshot + attachment
+    framework   the rest of step / attempt time (our own overhead)
+
+A compact flame-style tree is attached to Allure, and every test's profile
+(breakdown + folded stacks, "step;attempt;find 0.123") is written to one
+JSON per run, reports/step_profile.json.
+
+Spans cost two perf_counter() calls and a list append; with
+profiling.enabled: false they are a shared no-op context.
+"""
+import glob
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+APP = ("wait", "find", "action", "api")
+REPORTING = ("screenshot", "attachment")
+_NO_SPAN = nullcontext()
+
+
+class Span:
+    """One timed region; children are the spans opened inside it."""
+    __slots__ = ("category", "name", "start", "duration", "failed", "children")
+
+    def __init__(self, category, name):
+        self.category = category
+        self.name = name or category
+        self.start = time.perf_counter()
+        self.duration = None
+        self.failed = False
+        self.children = []
+
+    def self_time(self):
+        return max(0.0, self.duration - sum(child.duration for child in self.children))
+
+
+class _SpanContext:
+    __slots__ = ("span", "stack")
+
+    def __init__(self, span, stack):
+        self.span = span
+        self.stack = stack
+
+    def __enter__(self):
+        self.stack.append(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self.stack.pop()
+        span.duration = time.perf_counter() - span.start
+        if exc_type is not None:
+            span.failed = True
+        return False
+
+
+class StepProfiler:
+    """Per-thread span stacks, per-test roots and the per-run profile file.
+
+    Methods:
+        span(category, name): Context manager timing one region of the
+            current test (no-op outside a test or when disabled).
+        begin(test_id): Open the root span for a test on this thread.
+        end(): Close the root; returns the test's profile dict (or None).
+        summary(profile): Flame-style text for the Allure attachment.
+        save(directory): Write this worker's profiles (session end).
+        merge(directory, output): Combine worker files into one JSON.
+    """
+    DIRECTORY = os.path.join("reports", "profiles")
+    OUTPUT = os.path.join("reports", "step_profile.json")
+
+    _local = threading.local()
+    _profiles = []
+    _lock = threading.Lock()
+    _enabled = None
+
+    @classmethod
+    def enabled(cls):
+        if cls._enabled is None:
+            enabled = ConfigManager.get("profiling", "enabled")
+            cls._enabled = True if enabled is None else bool(enabled)
+        return cls._enabled
+
+    @classmethod
+    def span(cls, category, name=None):
+        stack = getattr(cls._local, "stack", None)
+        if not stack:
+            return _NO_SPAN
+        span = Span(category, name)
+        stack[-1].children.append(span)
+        return _SpanContext(span, stack)
+
+    @classmethod
+    def begin(cls, test_id):
+        if not cls.enabled():
+            return
+        cls._local.test_id = test_id
+        cls._local.stack = [Span("test", test_id)]
+
+    @classmethod
+    def end(cls):
+        stack = getattr(cls._local, "stack", None)
+        cls._local.stack = None
+        if not stack:
+            return None
+
+        root = stack[0]
+        root.duration = time.perf_counter() - root.start
+        if not root.children:
+            return None
+
+        profile = cls._profile(cls._local.test_id, root)
+        with cls._lock:
+            cls._profiles.append(profile)
+        return profile
+
+    # ------------------------------------------------------------------
+    # AGGREGATION
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _bucket(category, in_failed_attempt):
+        if in_failed_attempt or category == "retry_sleep":
+            return "retries"
+        if category in APP:
+            return "app"
+        if category == "heal":
+            return "healing"
+        if category in REPORTING:
+            return "reporting"
+        return "framework"
+
+    @classmethod
+    def _profile(cls, test_id, root):
+        categories = {}
+        breakdown = dict.fromkeys(("app", "retries", "healing", "reporting", "framework"), 0.0)
+        folded = {}
+
+        def walk(span, path, in_failed_attempt):
+            path = f"{path};{span.name}" if path else span.name
+            in_failed_attempt = in_failed_attempt or (span.category == "attempt" and span.failed)
+            own = span.self_time()
+            categories[span.category] = categories.get(span.category, 0.0) + own
+            breakdown[cls._bucket(span.category, in_failed_attempt)] += own
+            folded[path] = folded.get(path, 0.0) + own
+            for child in span.children:
+                walk(child, path, in_failed_attempt)
+
+        for child in root.children:
+            walk(child, "", False)
+
+        steps = sum(span.duration for span in root.children)
+        return {
+            "test": test_id,
+            "worker": os.environ.get("PYTEST_XDIST_WORKER", "main"),
+            "total_s": round(root.duration, 4),
+            "steps_s": round(steps, 4),
+            "outside_steps_s": round(max(0.0, root.duration - steps), 4),
+            "breakdown_s": {key: round(value, 4) for key, value in breakdown.items()},
+            "self_time_s": {key: round(value, 4) for key, value in sorted(categories.items())},
+            "folded": {path: round(value, 4) for path, value in folded.items()},
+            "spans": [cls._tree(span) for span in root.children],
+        }
+
+    @classmethod
+    def _tree(cls, span):
+        node = {"name": span.name, "category": span.category, "s": round(span.duration, 4)}
+        if span.failed:
+            node["failed"] = True
+        if span.children:
+            node["children"] = [cls._tree(child) for child in span.children]
+        return node
+
+    @staticmethod
+    def summary(profile, width=30):
+        """Flame-style text: one line per span, bar scaled to the test total."""
+        total = profile["total_s"] or 1e-9
+        lines = [f"Test {profile['total_s']:.3f}s  |  " + "  ".join(
+            f"{key} {value:.3f}s" for key, value in profile["breakdown_s"].items()
+        ), ""]
+
+        def render(node, depth):
+            bar = "█" * max(1, round(width * node["s"] / total))
+            mark = " ✗" if node.get("failed") else ""
+            lines.append(f"{'  ' * depth}{bar} {node['name']} {node['s'] * 1000:.0f}ms{mark}")
+            for child in node.get("children", ()):
+                render(child, depth + 1)
+
+        for node in profile["spans"]:
+            render(node, 0)
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------
+    # PERSISTENCE
+    # ------------------------------------------------------------------
+    @classmethod
+    def save(cls, directory=None):
+        with cls._lock:
+            profiles, cls._profiles = cls._profiles, []
+        if not profiles:
+            return None
+
+        directory = directory or cls.DIRECTORY
+        os.makedirs(directory, exist_ok=True)
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        path = os.path.join(directory, f"profile-{worker}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(profiles, f, ensure_ascii=False)
+        return path
+
+    @classmethod
+    def merge(cls, directory=None, output=None):
+        directory = directory or cls.DIRECTORY
+        output = output or cls.OUTPUT
+        paths = glob.glob(os.path.join(directory, "profile-*.json"))
+        if not paths:
+            return None
+
+        tests = []
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    tests.extend(json.load(f))
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable profile {path}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+        tests.sort(key=lambda profile: profile["total_s"], reverse=True)
+        totals = {}
+        for profile in tests:
+            for key, value in profile["breakdown_s"].items():
+                totals[key] = round(totals.get(key, 0.0) + value, 4)
+
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump({"generated": time.time(), "tests": len(tests),
+                       "breakdown_s": totals, "profiles": tests}, f, indent=2, ensure_ascii=False)
+        logger.info(f"Step profile for {len(tests)} test(s) written to {output}")
+        return output
@@ -0,0 +1,176 @@
+"""
+resource_pool.py
+
+Device / resource inventory and cross-worker leasing for xdist runs.
+
+Mobile tests need an Appium endpoint and a device, desktop tests need the
+one HP Smart window of a host. With ``-n auto`` several workers would
+otherwise drive the same device at once. The inventory in config.yaml
+lists what exists::
+
+    resources:
+      mobile:
+        - name: emulator-5554
+          endpoint: "http://localhost:4723/wd/hub"
+          capabilities: {udid: emulator-5554}
+      desktop:
+        - name: desktop-1
+
+Scheduling: tests that need a pool (``@pytest.mark.resource("mobile")``,
+or their platform when the inventory has a pool of that name) are split
+round-robin into one ``xdist_group`` per resource. loadgroup scheduling
+keeps each group on one worker, so at most ``len(pool)`` workers ever need
+the pool, tests for a busy resource queue behind each other on its worker,
+and ungrouped (web) tests fill whatever workers are idle.
+
+Leasing: the first test of a group leases that group's resource
+(``mobile-1`` → the second mobile entry) by taking an OS lock (flock /
+msvcrt) on its lock file, and the worker keeps it until the session ends.
+The lock only waits when another session holds the resource. The OS drops
+the lock when a worker dies, so a crashed worker never strands a device.
+"""
+import os
+import re
+import time
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Resource:
+    """One leasable device, endpoint or slot from the inventory."""
+
+    def __init__(self, pool, name, endpoint=None, capabilities=None):
+        self.pool = pool
+        self.name = name
+        self.endpoint = endpoint
+        self.capabilities = capabilities or {}
+
+    def __repr__(self):
+        return f"Resource({self.pool}/{self.name})"
+
+
+class ResourcePool:
+    """Inventory lookup, round-robin grouping and per-worker leases.
+
+    Methods:
+        configured(): Whether any resource pool is configured.
+        resources(pool): Resources configured for a pool ([] if none).
+        required_pool(item, platform): Pool a collected test needs, or None.
+        assign_groups(items, platform, marker_factory): Pin pool-bound
+            tests to one xdist_group per resource.
+        group_index(item, pool): Resource index of the item's pool group.
+        lease(pool, index, timeout): Resource ``index`` of the pool (any
+            free one if None), held by this worker from first use.
+        release_all(): Give back this worker's leases (session end).
+    """
+    LEASE_DIR = os.path.join("reports", ".leases")
+
+    _held = {}
+
+    @staticmethod
+    def configured():
+        return any((ConfigManager.get("resources") or {}).values())
+
+    @staticmethod
+    def resources(pool):
+        entries = ConfigManager.get("resources", pool) or []
+        return [
+            Resource(pool, entry.get("name") or f"{pool}-{i}",
+                     entry.get("endpoint"), entry.get("capabilities"))
+            for i, entry in enumerate(entries)
+        ]
+
+    @classmethod
+    def required_pool(cls, item, platform=None):
+        marker = item.get_closest_marker("resource")
+        if marker is not None and marker.args:
+            return marker.args[0]
+
+        callspec = getattr(item, "callspec", None)
+        target = callspec.params.get("matrix_target") if callspec else None
+        if target is not None:
+            platform = target.platform
+        if "driver" in getattr(item, "fixturenames", ()) and cls.resources(platform):
+            return platform
+        return None
+
+    @classmethod
+    def assign_groups(cls, items, platform, marker_factory):
+        counters = {}
+        for item in items:
+            pool = cls.required_pool(item, platform)
+            if pool is None:
+                continue
+            size = len(cls.resources(pool))
+            if not size:
+                raise ValueError(f"No resources configured for pool '{pool}'")
+
+            index = counters.get(pool, 0)
+            counters[pool] = index + 1
+            item.add_marker(marker_factory(f"{pool}-{index % size}"))
+
+    @classmethod
+    def group_index(cls, item, pool):
+        pattern = re.compile(rf"{re.escape(pool)}-(\d+)")
+        for mark in item.iter_markers("xdist_group"):
+            name = mark.args[0] if mark.args else mark.kwargs.get("name")
+            match = pattern.fullmatch(str(name))
+            if match:
+                return int(match.group(1))
+        return None
+
+    @classmethod
+    def lease(cls, pool, index=None, timeout=600):
+        resources = cls.resources(pool)
+        if not resources:
+            raise ValueError(f"No resources configured for pool '{pool}'")
+
+        # A group's own resource, or (ungrouped) any resource of the pool
+        candidates = resources if index is None else [resources[index % len(resources)]]
+        for resource in candidates:
+            if (pool, resource.name) in cls._held:
+                return resource
+
+        os.makedirs(cls.LEASE_DIR, exist_ok=True)
+        deadline = time.monotonic() + timeout
+        while True:
+            for resource in candidates:
+                handle = cls._try_lock(resource)
+                if handle is not None:
+                    logger.info(f"Leased {resource}")
+                    cls._held[(pool, resource.name)] = (resource, handle)
+                    return resource
+            if time.monotonic() >= deadline:
+                names = ", ".join(resource.name for resource in candidates)
+                raise TimeoutError(f"Resource(s) {names} in pool '{pool}' still busy after {timeout}s")
+            time.sleep(1)
+
+    @classmethod
+    def release_all(cls):
+        for resource, handle in list(cls._held.values()):
+            handle.close()  # closing the descriptor drops the OS lock
+            logger.info(f"Released {resource}")
+        cls._held.clear()
+
+    @classmethod
+    def _lock_path(cls, resource):
+        return os.path.join(cls.LEASE_DIR, f"{resource.pool}--{resource.name}.lock")
+
+    @classmethod
+    def _try_lock(cls, resource):
+        handle = open(cls._lock_path(resource), "a+b")
+        try:
+            handle.seek(0)
+            if os.name == "nt":
+                import msvcrt
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return None
+        return handle
@@ -0,0 +1,128 @@
+"""
+session_pool.py
+
+Per-worker pool of warm driver sessions reused across tests.
+
+Launching a fresh Chrome per test costs seconds of cold start. With the
+pool enabled (``--session-pool``) the ``driver`` fixture borrows a session
+instead, and on release the session is reset to a clean state:
+
+    - extra tabs/windows closed
+    - cookies and local/session storage cleared
+    - navigated to about:blank
+
+A session is recycled (quit and replaced) after ``max_uses`` tests, or
+immediately if it fails the reset (crashed browser, dead session).
+
+Only web sessions are pooled; other platforms are handed out fresh and
+quit on release, exactly like the non-pooled fixture.
+"""
+from threading import Lock
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PooledSession:
+    """A driver manager plus its pool bookkeeping."""
+
+    def __init__(self, platform, manager, key=None):
+        self.platform = platform
+        self.manager = manager
+        self.key = key or platform
+        self.uses = 0
+
+
+class SessionPool:
+    """Hands out warm driver sessions for the current xdist worker.
+
+    Methods:
+        acquire(platform, factory, key): Borrow an idle session or create
+            one; ``key`` separates variants of a platform (e.g. browsers).
+        release(session): Reset and return a session, or recycle it.
+        shutdown(): Quit every idle session (session end).
+    """
+    POOLED_PLATFORMS = ("web",)
+
+    _idle = {}
+    _lock = Lock()
+
+    @staticmethod
+    def max_uses():
+        return ConfigManager.get("session_pool", "max_uses") or 25
+
+    @classmethod
+    def acquire(cls, platform, factory, key=None):
+        key = key or platform
+        with cls._lock:
+            idle = cls._idle.get(key)
+            session = idle.pop() if idle else None
+
+        if session is None:
+            logger.info(f"Session pool: starting new {key} session")
+            session = PooledSession(platform, factory(), key)
+        else:
+            logger.info(f"Session pool: reusing {key} session (use {session.uses + 1})")
+
+        session.uses += 1
+        return session
+
+    @classmethod
+    def release(cls, session, max_uses=None):
+        max_uses = max_uses or cls.max_uses()
+
+        if session.platform not in cls.POOLED_PLATFORMS or session.uses >= max_uses:
+            cls._quit(session, f"recycling after {session.uses} use(s)")
+            return
+
+        try:
+            cls._reset(session)
+        except Exception as e:
+            cls._quit(session, f"reset failed ({type(e).__name__}: {e})")
+            return
+
+        with cls._lock:
+            cls._idle.setdefault(session.key, []).append(session)
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            sessions = [s for idle in cls._idle.values() for s in idle]
+            cls._idle.clear()
+        for session in sessions:
+            cls._quit(session, "session end")
+
+    @staticmethod
+    def _reset(session):
+        driver = session.manager.driver
+
+        # Close every tab but the first
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per-origin, so clear it before leaving the page
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass  # about:blank / data: pages have no storage
+
+        # Chrome can drop cookies for every domain at once
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+
+        driver.get("about:blank")
+
+    @staticmethod
+    def _quit(session, reason):
+        logger.info(f"Session pool: closing {session.platform} session, {reason}")
+        try:
+            session.manager.quit()
+        except Exception:
+            pass
@@ -1,26 +1,133 @@
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+
 class SingletonDriver:
-    """Thread-safe Singleton manager for driver instances.
+    """Thread-safe, keyed registry of driver instances.
+
+    Each driver is registered under a key made of:
+        - xdist worker id (PYTEST_XDIST_WORKER, "main" outside xdist)
+        - thread id (or an owner token, see owner())
+        - platform ("web", "mobile", ...)
+        - hash of the session capabilities
 
-    Ensures that each pytest-xdist worker receives exactly **one**
-    driver instance, preventing accidental reuse across tests.
+    so one worker process can hold web and mobile sessions at once and
+    several threads can each own their own session. Creation happens
+    outside the registry lock (under a per-key lock), so a slow Appium
+    start in one thread does not block lookups from another.
 
     Attributes:
-        _instances (dict): Maps worker IDs and platform keys to driver objects.
+        _instances (dict): Maps registry keys to driver objects.
 
     Methods:
-        get_instance(platform_key, create_fn):
-            Returns existing driver instance if present; otherwise creates one.
-        reset():
-            Clears all stored singleton instances (typically at teardown).
+        make_key(platform, capabilities): Build the registry key for the
+            calling worker/thread.
+        get_instance(key, creator): Returns the driver for ``key``,
+            creating it with ``creator()`` on first use. ``key`` may be a
+            full key from make_key() or just a platform name.
+        release(key): Removes one driver (per-key teardown) and returns it.
+        reset(): Clears every stored instance.
+        add_hook(event, fn): Register fn(key, driver) for "created" /
+            "released" lifecycle events.
+        owner(token): Context manager; sessions created inside it are
+            keyed by ``token`` instead of the thread id (for drivers built
+            on one thread and handed to another).
     """
     _instances = {}
+    _creation_locks = {}
+    _hooks = {"created": [], "released": []}
+    _lock = threading.RLock()
+    _scope = threading.local()
+
+    @staticmethod
+    def capability_hash(capabilities):
+        if not capabilities:
+            return None
+        payload = json.dumps(capabilities, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def make_key(cls, platform, capabilities=None):
+        return (
+            os.environ.get("PYTEST_XDIST_WORKER", "main"),
+            getattr(cls._scope, "owner", None) or threading.get_ident(),
+            platform,
+            cls.capability_hash(capabilities),
+        )
+
+    @classmethod
+    @contextmanager
+    def owner(cls, token):
+        previous = getattr(cls._scope, "owner", None)
+        cls._scope.owner = token
+        try:
+            yield
+        finally:
+            cls._scope.owner = previous
+
+    @classmethod
+    def _normalize(cls, key):
+        return key if isinstance(key, tuple) else cls.make_key(key)
 
     @classmethod
     def get_instance(cls, key, creator):
-        if key not in cls._instances:
-            cls._instances[key] = creator()
-        return cls._instances[key]
+        key = cls._normalize(key)
+
+        with cls._lock:
+            if key in cls._instances:
+                return cls._instances[key]
+            creation_lock = cls._creation_locks.setdefault(key, threading.Lock())
+
+        with creation_lock:
+            with cls._lock:
+                if key in cls._instances:
+                    return cls._instances[key]
+
+            instance = creator()
+
+            with cls._lock:
+                cls._instances[key] = instance
+                cls._creation_locks.pop(key, None)
+
+        cls._fire("created", key, instance)
+        return instance
+
+    @classmethod
+    def release(cls, key):
+        key = cls._normalize(key)
+        with cls._lock:
+            instance = cls._instances.pop(key, None)
+        if instance is not None:
+            cls._fire("released", key, instance)
+        return instance
+
+    @classmethod
+    def instances(cls, platform=None):
+        """Snapshot of registered (key, driver) pairs, optionally per platform."""
+        with cls._lock:
+            return [(key, drv) for key, drv in cls._instances.items()
+                    if platform is None or key[2] == platform]
 
     @classmethod
     def reset(cls):
-        cls._instances.clear()
+        with cls._lock:
+            released = list(cls._instances.items())
+            cls._instances.clear()
+        for key, instance in released:
+            cls._fire("released", key, instance)
+
+    @classmethod
+    def add_hook(cls, event, fn):
+        with cls._lock:
+            cls._hooks[event].append(fn)
+
+    @classmethod
+    def _fire(cls, event, key, instance):
+        for fn in list(cls._hooks[event]):
+            try:
+                fn(key, instance)
+            except Exception:
+                pass
@@ -0,0 +1,192 @@
+"""
+wait_engine.py
+
+Event-driven element waits for the web driver layer.
+
+WebDriverWait polls find_element every 0.5 s, so each wait over-sleeps by
+up to half a poll and sends a find request per poll. EventWaitEngine runs
+the wait inside the page instead (see dom_scripts.WAIT_FOR_CONDITIONS_JS): a
+MutationObserver re-checks the condition as soon as the DOM changes and the
+async script returns the moment it holds.
+
+Several conditions can be waited on together (wait_any / wait_all). They are
+evaluated in one in-page script, or in one polling loop on fallback, rather
+than one wait after another, so an "either the dashboard or the error
+banner" check costs the time until the first one appears.
+
+It falls back to WebDriverWait polling when the wait cannot run in-page:
+    - non-browser sessions (native Appium contexts)
+    - locators the page cannot evaluate (unsupported strategy, XPath the
+      browser's evaluator rejects)
+    - the script being interrupted (navigation, script timeout)
+    - waits.event_driven: false in config.yaml
+"""
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from core.configManager import ConfigManager
+from core.dom_scripts import WAIT_FOR_CONDITIONS_JS
+from core.logger import get_logger
+from core.profiler import StepProfiler
+
+logger = get_logger(__name__)
+
+# One condition of a composite wait; ``name`` is what wait_any reports back.
+WaitCondition = namedtuple("WaitCondition", "by value condition text name",
+                           defaults=("present", None, None))
+
+
+class EventWaitEngine:
+    """Waits for element conditions using in-page events, polling as fallback.
+
+    Args:
+        driver: Raw Selenium WebDriver.
+        poll_frequency (float): Poll interval for the fallback path.
+
+    Conditions:
+        present | visible | clickable | text | absent
+
+    Methods:
+        wait(by, value, condition, timeout, text): Return the element (or
+            True for "absent"); raise TimeoutException otherwise.
+        wait_any(conditions, timeout): Return (index, result) for the first
+            WaitCondition that holds.
+        wait_all(conditions, timeout): Return the results once every
+            WaitCondition holds at the same time.
+    """
+    # W3C default script timeout is 30 s; stay below it per async call
+    MAX_SCRIPT_SLICE = 25
+
+    def __init__(self, driver, poll_frequency=0.5):
+        self.driver = driver
+        self.poll_frequency = poll_frequency
+        self._in_page = None
+
+    @staticmethod
+    def enabled():
+        enabled = ConfigManager.get("waits", "event_driven")
+        return True if enabled is None else bool(enabled)
+
+    def _supports_in_page(self):
+        if self._in_page is None:
+            try:
+                capabilities = getattr(self.driver, "capabilities", None) or {}
+                self._in_page = bool(capabilities.get("browserName")) and \
+                    hasattr(self.driver, "execute_async_script")
+            except Exception:
+                self._in_page = False
+        return self._in_page
+
+    def wait(self, by, value, condition="present", timeout=10, text=None):
+        _, result = self.wait_any([WaitCondition(by, value, condition, text)], timeout)
+        return result
+
+    def wait_any(self, conditions, timeout=10):
+        with StepProfiler.span("wait"):
+            return self._wait(self._specs(conditions), "any", timeout)
+
+    def wait_all(self, conditions, timeout=10):
+        with StepProfiler.span("wait"):
+            return self._wait(self._specs(conditions), "all", timeout)
+
+    @staticmethod
+    def _specs(conditions):
+        specs = [WaitCondition(*c) if not isinstance(c, WaitCondition) else c for c in conditions]
+        if not specs:
+            raise ValueError("At least one wait condition is required")
+        return [c._replace(by=c.by.lower().replace("_", " ")) for c in specs]
+
+    @staticmethod
+    def _describe(specs, mode):
+        return f" {'or' if mode == 'any' else 'and'} ".join(
+            f"({c.by}, {c.value}) {c.condition}" for c in specs
+        )
+
+    def _wait(self, specs, mode, timeout):
+        deadline = time.monotonic() + timeout
+
+        if self.enabled() and self._supports_in_page():
+            payload = [[c.by, c.value, c.condition, c.text] for c in specs]
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(
+                        f"Not met after {timeout}s: {self._describe(specs, mode)}"
+                    )
+                slice_ms = int(min(remaining, self.MAX_SCRIPT_SLICE) * 1000)
+
+                try:
+                    result = self.driver.execute_async_script(
+                        WAIT_FOR_CONDITIONS_JS, payload, mode, slice_ms
+                    )
+                except WebDriverException as e:
+                    logger.debug(f"In-page wait interrupted ({type(e).__name__}), polling instead")
+                    break
+
+                if not isinstance(result, dict) or result.get("error"):
+                    error = result.get("error") if isinstance(result, dict) else result
+                    logger.debug(f"In-page wait unavailable for {self._describe(specs, mode)}: {error}")
+                    break
+                if result.get("timeout"):
+                    continue
+                if mode == "all":
+                    return result["elements"]
+                return result["index"], result["element"]
+
+        return self._poll(specs, mode, max(0.0, deadline - time.monotonic()))
+
+    def _poll(self, specs, mode, timeout):
+        checks = [self._expected_condition(c) for c in specs]
+
+        def evaluate(driver):
+            results = []
+            for index, check in enumerate(checks):
+                try:
+                    result = check(driver)
+                except (NoSuchElementException, StaleElementReferenceException):
+                    result = False
+                if mode == "any" and result:
+                    return index, result
+                if mode == "all" and not result:
+                    return False
+                results.append(result)
+            return results if mode == "all" else False
+
+        try:
+            outcome = WebDriverWait(self.driver, timeout, self.poll_frequency).until(evaluate)
+        except TimeoutException:
+            raise TimeoutException(f"Not met after {timeout:.1f}s: {self._describe(specs, mode)}")
+
+        # text_to_be_present_in_element returns True, not the element
+        if mode == "any":
+            index, result = outcome
+            return index, self._element(specs[index], result)
+        return [self._element(c, r) for c, r in zip(specs, outcome)]
+
+    def _element(self, spec, result):
+        if spec.condition == "text":
+            return self.driver.find_element(spec.by, spec.value)
+        return result
+
+    @staticmethod
+    def _expected_condition(spec):
+        locator = (spec.by, spec.value)
+        conditions = {
+            "present": lambda: EC.presence_of_element_located(locator),
+            "visible": lambda: EC.visibility_of_element_located(locator),
+            "clickable": lambda: EC.element_to_be_clickable(locator),
+            "text": lambda: EC.text_to_be_present_in_element(locator, spec.text),
+            "absent": lambda: EC.invisibility_of_element_located(locator),
+        }
+        if spec.condition not in conditions:
+            raise ValueError(f"Unsupported wait condition: {spec.condition}")
+        return conditions[spec.condition]()
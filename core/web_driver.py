@@ -1,9 +1,14 @@
+import shutil
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from core.base_driver import BaseDriver
+from core.command_tracer import CommandTracer
+from core.browser_options import BrowserOptionsBuilder
+from core.dom_scripts import RESOLVE_ELEMENTS_JS
+from core.page_element_cache import PageElementCache
 from core.singleton_driver import SingletonDriver
+from core.wait_engine import EventWaitEngine
 
 from core.logger import get_logger
 
@@ -12,11 +17,13 @@ logger = get_logger(__name__)
 class WebDriverManager(BaseDriver):
     """Web platform driver implementation using Selenium.
 
-    Provides Selenium ChromeDriver setup and exposes a consistent API
+    Provides Selenium Chrome / Firefox setup and exposes a consistent API
     defined by the BaseDriver interface.
 
     Args:
-        browser (str): Browser type ("chrome" supported).
+        browser (str): Browser type ("chrome" or "firefox").
+        profile (str): Launch profile from config.yaml browser_profiles
+            (defaults to browser.profile).
 
     Attributes:
         driver: The underlying Selenium WebDriver instance.
@@ -27,46 +34,120 @@ class WebDriverManager(BaseDriver):
         find_element(...): Locate element using Selenium By strategies.
         click(...): Perform click action.
         send_keys(...): Type into input field.
-        wait_for_element(...): Explicit wait using WebDriverWait.
+        wait_for_element(...): Explicit wait (in-page MutationObserver,
+            WebDriverWait polling as fallback).
+        resolve_elements(locators): Locate many elements in one round trip.
         quit(): Quit browser session.
     """
-    def __init__(self, browser='chrome'):
+    def __init__(self, browser='chrome', profile=None):
         self.driver = None
-        self.browser = browser
+        self.browser = (browser or 'chrome').lower()
+        self.profile = profile
+        self._registry_key = None
+        self._temp_dirs = []
+        self._cache_slot = None
 
     def get_driver(self):
+        options = BrowserOptionsBuilder.build(self.browser, self.profile)
+
         def create():
-            logger.info("Launching Chrome browser...")
-            options = webdriver.ChromeOptions()
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-gpu')
-            #options.add_argument('--headless')  # remove headless for visual run
-            return webdriver.Chrome(options=options)
-        self.driver = SingletonDriver.get_instance('web', create)
+            logger.info(f"Launching {self.browser.capitalize()} browser...")
+            user_data_dir = BrowserOptionsBuilder.attach_user_data_dir(options, self.browser, self.profile)
+            self._temp_dirs = [user_data_dir] if user_data_dir else []
+            self._cache_slot = BrowserOptionsBuilder.attach_disk_cache(options, self.browser, self.profile)
+            try:
+                if self.browser == 'firefox':
+                    return webdriver.Firefox(options=options)
+                return webdriver.Chrome(options=options)
+            except Exception:
+                self._release_session_dirs()
+                raise
+
+        self._registry_key = SingletonDriver.make_key('web', options.to_capabilities())
+        self.driver = SingletonDriver.get_instance(self._registry_key, create)
+        if CommandTracer.enabled():
+            CommandTracer.install(self.driver)
         return self
 
+    @property
+    def page_cache(self):
+        """PageElementCache for the current session (used by opt-in page objects)."""
+        if self.driver is None:
+            return None
+        cache = getattr(self, "_page_cache", None)
+        if cache is None or cache.driver is not self.driver:
+            cache = self._page_cache = PageElementCache(self.driver)
+        return cache
+
+    @property
+    def wait_engine(self):
+        """EventWaitEngine bound to the current session."""
+        engine = getattr(self, "_wait_engine", None)
+        if engine is None or engine.driver is not self.driver:
+            engine = self._wait_engine = EventWaitEngine(self.driver)
+        return engine
+
     def get(self, url):
+        if self.page_cache is not None:
+            self.page_cache.clear()
         self.driver.get(url)
 
+    def _locate(self, locator_type, locator_value):
+        return lambda: self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+
     def find_element(self, locator_type, locator_value):
-        return self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+        return self.resolved((locator_type, locator_value), self._locate(locator_type, locator_value))
+
+    def get_text(self, locator_type, locator_value):
+        return self.read(
+            (locator_type, locator_value),
+            self._locate(locator_type, locator_value),
+            lambda el: el.text
+        )
 
     def click(self, locator_type, locator_value):
-        self.find_element(locator_type, locator_value).click()
+        self.act(
+            (locator_type, locator_value),
+            self._locate(locator_type, locator_value),
+            lambda el: el.click()
+        )
 
     def send_keys(self, locator_type, locator_value, text):
-        el = self.find_element(locator_type, locator_value)
-        el.clear()
-        el.send_keys(text)
+        def type_text(el):
+            el.clear()
+            el.send_keys(text)
+
+        self.act((locator_type, locator_value), self._locate(locator_type, locator_value), type_text)
 
     def wait_for_element(self, locator_type, locator_value, timeout=10):
-        WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((getattr(By, locator_type.upper()), locator_value))
-        )
+        cached = self.cached((locator_type, locator_value))
+        if cached is not None:
+            return cached
+        el = self.wait_engine.wait(getattr(By, locator_type.upper()), locator_value, "present", timeout)
+        return self.remember((locator_type, locator_value), el)
+
+    def resolve_elements(self, locators):
+        """Resolve [(locator_type, locator_value), ...] with a single execute_script.
+
+        Returns a list of WebElements in the same order; None where an
+        element was not found.
+        """
+        payload = [[by.lower().replace("_", " "), value] for by, value in locators]
+        return self.driver.execute_script(RESOLVE_ELEMENTS_JS, payload)
 
     def quit(self):
         if self.driver:
             try:
                 self.driver.quit()
             finally:
-                SingletonDriver.reset()
+                SingletonDriver.release(self._registry_key or 'web')
+                self.driver = None
+                self._release_session_dirs()
+
+    def _release_session_dirs(self):
+        for path in self._temp_dirs:
+            shutil.rmtree(path, ignore_errors=True)
+        self._temp_dirs = []
+        if self._cache_slot is not None:
+            BrowserOptionsBuilder.release_disk_cache(self._cache_slot)
+            self._cache_slot = None
@@ -14,8 +14,8 @@ It provides:
 Core Responsibilities
 ---------------------
 1. Driver abstraction (Web / Mobile / Desktop)
-2. Safe UI interactions (click, enter_text, get_text)
-3. Retry + self-healing mechanism
+2. Safe UI interactions (click, enter_text, get_text, fill_form, click_sequence)
+3. Retry + self-healing mechanism (healed locators persisted across runs)
 4. Failure capture with diagnostics
 5. Reporting & logging consistency
 
@@ -27,11 +27,16 @@ Design Principles
 - Extensible for platform specialization
 """
 
-import time
 import traceback
+from contextlib import nullcontext
+
 import allure
 
 from utils.self_healing import SelfHealingEngine
+from utils.healed_locator_store import HealedLocatorStore
+from utils.retry_policy import RetryPolicy
+from utils.screenshots import ScreenshotRecorder
+from utils.attachments import AttachmentSink
 
 # Selenium exceptions
 from selenium.common.exceptions import (
@@ -56,11 +61,16 @@ except Exception:
 
 from core.configManager import ConfigManager
 from core.logger import get_logger, log_allure
+from core.profiler import StepProfiler
 
 
 class BasePage:
     """Base class for all Page Objects providing safe & intelligent UI interactions."""
 
+    # Opt-in page-scoped element cache (web): True / False per page class,
+    # None follows element_cache.enabled in config.yaml
+    ELEMENT_CACHE = None
+
     RETRY_EXCEPTIONS = (
         # StaleElementReferenceException,
         # NoSuchElementException,
@@ -70,77 +80,165 @@ class BasePage:
 
     def __init__(self, driver):
         self.driver = driver
-        self.RETRIES = ConfigManager.get_retry_count("step_retry")
+        self.retry_policy = RetryPolicy.from_config()
+        self.RETRIES = self.retry_policy.max_retries
+        self._wait_timeout = self.retry_policy.attempt_timeout
         self.logger = get_logger(self.__class__.__name__)
+        # Per-attempt lines; logging.hot_path_level keeps them off the I/O path
+        self.step_logger = get_logger(f"{self.__class__.__name__}.steps", hot_path=True)
         self.healer = SelfHealingEngine(driver)
+        self.screenshots = ScreenshotRecorder(driver)
+
+        if self.ELEMENT_CACHE is None:
+            self._use_element_cache = bool(ConfigManager.get("element_cache", "enabled"))
+        else:
+            self._use_element_cache = self.ELEMENT_CACHE
 
     # ------------------------------------------------------------------
     # SAFE ACTION EXECUTOR WITH SELF-HEALING + DEBUG TRACE
     # ------------------------------------------------------------------
-    def _safe_action(self, action_name, func, locator, *args):
+    def _safe_action(self, action_name, func, locator, *args, retry_policy=None):
         """
         Executes an action safely with:
-        - Retry logic
+        - Retry logic (RetryPolicy: backoff, budgets, step deadline)
         - Screenshot capture
         - Self-healing on locator failure
         - Allure step tracking
+        - Timing spans (StepProfiler) for the per-test profile
+
+        retry_policy overrides the page-level policy for this call only.
         """
 
-        healed_locator = None
-        healing_applied = False
+        with StepProfiler.span("step", action_name):
+            state = (retry_policy or self.retry_policy).start()
+            healed_locator = None
+            healing_applied = False
+
+            # 💾 Known-broken locator → go straight to its stored replacement
+            stored_locator = HealedLocatorStore.lookup(locator)
+            if stored_locator:
+                self._wait_timeout = state.attempt_timeout()
+                state.begin_attempt()
+                try:
+                    with StepProfiler.span("attempt", "stored healed locator"), \
+                            allure.step(f"{action_name} (Stored healed locator)"), self._element_scope():
+                        self.step_logger.info("%s - using stored healed locator %s", action_name, stored_locator)
+                        result = func(stored_locator, *args)
+                    HealedLocatorStore.mark_verified(locator)
+                    state.finish()
+                    return result
+
+                except Exception as e:
+                    state.attempt_failed()
+                    if self._is_locator_failure(e):
+                        self.logger.warning(
+                            f"Stored healed locator {stored_locator} no longer works, evicting"
+                        )
+                        HealedLocatorStore.evict(locator)
+                    else:
+                        # Locator still resolves; keep it for the regular retries
+                        healed_locator = stored_locator
+                        healing_applied = True
 
-        for attempt in range(1, self.RETRIES + 2):
+            attempt = 0
+            while True:
+                attempt += 1
+                self._wait_timeout = state.attempt_timeout()
+                state.begin_attempt()
 
-            try:
-                with allure.step(f"{action_name} (Attempt {attempt})"):
-                    self.logger.info(f"{action_name} - Attempt {attempt}")
+                try:
+                    with StepProfiler.span("attempt", f"attempt {attempt}"), \
+                            allure.step(f"{action_name} (Attempt {attempt})"), self._element_scope():
+                        self.step_logger.info("%s - Attempt %d", action_name, attempt)
 
-                    active_locator = healed_locator if healed_locator else locator
-                    return func(active_locator, *args)
+                        active_locator = healed_locator if healed_locator else locator
+                        result = func(active_locator, *args)
 
-            except Exception as e:
+                except Exception as e:
+                    state.attempt_failed()
 
-                self.logger.error(
-                    f"[Attempt {attempt}] {action_name} failed with {type(e).__name__}: {str(e)}"
-                )
+                    self.logger.error(
+                        f"[Attempt {attempt}] {action_name} failed with {type(e).__name__}: {str(e)}"
+                    )
 
-                # 📸 Screenshot on every failed attempt
-                self._attach_screenshot(f"{action_name}_Attempt_{attempt}_Failure")
+                    # 🧠 Self-healing trigger (once per action, doesn't use up a retry)
+                    if not healing_applied and self._is_locator_failure(e) \
+                            and state.retry_refusal(e, count=False) is None:
 
-                # 🧠 Self-healing trigger (once per action)
-                if not healing_applied and self._is_locator_failure(e):
+                        self.logger.warning(f"Triggering self-healing for {locator}")
+                        with StepProfiler.span("heal"):
+                            healed_locator = self.healer.self_heal_locator(locator)
 
-                    self.logger.warning(f"Triggering self-healing for {locator}")
-                    healed_locator = self.healer.self_heal_locator(locator)
+                        if healed_locator:
+                            healing_applied = True
+                            self.logger.info(
+                                f"✅ Self-healed locator applied: {locator} → {healed_locator}"
+                            )
 
-                    if healed_locator:
-                        healing_applied = True
-                        self.logger.info(
-                            f"✅ Self-healed locator applied: {locator} → {healed_locator}"
-                        )
+                            AttachmentSink.attach(
+                                f"Healed from {locator} to {healed_locator}",
+                                name="Self-Healing Triggered",
+                                attachment_type=allure.attachment_type.TEXT
+                            )
 
-                        allure.attach(
-                            f"Healed from {locator} to {healed_locator}",
-                            name="Self-Healing Triggered",
-                            attachment_type=allure.attachment_type.TEXT
-                        )
+                            self._attach_screenshot(f"{action_name}_Attempt_{attempt}_Failure", attempt)
+                            continue  # retry using healed locator
 
-                        continue  # retry using healed locator
+                    # Retry logic
+                    refusal = state.retry_refusal(e)
 
-                # Retry logic
-                if attempt <= self.RETRIES:
-                    self.logger.warning(
-                        f"Retrying {attempt}/{self.RETRIES} after failure..."
+                    # 📸 Screenshot per capture policy (screenshots.policy)
+                    self._attach_screenshot(
+                        f"{action_name}_Attempt_{attempt}_Failure", attempt, final=refusal is not None
                     )
-                    time.sleep(0.3)
-                    continue
 
-                # ❌ Final failure
-                return self._fail(
-                    action_name,
-                    f"Failed after {self.RETRIES} retries ({type(e).__name__})",
-                    e
-                )
+                    if refusal is None:
+                        with StepProfiler.span("retry_sleep"):
+                            delay = state.backoff(e)
+                        self.logger.warning(
+                            f"Retrying {state.retries}/{state.policy.max_retries} "
+                            f"in {delay:.2f}s after failure..."
+                        )
+                        continue
+
+                    # ❌ Final failure
+                    state.finish()
+                    self.screenshots.flush()
+                    return self._fail(
+                        action_name,
+                        f"Failed after {state.retries} retries ({type(e).__name__}; {refusal})",
+                        e
+                    )
+
+                else:
+                    state.finish()
+                    self.screenshots.flush()
+                    if healed_locator:
+                        self._remember_healing(locator, healed_locator)
+                    return result
+
+    def _element_scope(self):
+        """Cache located elements for one attempt (wait → action = one lookup).
+
+        With the page element cache enabled, elements also carry over to
+        later steps until the page navigates or its DOM changes.
+        """
+        if hasattr(self.driver, "step_scope"):
+            return self.driver.step_scope(page_cache=self._use_element_cache)
+        return nullcontext()
+
+    def _remember_healing(self, locator, healed_locator):
+        """Persist a heal that just worked so later steps skip the broken locator."""
+        if HealedLocatorStore.lookup(locator) == healed_locator:
+            HealedLocatorStore.mark_verified(locator)
+            return
+
+        real_driver = getattr(self.driver, "driver", self.driver)
+        try:
+            url = real_driver.current_url
+        except Exception:
+            url = None
+        HealedLocatorStore.record(locator, healed_locator, url)
 
     def _is_locator_failure(self, exception):
         # primary: by type
@@ -159,22 +257,13 @@ class BasePage:
     # ------------------------------------------------------------------
     # SCREENSHOT HELPER
     # ------------------------------------------------------------------
-    def _attach_screenshot(self, name):
-        """Attach screenshot safely to Allure report."""
-        try:
-            if hasattr(self.driver, "driver"):
-                real_driver = self.driver.driver
-            else:
-                real_driver = self.driver
-
-            if hasattr(real_driver, "get_screenshot_as_png"):
-                allure.attach(
-                    real_driver.get_screenshot_as_png(),
-                    name=name,
-                    attachment_type=allure.attachment_type.PNG
-                )
-        except Exception as e:
-            self.logger.warning(f"Screenshot capture failed: {e}")
+    def _attach_screenshot(self, name, attempt=1, final=False):
+        """Capture a failure screenshot if the capture policy asks for it.
+
+        Frames are attached to Allure when the step ends (or, for the
+        ring_buffer policy, only if the test fails).
+        """
+        self.screenshots.capture(name, attempt, final)
 
     # ------------------------------------------------------------------
     # FAILURE HANDLER
@@ -186,7 +275,7 @@ class BasePage:
         self.logger.error(error_msg)
         self.logger.debug(traceback.format_exc())
 
-        allure.attach(
+        AttachmentSink.attach(
             f"{type(exception_obj).__name__}: {str(exception_obj)}",
             name="Failure Reason",
             attachment_type=allure.attachment_type.TEXT
@@ -198,22 +287,23 @@ class BasePage:
     # PUBLIC INTERACTION WRAPPERS
     # ------------------------------------------------------------------
 
-    def click(self, locator_type, locator_value):
+    def click(self, locator_type, locator_value, retry_policy=None):
         locator = (locator_type, locator_value)
         action_name = f"Clicking element {locator}"
 
         return self._safe_action(
             action_name,
             self._click,
-            locator
+            locator,
+            retry_policy=retry_policy
         )
 
     def _click(self, locator):
-        self.driver.wait_for_element(*locator)
+        self.driver.wait_for_element(*locator, timeout=self._wait_timeout)
         self.driver.click(*locator)
 
 
-    def enter_text(self, locator_type, locator_value, text):
+    def enter_text(self, locator_type, locator_value, text, retry_policy=None):
         locator = (locator_type, locator_value)
         action_name = f"Entering text into {locator}"
 
@@ -221,29 +311,94 @@ class BasePage:
             action_name,
             self._enter_text,
             locator,
-            text
+            text,
+            retry_policy=retry_policy
         )
 
     def _enter_text(self, locator, text):
-        self.driver.wait_for_element(*locator)
+        self.driver.wait_for_element(*locator, timeout=self._wait_timeout)
         self.driver.send_keys(*locator, text)
 
-    def get_text(self, locator_type, locator_value):
+    def get_text(self, locator_type, locator_value, retry_policy=None):
         locator = (locator_type, locator_value)
         action_name = f"Fetching text from {locator}"
 
         return self._safe_action(
             action_name,
             self._get_text,
-            locator
+            locator,
+            retry_policy=retry_policy
         )
 
     def _get_text(self, locator):
+        if hasattr(self.driver, "get_text"):
+            return self.driver.get_text(*locator)
         el = self.driver.find_element(*locator)
         return el.text if el else None
     
 
-    def desktop_click(self, locator_dict):
+    # ------------------------------------------------------------------
+    # BATCHED INTERACTIONS
+    # ------------------------------------------------------------------
+    def fill_form(self, fields, retry_policy=None):
+        """
+        Fill several inputs with a handful of round trips.
+
+        fields: {(locator_type, locator_value): text, ...} or a list of
+        (locator, text) pairs, filled in order.
+
+        All elements are resolved in one execute_script call and typed into
+        directly; any field that is missing or fails is retried through
+        enter_text() (waits, retries, self-healing).
+        """
+        pairs = list(fields.items()) if isinstance(fields, dict) else list(fields)
+
+        def type_into(element, text):
+            element.clear()
+            element.send_keys(text)
+
+        with allure.step(f"Filling {len(pairs)} field(s)"):
+            self._batch_actions(
+                [(locator, type_into, (text,)) for locator, text in pairs],
+                lambda locator, text: self.enter_text(*locator, text, retry_policy=retry_policy)
+            )
+
+    def click_sequence(self, *locators, retry_policy=None):
+        """
+        Click several elements in order, resolving them in one round trip.
+
+        Only elements present when the sequence starts are clicked directly;
+        the rest (and any that fail) fall back to click() with self-healing.
+        """
+        with allure.step(f"Clicking {len(locators)} element(s)"):
+            self._batch_actions(
+                [(locator, lambda element: element.click(), ()) for locator in locators],
+                lambda locator: self.click(*locator, retry_policy=retry_policy)
+            )
+
+    def _batch_actions(self, actions, fallback):
+        """Run (locator, action(element, *args), args) items on pre-resolved elements."""
+        active = [HealedLocatorStore.lookup(locator) or locator for locator, _, _ in actions]
+        elements = [None] * len(actions)
+
+        if hasattr(self.driver, "resolve_elements"):
+            try:
+                elements = self.driver.resolve_elements(active)
+            except Exception as e:
+                self.logger.warning(f"Batch resolve failed, acting per element: {e}")
+
+        for (locator, action, args), element in zip(actions, elements):
+            if element is not None:
+                try:
+                    action(element, *args)
+                    continue
+                except Exception as e:
+                    self.logger.warning(
+                        f"Batched action on {locator} failed with {type(e).__name__}, falling back"
+                    )
+            fallback(locator, *args)
+
+    def desktop_click(self, locator_dict, retry_policy=None):
         """
         Safe click for Desktop UI elements (pywinauto).
         locator_dict is a dictionary of UIA properties:
@@ -253,7 +408,8 @@ class BasePage:
         return self._safe_action(
             action_name,
             self._desktop_click,
-            locator_dict
+            locator_dict,
+            retry_policy=retry_policy
         )
 
 
@@ -261,14 +417,8 @@ class BasePage:
         """
         Actual click logic for Desktop.
         """
-        # get main window from driver (DesktopDriverManager exposes main_window)
-        window = self.driver.main_window
-
-        # locate child element
-        element = window.child_window(**locator_dict)
-
-        # wait for element to exist & be ready
-        element.wait("exists ready", timeout=4)
+        # wait for element to exist & be ready (DesktopDriverManager caches it)
+        self.driver.wait_for_element(locator_dict, timeout=4)
 
-        # perform click
-        element.click_input()    
\ No newline at end of file
+        # perform click on the element resolved by the wait
+        self.driver.click(locator_dict)    
\ No newline at end of file
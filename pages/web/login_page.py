@@ -31,6 +31,14 @@ class LoginPage(BasePage):
         with allure.step("Enter password"):
             self.enter_text(*LoginPageLocators.PASSWORD_INPUT, password)
 
+    def fill_credentials(self, username, password):
+        self.logger.info("Entering username and password")
+        with allure.step("Enter credentials"):
+            self.fill_form({
+                LoginPageLocators.USERNAME_INPUT: username,
+                LoginPageLocators.PASSWORD_INPUT: password,
+            })
+
     def click_login(self):
         self.logger.info("Clicking Login button")
         with allure.step("Click Login button"):
@@ -39,5 +47,11 @@ class LoginPage(BasePage):
     def is_login_successful(self):
         self.logger.info("Checking if login was successful")
         with allure.step("Check if login was successful"):
-            return self.driver.find_element(*LoginPageLocators.SUCCESS_MESSAGE).is_displayed()
+            # Success and error banners are awaited together, so a failed login
+            # fails as soon as the error shows instead of after the full timeout
+            outcome, _ = self.wait.wait_for_any([
+                (*LoginPageLocators.SUCCESS_MESSAGE, "visible", None, "success"),
+                (*LoginPageLocators.ERROR_MESSAGE, "visible", None, "error"),
+            ])
+            return outcome == "success"
 
@@ -1,3 +1,4 @@
 #!/bin/bash
-pytest -m desktop --platform desktop --alluredir=reports/allure-results --clean-alluredir
-allure serve reports/allure-results
\ No newline at end of file
+# One session for all platforms; targets and per-platform workers: matrix in config.yaml
+pytest --matrix all --alluredir=reports/allure-results --clean-alluredir
+allure serve reports/allure-results
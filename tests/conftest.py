@@ -0,0 +1,120 @@
+"""
+Shared fixtures for the framework unit tests.
+
+``config``, ``class_state`` and ``workdir`` isolate a test from the
+session: config.yaml overrides, class-level caches and relative report
+paths are all restored / redirected when the test ends.
+
+``xdist_session`` runs a throwaway pytest session under xdist with this
+repository's conftest.py and pytest.ini, so scheduling behaviour (worker
+groups, resource pinning) is tested the way a real run schedules it.
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+from core.configManager import ConfigManager
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture
+def config(monkeypatch):
+    """Replace config.yaml sections for one test: ``config("timings", enabled=True)``."""
+    ConfigManager.load()
+
+    def override(section, **values):
+        monkeypatch.setitem(ConfigManager._config, section, values)
+        return values
+
+    return override
+
+
+@pytest.fixture
+def class_state(monkeypatch):
+    """Reset class-level state for one test: ``class_state(TimingStore, _history=None)``."""
+    def reset(cls, **attributes):
+        for name, value in attributes.items():
+            monkeypatch.setattr(cls, name, value)
+        return cls
+
+    return reset
+
+
+@pytest.fixture
+def workdir(monkeypatch, tmp_path):
+    """Run the test in tmp_path, so files it writes under reports/ stay out of the repository."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def xdist_session(tmp_path):
+    """Run ``tests`` (module name → source) on ``workers`` xdist workers.
+
+    The session runs as a subprocess in tmp_path. ``setup`` is the source
+    of a conftest.py next to the tests, e.g. to change the config before
+    collection. Tests record where they ran with the ``placement``
+    fixture. Returns the run result (pytest.RunResult) and one dict per
+    test: {"nodeid", "worker", ...extra fields}. A session that hangs
+    (e.g. two workers waiting for one device) fails after 120 s.
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+
+    def run(tests, workers=2, setup="", args=()):
+        for name in ("conftest.py", "pytest.ini"):
+            shutil.copy(os.path.join(ROOT, name), tmp_path / name)
+
+        suite = tmp_path / "tests"
+        suite.mkdir()
+        (suite / "__init__.py").write_text("", encoding="utf-8")
+        (suite / "conftest.py").write_text(setup + PLACEMENT_FIXTURE, encoding="utf-8")
+        for module, source in tests.items():
+            (suite / f"{module}.py").write_text(source, encoding="utf-8")
+
+        command = [sys.executable, "-m", "pytest", "-n", str(workers), "-p", "no:cacheprovider",
+                   f"--basetemp={tmp_path / 'basetemp'}", *args]
+        start = time.perf_counter()
+        try:
+            completed = subprocess.run(command, cwd=tmp_path, env=env, capture_output=True,
+                                       text=True, timeout=120)
+        except subprocess.TimeoutExpired as e:
+            pytest.fail(f"xdist session did not finish within 120 s:\n{e.stdout or ''}")
+        result = pytest.RunResult(completed.returncode, completed.stdout.splitlines(),
+                                  completed.stderr.splitlines(), time.perf_counter() - start)
+
+        placement_dir = tmp_path / "placement"
+        placements = [
+            json.loads(path.read_text(encoding="utf-8"))
+            for path in sorted(placement_dir.iterdir())
+        ] if placement_dir.exists() else []
+        return result, placements
+
+    return run
+
+
+PLACEMENT_FIXTURE = '''
+
+import json as _json
+import os as _os
+import uuid as _uuid
+
+import pytest as _pytest
+
+
+@_pytest.fixture
+def placement(request):
+    """Call with extra fields to record which worker ran this test."""
+    def record(**fields):
+        directory = request.config.rootpath / "placement"
+        directory.mkdir(exist_ok=True)
+        entry = {"nodeid": request.node.nodeid,
+                 "worker": _os.environ.get("PYTEST_XDIST_WORKER", "master"), **fields}
+        (directory / f"{_uuid.uuid4().hex}.json").write_text(_json.dumps(entry))
+    return record
+'''
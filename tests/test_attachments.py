@@ -0,0 +1,60 @@
+"""Unit tests for AttachmentSink (runs under the Allure listener from pytest.ini)."""
+import os
+
+import allure
+import pytest
+from allure_commons.model2 import ExecutableItem
+
+from utils.attachments import AttachmentSink
+
+
+@pytest.fixture
+def results_dir(request):
+    report_dir = request.config.option.allure_report_dir
+    if not report_dir or AttachmentSink._reporter() is None:
+        pytest.skip("needs the Allure listener (--alluredir)")
+    return os.path.abspath(report_dir)
+
+
+def current_attachments():
+    return AttachmentSink._reporter().get_last_item(ExecutableItem).attachments
+
+
+def test_attachment_is_registered_on_the_step_and_written(results_dir):
+    with allure.step("step with attachment"):
+        AttachmentSink.attach("hello", name="greeting", attachment_type=allure.attachment_type.TEXT)
+        attachment = current_attachments()[-1]
+    AttachmentSink.flush()
+
+    assert attachment.name == "greeting"
+    assert attachment.type == "text/plain"
+    with open(os.path.join(results_dir, attachment.source), encoding="utf-8") as f:
+        assert f.read() == "hello"
+
+
+def test_identical_payloads_share_one_file(results_dir):
+    AttachmentSink.attach(b"same body", name="first", extension="bin")
+    AttachmentSink.attach(b"same body", name="second", extension="bin")
+    AttachmentSink.flush()
+
+    first, second = current_attachments()[-2:]
+    assert first.source == second.source
+    assert os.path.exists(os.path.join(results_dir, first.source))
+
+
+def test_dedupe_memory_is_bounded(results_dir, config):
+    config("attachments", dedupe=True, dedupe_window=3, **{"async": True})
+    for n in range(10):
+        AttachmentSink.attach(f"body {n}", name=f"n{n}")
+    AttachmentSink.flush()
+
+    assert len(AttachmentSink._written) <= 3
+
+
+def test_writer_outlives_every_attaching_fixture(request):
+    # Set up first, so torn down last: after the fixtures that attach
+    order = request.fixturenames
+    writer = order.index("attachment_writer")
+
+    for name in ("screenshot_buffer", "step_profile", "command_trace"):
+        assert order.index(name) > writer, name
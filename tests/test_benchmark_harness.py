@@ -0,0 +1,47 @@
+"""Unit tests for the benchmark harness result store and comparison."""
+import os
+
+import pytest
+
+from benchmarks.harness import ResultStore, compare, summarize
+
+
+def bench(name, median):
+    return {"name": name, "stats": {"median": median}}
+
+
+@pytest.mark.parametrize("commit, expected", [
+    ("abc1234", "0001_abc1234.json"),
+    (("abc1234", True), "0001_abc1234_dirty.json"),
+    (("abc1234", False), "0001_abc1234.json"),
+])
+def test_save_accepts_commit_id_or_commit_info(tmp_path, commit, expected):
+    path = ResultStore(str(tmp_path)).save([bench("a", 1.0)], commit=commit)
+
+    assert os.path.basename(path) == expected
+    assert ResultStore(str(tmp_path)).load("latest")["commit"]["id"] == "abc1234"
+
+
+def test_runs_are_numbered_and_loadable(tmp_path):
+    store = ResultStore(str(tmp_path))
+    store.save([bench("a", 1.0)], commit="one")
+    store.save([bench("a", 2.0)], commit="two")
+
+    assert store.load("0001")["commit"]["id"] == "one"
+    assert store.load("latest")["commit"]["id"] == "two"
+    assert store.load("0009") is None
+
+
+def test_compare_flags_slower_medians_only():
+    baseline = {"benchmarks": [bench("a", 1.0), bench("b", 1.0)]}
+    rows, regressions = compare([bench("a", 1.2), bench("b", 0.5), bench("c", 1.0)], baseline, 0.10)
+
+    assert regressions == ["a"]
+    assert rows[-1] == ("c", None, 1.0, None)
+
+
+def test_summarize_single_sample():
+    stats = summarize([0.5])
+
+    assert stats["median"] == 0.5
+    assert stats["stddev"] == 0.0
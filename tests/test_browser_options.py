@@ -0,0 +1,89 @@
+"""Unit tests for BrowserOptionsBuilder launch profiles."""
+import pytest
+from selenium import webdriver
+
+from core.browser_options import BrowserOptionsBuilder
+
+
+@pytest.fixture
+def cache_root(config, class_state, tmp_path):
+    root = tmp_path / "browser-cache"
+    config("browser_profiles", default={"disk_cache_dir": str(root)})
+    class_state(BrowserOptionsBuilder, _cache_slots=set())
+    return root
+
+
+def chrome_cache_dir(options):
+    return next(arg.split("=", 1)[1] for arg in options.arguments if arg.startswith("--disk-cache-dir="))
+
+
+@pytest.mark.parametrize("worker", ["gw0", "gw3"])
+def test_chrome_disk_cache_is_per_worker(monkeypatch, cache_root, worker):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+    options = BrowserOptionsBuilder.build("chrome")
+
+    BrowserOptionsBuilder.attach_disk_cache(options, "chrome")
+
+    assert chrome_cache_dir(options) == str(cache_root / worker / "0")
+    assert (cache_root / worker / "0").is_dir()
+
+
+def test_firefox_disk_cache_uses_the_profile_pref(monkeypatch, cache_root):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    options = BrowserOptionsBuilder.build("firefox")
+
+    BrowserOptionsBuilder.attach_disk_cache(options, "firefox")
+
+    assert options.preferences["browser.cache.disk.parent_directory"] == str(cache_root / "gw1" / "0")
+
+
+def test_live_sessions_never_share_a_cache_slot(monkeypatch, cache_root):
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    running, warming = webdriver.ChromeOptions(), webdriver.ChromeOptions()
+
+    first = BrowserOptionsBuilder.attach_disk_cache(running, "chrome")
+    BrowserOptionsBuilder.attach_disk_cache(warming, "chrome")
+    assert chrome_cache_dir(running) == str(cache_root / "main" / "0")
+    assert chrome_cache_dir(warming) == str(cache_root / "main" / "1")
+
+    # A quit session's slot (and its warm cache) goes to the next session
+    BrowserOptionsBuilder.release_disk_cache(first)
+    later = webdriver.ChromeOptions()
+    BrowserOptionsBuilder.attach_disk_cache(later, "chrome")
+    assert chrome_cache_dir(later) == str(cache_root / "main" / "0")
+
+
+def test_no_disk_cache_without_setting(config):
+    config("browser_profiles", default={})
+    options = BrowserOptionsBuilder.build("chrome")
+
+    assert BrowserOptionsBuilder.attach_disk_cache(options, "chrome") is None
+    assert not any(arg.startswith("--disk-cache-dir=") for arg in options.arguments)
+
+
+class FakeChrome:
+    def __init__(self, options):
+        self.options = options
+        self.capabilities = {}
+
+    def quit(self):
+        pass
+
+
+def test_web_driver_gives_its_slot_back_on_quit_and_failed_launch(monkeypatch, cache_root):
+    from core import web_driver
+    from core.web_driver import WebDriverManager
+
+    monkeypatch.setattr(web_driver.webdriver, "Chrome", FakeChrome)
+    manager = WebDriverManager("chrome").get_driver()
+    assert BrowserOptionsBuilder._cache_slots == {0}
+    manager.quit()
+    assert BrowserOptionsBuilder._cache_slots == set()
+
+    def refuse(options):
+        raise RuntimeError("chromedriver missing")
+
+    monkeypatch.setattr(web_driver.webdriver, "Chrome", refuse)
+    with pytest.raises(RuntimeError):
+        WebDriverManager("chrome").get_driver()
+    assert BrowserOptionsBuilder._cache_slots == set()
@@ -0,0 +1,58 @@
+"""Unit tests for CommandTrace redundancy detection."""
+import pytest
+
+from core.command_tracer import CommandTrace
+from core.dom_scripts import RESOLVE_ELEMENTS_JS
+from core.page_element_cache import PAGE_TOKEN_JS
+
+FIND = ("findElement", {"using": "css selector", "value": '[id="username"]'})
+FOUND = {"value": {"element-6066-11e4-a52e-4f735466cecf": "e1"}}
+
+
+def run(trace, *commands, response=FOUND):
+    for command, params in commands:
+        trace.record(command, params, 0.001, 0, response)
+
+
+def test_repeated_find_is_flagged():
+    trace = CommandTrace("t")
+    run(trace, FIND, ("getElementText", {}), FIND)
+
+    assert trace.redundant == {'repeated find: css selector=[id="username"]': 1}
+
+
+def test_click_between_finds_is_not_redundant():
+    trace = CommandTrace("t")
+    run(trace, FIND, ("clickElement", {}), FIND)
+
+    assert trace.redundant == {}
+
+
+@pytest.mark.parametrize("command", ["executeScript", "w3cExecuteScript"])
+def test_arbitrary_script_may_change_the_page(command):
+    trace = CommandTrace("t")
+    run(trace, FIND, (command, {"script": "document.body.innerHTML = ''", "args": []}), FIND)
+
+    assert trace.redundant == {}
+
+
+@pytest.mark.parametrize("script", [RESOLVE_ELEMENTS_JS, PAGE_TOKEN_JS])
+def test_framework_read_only_scripts_keep_earlier_finds(script):
+    trace = CommandTrace("t")
+    run(trace, FIND, ("w3cExecuteScript", {"script": script, "args": []}), FIND)
+
+    assert len(trace.redundant) == 1
+
+
+@pytest.mark.parametrize("response", [
+    {"status": 404, "value": {"error": "no such element", "message": "Unable to locate element"}},
+    {"value": {"error": "no such element", "message": "Unable to locate element"}},
+    {"value": []},
+    None,
+])
+def test_failed_polls_are_not_located(response):
+    trace = CommandTrace("t")
+    run(trace, FIND, FIND, FIND, response=response)
+    run(trace, FIND)
+
+    assert trace.redundant == {}
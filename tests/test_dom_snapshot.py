@@ -0,0 +1,113 @@
+"""Unit tests for DomSnapshot and the per-page-state snapshot cache."""
+import gc
+import weakref
+from collections import OrderedDict
+
+import pytest
+from bs4 import Tag
+from selenium.common.exceptions import WebDriverException
+
+from benchmarks.fake_driver import FakeWebDriver, fixture_html
+from core.dom_scripts import SNAPSHOT_TOKEN_JS
+from utils.dom_snapshot import DomSnapshot, DomSnapshotCache
+from utils.self_healing import SelfHealingEngine
+
+
+class SnapshotTokenDriver(FakeWebDriver):
+    """FakeWebDriver answering SNAPSHOT_TOKEN_JS; mutate() changes the page."""
+
+    def __init__(self, html, **options):
+        super().__init__(html, **options)
+        self.version = 0
+
+    def execute_script(self, script, *args):
+        self._command("executeScript")
+        assert script == SNAPSHOT_TOKEN_JS
+        return ["doc-1", self.version, self._url]
+
+    def mutate(self):
+        self.version += 1
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(class_state):
+    class_state(DomSnapshotCache, _snapshots=OrderedDict())
+
+
+def test_unchanged_page_reuses_the_snapshot_without_page_source():
+    driver = SnapshotTokenDriver(fixture_html())
+
+    first = DomSnapshotCache.get(driver)
+    second = DomSnapshotCache.get(driver)
+
+    assert second is first
+    assert driver.commands["getPageSource"] == 1
+    assert driver.commands["getCurrentUrl"] == 0
+    assert driver.commands["executeScript"] == 2
+    assert first.url == "https://bench.local/login"
+
+
+def test_mutation_takes_a_new_snapshot():
+    driver = SnapshotTokenDriver(fixture_html())
+    first = DomSnapshotCache.get(driver)
+
+    driver.mutate()
+
+    assert DomSnapshotCache.get(driver) is not first
+    assert driver.commands["getPageSource"] == 2
+
+
+class NativeContextDriver(FakeWebDriver):
+    """Like an Appium native context: no page scripts."""
+
+    def execute_script(self, script, *args):
+        self._command("executeScript")
+        raise WebDriverException("Method is not implemented")
+
+
+def test_drivers_without_scripts_fall_back_to_content_hash():
+    driver = NativeContextDriver(fixture_html())
+
+    first = DomSnapshotCache.get(driver)
+    second = DomSnapshotCache.get(driver)
+
+    assert second is first
+    assert driver.commands["getPageSource"] == 2
+    # The token is not asked for again once the driver refused it
+    assert driver.commands["executeScript"] == 1
+
+
+def test_snapshot_keeps_values_only():
+    html = '<div id="a" class="x y"><input id="b" name="user"><span id="a"></span></div>'
+    snapshot = DomSnapshot("https://bench.local/", html)
+
+    assert snapshot.values("id") == ["a", "b"]
+    assert snapshot.values("class") == ["x y"]
+    assert all(not isinstance(value, Tag) for attr in snapshot.attributes() for value in snapshot.values(attr))
+
+
+def test_parsed_tree_is_released(monkeypatch):
+    import utils.dom_snapshot as module
+    soups = []
+    original = module.BeautifulSoup
+
+    def tracked(*args, **kwargs):
+        soup = original(*args, **kwargs)
+        soups.append(weakref.ref(soup))
+        return soup
+
+    monkeypatch.setattr(module, "BeautifulSoup", tracked)
+    snapshot = DomSnapshot("https://bench.local/", fixture_html(200))
+    gc.collect()
+
+    assert snapshot.values("id")
+    assert soups[0]() is None
+
+
+def test_heals_reuse_one_snapshot_per_page_state(workdir):
+    driver = SnapshotTokenDriver(fixture_html(200))
+    healer = SelfHealingEngine(driver)
+
+    assert healer.self_heal_locator(("id", "usernme")) == ("id", "username")
+    assert healer.self_heal_locator(("id", "pasword")) == ("id", "password")
+    assert driver.commands["getPageSource"] == 1
@@ -0,0 +1,126 @@
+"""Unit tests for DriverWarmup queueing and spawn budgets."""
+import itertools
+
+import pytest
+
+from core.driver_warmup import DriverWarmup
+
+KEY = "web-chrome"
+
+
+class FakeManager:
+    def __init__(self, number):
+        self.number = number
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def warmup(config, class_state):
+    config("warmup", enabled=True, ahead=2)
+    class_state(DriverWarmup, _queues={}, _factories={}, _started={}, _allowed={})
+    created = []
+    numbers = itertools.count(1)
+
+    def factory():
+        manager = FakeManager(next(numbers))
+        created.append(manager)
+        return manager
+
+    yield factory, created
+    DriverWarmup.shutdown()
+
+
+def test_every_take_refills_the_queue_to_ahead(warmup):
+    factory, created = warmup
+    DriverWarmup.start(KEY, factory)
+
+    taken = [DriverWarmup.take(KEY).number for _ in range(5)]
+
+    assert taken == [1, 2, 3, 4, 5]
+    assert len(DriverWarmup._queues[KEY]) == 2
+
+
+def test_limit_caps_spawns_and_quits_queued_extras(warmup):
+    factory, created = warmup
+    DriverWarmup.start(KEY, factory)
+
+    DriverWarmup.limit(KEY, 1)
+
+    assert DriverWarmup.take(KEY).number == 1
+    assert DriverWarmup.take(KEY) is None
+    assert [manager.quit_called for manager in created] == [False, True]
+
+
+def test_take_without_warmup_returns_none(warmup):
+    assert not DriverWarmup.started(KEY)
+    assert DriverWarmup.take(KEY) is None
+
+
+def test_shutdown_quits_unclaimed_sessions(warmup):
+    factory, created = warmup
+    DriverWarmup.start(KEY, factory, total=3)
+    DriverWarmup.take(KEY)
+
+    DriverWarmup.shutdown()
+
+    assert [manager.quit_called for manager in created] == [False, True, True]
+    assert DriverWarmup._queues == {}
+
+
+WORKER_TESTS = '''
+import pytest
+
+
+def test_with_driver(driver, placement):
+    placement(kind="driver", manager=driver.number)
+
+
+@pytest.mark.parametrize("n", range(6))
+def test_without_driver(n, placement):
+    placement(kind="plain")
+'''
+
+COUNTING_DRIVER = '''
+import itertools
+import json
+import os
+import uuid
+
+import conftest as root
+from core.configManager import ConfigManager
+
+ConfigManager.load()
+ConfigManager._config["warmup"] = {"enabled": True, "ahead": 1}
+_numbers = itertools.count(1)
+
+
+class CountingManager:
+    def __init__(self):
+        self.number = next(_numbers)
+
+    def quit(self):
+        pass
+
+
+def _create_driver(platform, config, browser=None, resource=None):
+    directory = config.rootpath / "spawns"
+    directory.mkdir(exist_ok=True)
+    (directory / uuid.uuid4().hex).write_text(os.environ.get("PYTEST_XDIST_WORKER", "master"))
+    return CountingManager()
+
+
+root._create_driver = _create_driver
+'''
+
+
+def test_workers_warm_up_only_after_their_first_driver_test(xdist_session, tmp_path):
+    result, placements = xdist_session({"test_warmup": WORKER_TESTS}, workers=2, setup=COUNTING_DRIVER)
+
+    result.assert_outcomes(passed=7)
+    driver_worker = next(entry["worker"] for entry in placements if entry["kind"] == "driver")
+    spawns = [path.read_text() for path in (tmp_path / "spawns").iterdir()]
+    # The driver test's session plus one refill; the other worker launches nothing
+    assert spawns == [driver_worker, driver_worker]
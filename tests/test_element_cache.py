@@ -0,0 +1,105 @@
+"""Unit tests for PageElementCache and the driver-level element cache."""
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from benchmarks.fake_driver import FakeDriverManager, FakeWebDriver
+from core.page_element_cache import PageElementCache
+from pages.base_page import BasePage
+from utils.retry_policy import RetryPolicy
+
+SUBMIT = ("id", "submit")
+
+
+class TokenDriver(FakeWebDriver):
+    """FakeWebDriver answering the page token script; bump() changes the page."""
+
+    def __init__(self, html, **options):
+        super().__init__(html, **options)
+        self.page = ["page-1", 0]
+
+    def execute_script(self, script, *args):
+        self._command("executeScript")
+        return list(self.page)
+
+    def bump(self):
+        self.page[1] += 1
+
+
+class CachingDriverManager(FakeDriverManager):
+    """FakeDriverManager with a page cache, like WebDriverManager."""
+
+    def get_driver(self):
+        self.driver = TokenDriver(self.html, **self.options)
+        self.page_cache = PageElementCache(self.driver)
+        return self
+
+
+@pytest.fixture
+def manager(workdir):
+    return CachingDriverManager().get_driver()
+
+
+@pytest.fixture
+def page(manager):
+    page = BasePage(manager)
+    page.retry_policy = RetryPolicy(max_retries=0, base_delay=0, jitter=0, attempt_timeout=0, deadline=None)
+    page._use_element_cache = True
+    return page
+
+
+def test_page_cache_serves_hits_until_the_token_changes(manager):
+    cache = manager.page_cache
+    element = manager.driver.find_element("id", "submit")
+    cache.put(SUBMIT, element)
+
+    assert cache.get(SUBMIT) is element
+    assert cache.get(SUBMIT) is element
+    assert manager.driver.commands["executeScript"] == 1
+
+    manager.driver.bump()
+    cache.mark_dirty()
+    assert cache.get(SUBMIT) is None
+
+
+def test_page_cache_clear_forgets_token(manager):
+    cache = manager.page_cache
+    cache.put(SUBMIT, manager.driver.find_element("id", "submit"))
+    cache.clear()
+
+    assert cache.get(SUBMIT) is None
+
+
+def test_elements_carry_over_between_steps(page, manager):
+    assert page.get_text(*SUBMIT) == "Submit"
+    assert page.get_text(*SUBMIT) == "Submit"
+
+    assert manager.driver.commands["findElement"] == 1
+
+
+def test_every_step_rechecks_the_page_token(page, manager):
+    page.get_text(*SUBMIT)
+    # The page changed between steps without any action of ours
+    manager.driver.bump()
+
+    assert page.get_text(*SUBMIT) == "Submit"
+    assert manager.driver.commands["findElement"] == 2
+
+
+def test_stale_cached_element_on_read_is_found_again(page, manager):
+    page.get_text(*SUBMIT)
+    manager.driver.fail("getElementText", StaleElementReferenceException)
+
+    assert page.get_text(*SUBMIT) == "Submit"
+    assert manager.driver.commands["findElement"] == 2
+    # The fresh element replaced the stale one in the page cache
+    assert page.get_text(*SUBMIT) == "Submit"
+    assert manager.driver.commands["findElement"] == 2
+
+
+def test_stale_cached_element_on_action_is_found_again(page, manager):
+    page.click(*SUBMIT)
+    manager.driver.fail("clickElement", StaleElementReferenceException)
+
+    page.click(*SUBMIT)
+
+    assert manager.driver.clicks == ["submit", "submit"]
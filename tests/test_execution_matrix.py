@@ -0,0 +1,122 @@
+"""Unit tests for ExecutionMatrix targets and worker groups."""
+from types import SimpleNamespace
+
+import pytest
+
+from core.execution_matrix import ExecutionMatrix, MatrixTarget
+
+MATRIX_TESTS = '''
+import pytest
+
+
+@pytest.mark.parametrize("n", range(4))
+def test_flow(n, matrix_target, placement):
+    placement(target=matrix_target.id)
+'''
+
+WORKER_LIMITS = '''
+from core.configManager import ConfigManager
+
+ConfigManager.load()
+ConfigManager._config["matrix"] = {"workers": {"mobile": 1, "desktop": 1}}
+'''
+
+
+class FakeItem:
+    def __init__(self, target=None, group=None):
+        self.callspec = SimpleNamespace(params={"matrix_target": target}) if target else None
+        self.markers = [("xdist_group", group)] if group else []
+
+    def get_closest_marker(self, name):
+        return next((marker for marker in self.markers if marker[0] == name), None)
+
+    def add_marker(self, marker):
+        self.markers.append(marker)
+
+    @property
+    def group(self):
+        marker = self.get_closest_marker("xdist_group")
+        return marker[1] if marker else None
+
+
+def test_targets_parse_spec_with_default_browser_and_dedupe():
+    targets = ExecutionMatrix.targets("web:Chrome, web:firefox,web,mobile,,desktop")
+
+    assert targets == [
+        MatrixTarget("web", "chrome"),
+        MatrixTarget("web", "firefox"),
+        MatrixTarget("mobile", None),
+        MatrixTarget("desktop", None),
+    ]
+    assert [target.id for target in targets] == ["web-chrome", "web-firefox", "mobile", "desktop"]
+
+
+def test_targets_all_uses_config(config):
+    config("matrix", targets=["web:firefox", "desktop"])
+
+    assert ExecutionMatrix.targets("all") == [MatrixTarget("web", "firefox"), MatrixTarget("desktop", None)]
+
+
+def test_targets_all_defaults_to_every_platform(config):
+    config("matrix")
+
+    assert [target.platform for target in ExecutionMatrix.targets("all")] == ["web", "mobile", "desktop"]
+
+
+@pytest.mark.parametrize("spec, message", [
+    ("tv", "Unknown matrix platform"),
+    ("mobile:chrome", "Only web targets take a browser"),
+    (" , ", "Empty execution matrix"),
+])
+def test_targets_reject_invalid_specs(spec, message):
+    with pytest.raises(ValueError, match=message):
+        ExecutionMatrix.targets(spec)
+
+
+def test_applicable_filters_by_platform_markers():
+    targets = ExecutionMatrix.targets("web:chrome,web:firefox,mobile")
+
+    assert ExecutionMatrix.applicable(targets, {"smoke"}) == targets
+    assert ExecutionMatrix.applicable(targets, {"mobile", "smoke"}) == [MatrixTarget("mobile", None)]
+    assert [t.id for t in ExecutionMatrix.applicable(targets, {"web"})] == ["web-chrome", "web-firefox"]
+
+
+def test_assign_groups_splits_limited_platforms_round_robin(config):
+    config("matrix", workers={"mobile": 2, "desktop": 1})
+    web, mobile, desktop = ExecutionMatrix.targets("web,mobile,desktop")
+    items = [FakeItem(mobile), FakeItem(web), FakeItem(mobile), FakeItem(desktop),
+             FakeItem(mobile), FakeItem(desktop), FakeItem()]
+
+    ExecutionMatrix.assign_groups(items, lambda group: ("xdist_group", group))
+
+    assert [item.group for item in items] == [
+        "matrix-mobile-0", None, "matrix-mobile-1", "matrix-desktop-0",
+        "matrix-mobile-0", "matrix-desktop-0", None,
+    ]
+
+
+def test_assign_groups_leaves_resource_pool_groups_alone(config):
+    config("matrix", workers={"mobile": 1})
+    mobile = MatrixTarget("mobile", None)
+    items = [FakeItem(mobile, group="mobile-1"), FakeItem(mobile)]
+
+    ExecutionMatrix.assign_groups(items, lambda group: ("xdist_group", group))
+
+    assert [item.group for item in items] == ["mobile-1", "matrix-mobile-0"]
+
+
+def test_worker_limited_platforms_stay_on_one_worker(xdist_session):
+    result, placements = xdist_session(
+        {"test_matrix": MATRIX_TESTS}, workers=3, setup=WORKER_LIMITS,
+        args=("--matrix", "web:chrome,mobile,desktop"),
+    )
+
+    result.assert_outcomes(passed=12)
+    workers = {}
+    for entry in placements:
+        workers.setdefault(entry["target"], set()).add(entry["worker"])
+        if entry["target"] != "web-chrome":
+            assert entry["nodeid"].endswith(f"@matrix-{entry['target']}-0"), entry
+
+    assert len(workers["mobile"]) == 1
+    assert len(workers["desktop"]) == 1
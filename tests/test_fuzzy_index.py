@@ -0,0 +1,67 @@
+"""Unit tests for CandidateIndex pruning against an exhaustive scan."""
+import random
+import string
+from difflib import SequenceMatcher
+
+import pytest
+
+from utils.fuzzy_index import CandidateIndex
+
+
+def exhaustive(values, query, k, threshold):
+    scored = [
+        (SequenceMatcher(None, query.lower(), value.lower()).ratio(), position, value)
+        for position, value in enumerate(values)
+    ]
+    ranked = sorted((s for s in scored if s[0] > threshold), key=lambda s: (-s[0], s[1]))
+    return [(value, score) for score, _, value in ranked[:k]]
+
+
+def synthetic_values(rng, count):
+    words = ["user", "name", "pass", "word", "submit", "login", "btn", "field", "input", "form"]
+    values = []
+    for _ in range(count):
+        parts = rng.sample(words, rng.randint(1, 3))
+        suffix = "".join(rng.choices(string.ascii_lowercase + string.digits, k=rng.randint(0, 4)))
+        values.append(rng.choice("-_").join(parts) + suffix)
+    return values
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("k, threshold", [(1, 0.7), (5, 0.5), (20, 0.3)])
+def test_top_k_matches_exhaustive_scan(seed, k, threshold):
+    rng = random.Random(seed)
+    values = synthetic_values(rng, 400)
+    index = CandidateIndex(values)
+
+    for query in ["usernme", "pasword", "submit-btn", "login_form", "x", rng.choice(values)]:
+        assert index.top_k(query, k, threshold) == exhaustive(values, query, k, threshold), query
+
+
+def test_ties_go_to_document_order():
+    index = CandidateIndex(["abcx", "abcy", "abcz"])
+
+    assert index.top_k("abcw", k=2, threshold=0.5) == [("abcx", 0.75), ("abcy", 0.75)]
+    assert index.best_match("abcw", threshold=0.5) == "abcx"
+
+
+def test_matching_ignores_case_but_returns_original_value():
+    index = CandidateIndex(["UserName", "password"])
+
+    assert index.top_k("USERNAME", k=1) == [("UserName", 1.0)]
+
+
+def test_threshold_is_exclusive_and_no_match_is_none():
+    index = CandidateIndex(["abcd"])
+
+    assert index.top_k("abce", threshold=0.75) == []
+    assert index.top_k("abce", threshold=0.74) == [("abcd", 0.75)]
+    assert index.best_match("zzzz") is None
+    assert CandidateIndex([]).top_k("abc") == []
+
+
+def test_empty_query_matches_only_empty_values():
+    index = CandidateIndex(["", "a"])
+
+    assert len(index) == 2
+    assert index.top_k("", k=2, threshold=0.5) == [("", 1.0)]
@@ -0,0 +1,118 @@
+"""Unit tests for HealedLocatorStore persistence and expiry."""
+import json
+import multiprocessing
+import time
+
+import pytest
+
+from utils.healed_locator_store import HealedLocatorStore
+
+BROKEN = ("id", "usernme")
+HEALED = ("id", "username")
+
+
+@pytest.fixture
+def store_path(config, class_state, tmp_path):
+    path = tmp_path / "healed_locators.json"
+    config("healing", store_enabled=True, store_path=str(path), store_max_age_hours=1)
+    class_state(HealedLocatorStore, _entries=None, _dirty=set(), _evicted=set(), _mtime=None)
+    return path
+
+
+def stored(path):
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def test_record_is_persisted_immediately(store_path):
+    HealedLocatorStore.record(BROKEN, HEALED, url="https://bench.local/login")
+
+    assert HealedLocatorStore.lookup(BROKEN) == HEALED
+
+    entry = stored(store_path)[str(BROKEN)]
+    assert entry["healed"] == list(HEALED)
+    assert entry["url"] == "https://bench.local/login"
+
+
+def test_mark_verified_counts_hits(store_path):
+    HealedLocatorStore.record(BROKEN, HEALED)
+    HealedLocatorStore.mark_verified(BROKEN)
+    HealedLocatorStore.flush()
+
+    assert stored(store_path)[str(BROKEN)]["hits"] == 2
+
+
+def test_evict_removes_entry_from_file(store_path):
+    HealedLocatorStore.record(BROKEN, HEALED)
+
+    HealedLocatorStore.evict(BROKEN)
+
+    assert HealedLocatorStore.lookup(BROKEN) is None
+    assert stored(store_path) == {}
+
+
+def test_expired_entry_is_evicted_on_lookup(store_path):
+    HealedLocatorStore.record(BROKEN, HEALED)
+    HealedLocatorStore._entries[str(BROKEN)]["last_verified"] = time.time() - 2 * 3600
+    HealedLocatorStore.flush()
+
+    assert HealedLocatorStore.lookup(BROKEN) is None
+    HealedLocatorStore.flush()
+    assert stored(store_path) == {}
+
+
+OTHER = ("id", "other")
+
+
+def write_other_workers_heal(path):
+    entries = stored(path)
+    entries[str(OTHER)] = {"locator": list(OTHER), "healed": ["id", "x"],
+                           "hits": 1, "last_verified": time.time(), "url": None}
+    path.write_text(json.dumps(entries))
+
+
+def test_writes_keep_entries_written_by_other_workers(store_path):
+    HealedLocatorStore.lookup(BROKEN)
+    write_other_workers_heal(store_path)
+
+    HealedLocatorStore.record(BROKEN, HEALED)
+    HealedLocatorStore.mark_verified(BROKEN)
+    HealedLocatorStore.flush()
+
+    assert sorted(stored(store_path)) == sorted([str(BROKEN), str(OTHER)])
+
+
+def test_lookup_miss_picks_up_heals_from_other_workers(store_path):
+    HealedLocatorStore.record(BROKEN, HEALED)
+    assert HealedLocatorStore.lookup(OTHER) is None
+
+    write_other_workers_heal(store_path)
+
+    assert HealedLocatorStore.lookup(OTHER) == ("id", "x")
+    assert HealedLocatorStore.lookup(BROKEN) == HEALED
+
+
+def _worker_flush(n, start):
+    HealedLocatorStore._entries = None
+    HealedLocatorStore._dirty = set()
+    HealedLocatorStore._evicted = set()
+    HealedLocatorStore._mtime = None
+    start.wait()
+    for i in range(5):
+        HealedLocatorStore.record(("id", f"w{n}-{i}"), ("id", "healed"))
+        HealedLocatorStore.mark_verified(("id", f"w{n}-{i}"))
+        HealedLocatorStore.flush()
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_concurrent_writes_lose_no_entries(store_path):
+    context = multiprocessing.get_context("fork")
+    start = context.Event()
+    workers = [context.Process(target=_worker_flush, args=(n, start)) for n in range(6)]
+    for worker in workers:
+        worker.start()
+    start.set()
+    for worker in workers:
+        worker.join(30)
+
+    assert [worker.exitcode for worker in workers] == [0] * 6
+    assert len(stored(store_path)) == 30
@@ -0,0 +1,71 @@
+"""Unit tests for HealingJournal shards, compaction and roll-up."""
+import json
+import time
+
+import pytest
+
+from utils.healing_journal import HealingJournal
+
+
+@pytest.fixture
+def journal_dir(config, tmp_path):
+    config("healing", journal_max_entries=3)
+    return tmp_path / "healing_journal"
+
+
+def heal(directory, worker, old, new, ts=None):
+    journal = HealingJournal(str(directory), worker_id=worker)
+    journal.append(old, new, url="https://bench.local/login")
+    if ts is not None:
+        # Backdate the line just written
+        lines = open(journal.path).read().splitlines()
+        record = json.loads(lines[-1])
+        record["ts"] = ts
+        lines[-1] = json.dumps(record)
+        open(journal.path, "w").write("\n".join(lines) + "\n")
+
+
+def test_stats_aggregate_shards(journal_dir):
+    heal(journal_dir, "gw0", ("id", "usr"), ("id", "username"))
+    heal(journal_dir, "gw1", ("id", "usr"), ("id", "user-name"))
+
+    item = HealingJournal.stats(str(journal_dir))[str(("id", "usr"))]
+
+    assert item["count"] == 2
+    assert item["new"] == ("id", "user-name")
+    assert item["workers"] == {"gw0", "gw1"}
+
+
+def test_compact_removes_shards_and_writes_summary(journal_dir, tmp_path):
+    heal(journal_dir, "gw0", ("id", "usr"), ("id", "username"))
+    summary_path = tmp_path / "healing_log.json"
+
+    HealingJournal.compact(str(journal_dir), str(summary_path))
+
+    assert [p.name for p in journal_dir.iterdir()] == ["healing.jsonl"]
+    assert json.loads(summary_path.read_text())[str(("id", "usr"))]["count"] == 1
+
+
+def test_compact_bounds_the_tail_and_keeps_totals(journal_dir, tmp_path):
+    summary_path = tmp_path / "healing_log.json"
+    for session in range(4):
+        for n in range(2):
+            heal(journal_dir, "gw0", ("id", "usr"), ("id", f"username-{session}"), ts=time.time() + session + n / 10)
+        HealingJournal.compact(str(journal_dir), str(summary_path))
+
+    assert len(list(HealingJournal.entries(str(journal_dir)))) == 3
+    item = json.loads(summary_path.read_text())[str(("id", "usr"))]
+    assert item["count"] == 8
+    assert item["new"] == ["id", "username-3"]
+    assert sum(item["healed_to"].values()) == 8
+
+
+def test_compact_rolls_up_heals_past_max_age(journal_dir, tmp_path, config):
+    config("healing", journal_max_entries=3, journal_max_age_hours=1)
+    heal(journal_dir, "gw0", ("id", "old"), ("id", "new"), ts=time.time() - 2 * 3600)
+    heal(journal_dir, "gw0", ("id", "recent"), ("id", "new"))
+
+    summary = HealingJournal.compact(str(journal_dir), str(tmp_path / "healing_log.json"))
+
+    assert [entry["old"] for entry in HealingJournal.entries(str(journal_dir))] == [["id", "recent"]]
+    assert summary[str(("id", "old"))]["count"] == 1
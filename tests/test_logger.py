@@ -0,0 +1,19 @@
+"""Unit tests for the logging pipeline's per-record context."""
+import logging
+import queue
+
+import pytest
+
+from core.logger import _ContextQueueHandler
+
+
+@pytest.mark.parametrize("test_id", ["tests/test_a.py::test_login[user name]", "tests/test_a.py::test_plain"])
+def test_records_carry_the_full_nodeid(monkeypatch, test_id):
+    monkeypatch.setenv("PYTEST_CURRENT_TEST", f"{test_id} (call)")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "message", None, None)
+
+    prepared = _ContextQueueHandler(queue.SimpleQueue()).prepare(record)
+
+    assert prepared.test == test_id
+    assert prepared.worker == "gw2"
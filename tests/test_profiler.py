@@ -0,0 +1,43 @@
+"""Unit tests for which tests the step profiler records."""
+import json
+
+PROFILED_TESTS = '''
+from core.profiler import StepProfiler
+
+
+def _step():
+    with StepProfiler.span("step", "click"):
+        pass
+
+
+def test_with_driver(driver):
+    _step()
+
+
+def test_without_driver():
+    _step()
+'''
+
+FAKE_DRIVER = '''
+import conftest as root
+from core.configManager import ConfigManager
+
+ConfigManager.load()
+ConfigManager._config["warmup"] = {"enabled": False}
+
+
+class FakeManager:
+    def quit(self):
+        pass
+
+
+root._create_driver = lambda platform, config, browser=None, resource=None: FakeManager()
+'''
+
+
+def test_only_driver_tests_are_profiled(xdist_session, tmp_path):
+    result, _ = xdist_session({"test_profiled": PROFILED_TESTS}, workers=1, setup=FAKE_DRIVER)
+
+    result.assert_outcomes(passed=2)
+    merged = json.loads((tmp_path / "reports" / "step_profile.json").read_text(encoding="utf-8"))
+    assert [profile["test"] for profile in merged["profiles"]] == ["tests/test_profiled.py::test_with_driver"]
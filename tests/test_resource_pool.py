@@ -0,0 +1,133 @@
+"""Unit tests for ResourcePool grouping, leasing and xdist pinning."""
+import os
+
+import pytest
+
+from core.resource_pool import ResourcePool
+
+DEVICES = [{"name": "device-a"}, {"name": "device-b"}]
+
+
+class FakeItem:
+    """Collected-item stand-in: markers and fixture names only."""
+
+    def __init__(self, name, markers=(), fixturenames=()):
+        self.nodeid = name
+        self.fixturenames = list(fixturenames)
+        self.own_markers = [marker.mark if hasattr(marker, "mark") else marker for marker in markers]
+
+    def get_closest_marker(self, name):
+        return next(self.iter_markers(name), None)
+
+    def iter_markers(self, name=None):
+        return (mark for mark in self.own_markers if name is None or mark.name == name)
+
+    def add_marker(self, marker):
+        self.own_markers.append(marker.mark)
+
+
+@pytest.fixture
+def inventory(config, class_state, tmp_path):
+    config("resources", mobile=DEVICES)
+    class_state(ResourcePool, LEASE_DIR=str(tmp_path / "leases"))
+    yield ResourcePool
+    ResourcePool.release_all()
+
+
+def xdist_group(group):
+    return pytest.mark.xdist_group(name=group)
+
+
+def test_assign_groups_round_robin_per_resource(inventory):
+    items = [FakeItem(f"t{i}", [pytest.mark.resource("mobile")]) for i in range(5)]
+    items.append(FakeItem("web", fixturenames=["driver"]))
+
+    inventory.assign_groups(items, "web", xdist_group)
+
+    groups = [item.get_closest_marker("xdist_group") for item in items]
+    assert [mark.kwargs["name"] for mark in groups[:5]] == \
+        ["mobile-0", "mobile-1", "mobile-0", "mobile-1", "mobile-0"]
+    assert groups[5] is None
+
+
+def test_assign_groups_uses_platform_pool_for_driver_tests(inventory):
+    items = [FakeItem("t0", fixturenames=["driver"]), FakeItem("t1")]
+
+    inventory.assign_groups(items, "mobile", xdist_group)
+
+    assert inventory.group_index(items[0], "mobile") == 0
+    assert items[1].get_closest_marker("xdist_group") is None
+
+
+def test_assign_groups_rejects_unknown_pool(inventory):
+    with pytest.raises(ValueError):
+        inventory.assign_groups([FakeItem("t", [pytest.mark.resource("desktop")])], "web", xdist_group)
+
+
+def test_group_index_ignores_other_groups(inventory):
+    item = FakeItem("t", [xdist_group("serial"), xdist_group("mobile-1")])
+
+    assert inventory.group_index(item, "mobile") == 1
+    assert inventory.group_index(item, "desktop") is None
+
+
+def test_lease_takes_the_groups_resource(inventory):
+    assert inventory.lease("mobile", 1).name == "device-b"
+    assert inventory.lease("mobile", 0).name == "device-a"
+    # Held for the session: asking again returns the same lease
+    assert inventory.lease("mobile", 1).name == "device-b"
+
+
+def test_lease_waits_for_the_groups_resource_only(inventory):
+    # Another session holds device-b; a group-1 lease must not fall back to device-a
+    os.makedirs(inventory.LEASE_DIR)
+    other = inventory._try_lock(inventory.resources("mobile")[1])
+    try:
+        with pytest.raises(TimeoutError):
+            inventory.lease("mobile", 1, timeout=0)
+        assert inventory.lease("mobile").name == "device-a"
+    finally:
+        other.close()
+
+
+GROUPED_TESTS = '''
+import pytest
+
+
+@pytest.mark.resource("mobile")
+@pytest.mark.parametrize("n", range(6))
+def test_on_device(n, resource, placement):
+    placement(resource=resource.name)
+
+
+@pytest.mark.parametrize("n", range(4))
+def test_anywhere(n, placement):
+    placement()
+'''
+
+INVENTORY = '''
+from core.configManager import ConfigManager
+
+ConfigManager.load()
+ConfigManager._config["resources"] = {"mobile": [{"name": "device-a"}, {"name": "device-b"}]}
+ConfigManager._config.setdefault("warmup", {})["enabled"] = False
+'''
+
+
+def test_pool_groups_stay_on_one_worker_with_their_resource(xdist_session):
+    result, placements = xdist_session({"test_devices": GROUPED_TESTS}, workers=3, setup=INVENTORY)
+
+    result.assert_outcomes(passed=10)
+    on_device = [entry for entry in placements if "test_on_device" in entry["nodeid"]]
+    assert len(on_device) == 6
+
+    by_group = {}
+    for entry in on_device:
+        group = entry["nodeid"].rsplit("@", 1)[1]
+        by_group.setdefault(group, []).append(entry)
+
+    assert sorted(by_group) == ["mobile-0", "mobile-1"]
+    for group, entries in by_group.items():
+        assert len({entry["worker"] for entry in entries}) == 1, entries
+        expected = DEVICES[int(group.rsplit("-", 1)[1])]["name"]
+        assert {entry["resource"] for entry in entries} == {expected}
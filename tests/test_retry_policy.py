@@ -0,0 +1,83 @@
+"""Unit tests for RetryPolicy, RetryState and RetryMetrics."""
+import pytest
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from core.configManager import ConfigManager
+from utils.retry_policy import RetryMetrics, RetryPolicy
+
+
+def test_delay_grows_exponentially_up_to_max():
+    policy = RetryPolicy(base_delay=0.5, multiplier=2.0, max_delay=3.0, jitter=0)
+
+    assert [policy.delay(retry) for retry in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_jitter_only_shortens_the_delay():
+    policy = RetryPolicy(base_delay=1.0, jitter=0.5)
+
+    assert all(0.5 <= policy.delay(1) <= 1.0 for _ in range(50))
+
+
+def test_retry_limit():
+    state = RetryPolicy(max_retries=2, base_delay=0, jitter=0).start()
+    error = TimeoutException()
+
+    for _ in range(2):
+        assert state.retry_refusal(error) is None
+        state.backoff(error)
+
+    assert state.retry_refusal(error) == "retry limit 2 reached"
+
+
+def test_exception_budget_is_per_class():
+    policy = RetryPolicy(max_retries=5, base_delay=0, jitter=0,
+                         exception_budgets={"StaleElementReferenceException": 1})
+    state = policy.start()
+    state.backoff(StaleElementReferenceException())
+
+    assert "exhausted" in state.retry_refusal(StaleElementReferenceException())
+    assert state.retry_refusal(TimeoutException()) is None
+
+
+def test_non_retryable_fails_at_once():
+    state = RetryPolicy().start()
+
+    assert state.retry_refusal(InvalidSelectorException()) == "InvalidSelectorException is not retryable"
+
+
+def test_deadline_caps_attempt_timeout_and_refuses_when_spent():
+    state = RetryPolicy(deadline=5, attempt_timeout=10).start()
+    assert state.attempt_timeout() <= 5
+
+    state.started -= 6
+    assert state.attempt_timeout() == 0
+    assert "deadline" in state.retry_refusal(TimeoutException(), count=False)
+
+
+def test_from_config_defaults_to_step_retry_and_applies_overrides():
+    ConfigManager.load()
+    policy = RetryPolicy.from_config(deadline=15)
+
+    assert policy.max_retries == ConfigManager.get("retries", "step_retry")
+    assert policy.deadline == 15
+
+
+def test_default_config_sets_no_timeout_budget():
+    ConfigManager.load()
+
+    assert "TimeoutException" not in RetryPolicy.from_config().exception_budgets
+
+
+@pytest.mark.parametrize("test_id", ["tests/test_a.py::test_login[user name]", "tests/test_a.py::test_plain"])
+def test_metrics_are_keyed_by_full_nodeid(monkeypatch, test_id):
+    monkeypatch.setenv("PYTEST_CURRENT_TEST", f"{test_id} (call)")
+    state = RetryPolicy(base_delay=0, jitter=0).start()
+    state.backoff(TimeoutException())
+
+    state.finish()
+
+    assert RetryMetrics.pop(test_id)["retries"] == 1
@@ -0,0 +1,117 @@
+"""Unit tests for TimingStore recording and duration-aware ordering."""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from utils.timing_store import TimingStore
+
+PROFILE = "web:qa"
+
+
+@pytest.fixture
+def store(config, class_state, tmp_path):
+    path = tmp_path / "timings.json"
+    config("timings", enabled=True, path=str(path))
+    class_state(TimingStore, _history=None, _durations={}, _called=set())
+
+    def write(durations):
+        path.write_text(json.dumps({PROFILE: {k: {"mean": v, "runs": 1} for k, v in durations.items()}}))
+        TimingStore._history = None
+
+    return write
+
+
+def items(*nodeids):
+    return [SimpleNamespace(nodeid=nodeid) for nodeid in nodeids]
+
+
+def names(collected):
+    return [item.nodeid for item in collected]
+
+
+def test_order_longest_first_with_mean_for_unknown(store):
+    store({"t::a": 1.0, "t::b": 9.0, "t::c": 5.0})
+    collected = items("t::a", "t::new", "t::b", "t::c")
+
+    TimingStore.order(collected, PROFILE)
+
+    # t::new is estimated at the mean (5.0) and keeps collection order against t::c
+    assert names(collected) == ["t::b", "t::new", "t::c", "t::a"]
+
+
+def test_order_ignores_xdist_group_suffix(store):
+    store({"t::a": 1.0, "t::b": 9.0})
+    collected = items("t::a@mobile-0", "t::b@mobile-1")
+
+    TimingStore.order(collected, PROFILE)
+
+    assert names(collected) == ["t::b@mobile-1", "t::a@mobile-0"]
+
+
+def test_order_without_history_keeps_collection_order(store):
+    collected = items("t::b", "t::a")
+
+    TimingStore.order(collected, PROFILE)
+
+    assert names(collected) == ["t::b", "t::a"]
+
+
+def test_order_deals_initial_chunks_round_robin(store):
+    # 12 tests, durations 12..1; 3 workers that each get a chunk of 2 first
+    store({f"t::{n}": float(n) for n in range(1, 13)})
+    collected = items(*(f"t::{n}" for n in range(1, 13)))
+
+    TimingStore.order(collected, PROFILE, workers=3, chunk=2)
+
+    chunks = [names(collected[k * 2:(k + 1) * 2]) for k in range(3)]
+    assert chunks == [["t::12", "t::9"], ["t::11", "t::8"], ["t::10", "t::7"]]
+    # The longest tests start on different workers, the rest stay longest-first
+    assert names(collected[6:]) == ["t::6", "t::5", "t::4", "t::3", "t::2", "t::1"]
+
+
+def test_save_folds_runs_into_weighted_mean(store):
+    store({"t::a": 10.0})
+    for when, duration in (("setup", 1.0), ("call", 4.0), ("teardown", 1.0)):
+        TimingStore.record(SimpleNamespace(nodeid="t::a@mobile-0", when=when, duration=duration, skipped=False))
+    TimingStore.record(SimpleNamespace(nodeid="t::skipped", when="setup", duration=3.0, skipped=False))
+
+    TimingStore.save(PROFILE)
+
+    durations = TimingStore.durations(PROFILE)
+    assert durations == {"t::a": pytest.approx(0.3 * 6.0 + 0.7 * 10.0)}
+
+
+TIMED_TESTS = '''
+def test_with_driver(driver):
+    pass
+
+
+def test_without_driver():
+    pass
+'''
+
+FAKE_DRIVER = '''
+import conftest as root
+from core.configManager import ConfigManager
+
+ConfigManager.load()
+ConfigManager._config["warmup"] = {"enabled": False}
+ConfigManager._config["timings"] = {"enabled": True, "path": "timings.json"}
+
+
+class FakeManager:
+    def quit(self):
+        pass
+
+
+root._create_driver = lambda platform, config, browser=None, resource=None: FakeManager()
+'''
+
+
+def test_only_driver_tests_are_recorded(xdist_session, tmp_path):
+    result, _ = xdist_session({"test_timed": TIMED_TESTS}, workers=2, setup=FAKE_DRIVER)
+
+    result.assert_outcomes(passed=2)
+    history = json.loads((tmp_path / "timings.json").read_text(encoding="utf-8"))
+    assert list(history[PROFILE]) == ["tests/test_timed.py::test_with_driver"]
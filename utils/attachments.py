@@ -0,0 +1,133 @@
+# utils/attachments.py
+import hashlib
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+
+import allure
+import allure_commons
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment, ExecutableItem
+from allure_commons.types import AttachmentType
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+from core.profiler import StepProfiler
+
+logger = get_logger(__name__)
+
+
+class AttachmentSink:
+    """Allure attachments written by a background thread.
+
+    allure.attach registers the attachment on the current step and writes
+    the file on the calling thread. The sink splits the two: the entry is
+    added to the current step or test on the test thread (the reporter's
+    public get_last_item(), so it lands in the right step), and the body
+    goes onto a bounded queue that one writer thread hands to Allure's
+    public report_attached_data hook, which writes it into the results
+    directory. When the queue is full, attach() blocks until there is room
+    (back-pressure) rather than buffering without limit.
+
+    Identical payloads are written once: the attachment file name is
+    derived from the content hash, so a repeated failure text or an
+    unchanged screenshot reuses the file already on disk. Only the most
+    recent ``attachments.dedupe_window`` file names are remembered, so a
+    long session does not grow the set without bound.
+
+    flush() waits until everything queued has been written; conftest calls
+    it at test teardown and session end so reports are complete.
+
+    Falls back to a plain allure.attach when disabled
+    (attachments.async: false) or when no Allure listener is active.
+    """
+    _queue = None
+    _writer = None
+    _written = OrderedDict()
+    _lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # CONFIG
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _setting(key, default):
+        value = ConfigManager.get("attachments", key)
+        return default if value is None else value
+
+    @staticmethod
+    def _reporter():
+        for plugin in allure_commons.plugin_manager.get_plugins():
+            reporter = getattr(plugin, "allure_logger", None)
+            if reporter is not None:
+                return reporter
+        return None
+
+    # ------------------------------------------------------------------
+    # PUBLIC API
+    # ------------------------------------------------------------------
+    @classmethod
+    def attach(cls, body, name=None, attachment_type=None, extension=None):
+        with StepProfiler.span("attachment"):
+            cls._attach(body, name, attachment_type, extension)
+
+    @classmethod
+    def _attach(cls, body, name, attachment_type, extension):
+        reporter = cls._reporter() if cls._setting("async", True) else None
+        if reporter is None:
+            allure.attach(body, name=name, attachment_type=attachment_type, extension=extension)
+            return
+
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        dedupe = cls._setting("dedupe", True)
+        key = hashlib.blake2b(data, digest_size=16).hexdigest() if dedupe else uuid.uuid4().hex
+
+        item = reporter.get_last_item(ExecutableItem)
+        if item is None:
+            # No running test / step to attach to
+            allure.attach(body, name=name, attachment_type=attachment_type, extension=extension)
+            return
+
+        mime_type = attachment_type
+        if isinstance(attachment_type, AttachmentType):
+            extension, mime_type = attachment_type.extension, attachment_type.mime_type
+        file_name = ATTACHMENT_PATTERN.format(prefix=key, ext=extension or "attach")
+        item.attachments.append(Attachment(source=file_name, name=name, type=mime_type))
+
+        with cls._lock:
+            if dedupe and file_name in cls._written:
+                cls._written.move_to_end(file_name)
+                return
+            cls._written[file_name] = None
+            while len(cls._written) > cls._setting("dedupe_window", 1024):
+                cls._written.popitem(last=False)
+        cls._start()
+        cls._queue.put((file_name, data))
+
+    @classmethod
+    def flush(cls):
+        """Block until every queued attachment is on disk."""
+        if cls._queue is not None:
+            cls._queue.join()
+
+    # ------------------------------------------------------------------
+    # WRITER
+    # ------------------------------------------------------------------
+    @classmethod
+    def _start(cls):
+        with cls._lock:
+            if cls._writer is not None:
+                return
+            cls._queue = queue.Queue(maxsize=cls._setting("queue_size", 64))
+            cls._writer = threading.Thread(target=cls._run, name="allure-attachment-writer", daemon=True)
+            cls._writer.start()
+
+    @classmethod
+    def _run(cls):
+        while True:
+            file_name, data = cls._queue.get()
+            try:
+                allure_commons.plugin_manager.hook.report_attached_data(body=data, file_name=file_name)
+            except Exception as e:
+                logger.warning(f"Could not write attachment {file_name}: {e}")
+            finally:
+                cls._queue.task_done()
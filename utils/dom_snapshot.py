@@ -0,0 +1,134 @@
+# utils/dom_snapshot.py
+import hashlib
+import weakref
+from collections import OrderedDict
+from threading import Lock
+
+from bs4 import BeautifulSoup
+
+from core.dom_scripts import SNAPSHOT_TOKEN_JS
+from utils.fuzzy_index import CandidateIndex
+
+
+class DomSnapshot:
+    """Attribute values of a single page state.
+
+    The page source is parsed once and every tag is visited a single time
+    to collect ``attr -> distinct values``. Values keep document order
+    (first occurrence wins), which preserves the tie-breaking behaviour of
+    a plain ``soup.find_all`` scan. Only the value strings are kept, so the
+    parsed tree is garbage-collected as soon as the snapshot is built.
+
+    Attributes:
+        url (str): URL the snapshot was taken from.
+    """
+
+    def __init__(self, url, page_source):
+        self.url = url
+        self._values = {}
+        self._candidates = {}
+
+        for tag in BeautifulSoup(page_source, "html.parser").find_all(True):
+            for attr, value in tag.attrs.items():
+                # Multi-valued attributes (class, rel, ...) come back as lists
+                if isinstance(value, list):
+                    value = " ".join(value)
+                self._values.setdefault(attr, {}).setdefault(value, None)
+
+    @staticmethod
+    def fingerprint(page_source):
+        return hashlib.blake2b(page_source.encode("utf-8", "replace"), digest_size=16).hexdigest()
+
+    def values(self, attr):
+        """Distinct values of ``attr`` in document order."""
+        return list(self._values.get(attr, ()))
+
+    def candidates(self, attr):
+        """Fuzzy-match index over the values of ``attr`` (built on first use)."""
+        index = self._candidates.get(attr)
+        if index is None:
+            index = self._candidates[attr] = CandidateIndex(self.values(attr))
+        return index
+
+    def attributes(self):
+        return list(self._values)
+
+
+class DomSnapshotCache:
+    """Small per-process LRU of DomSnapshot objects keyed by page state.
+
+    A snapshot is reused for as long as the page stays the same, so
+    several heal attempts against one page state share one parse. The page
+    state is read with SNAPSHOT_TOKEN_JS, a single small script call, so a
+    reused snapshot costs no page_source transfer and no hashing. Drivers
+    that cannot run scripts (e.g. native mobile contexts) fall back to
+    page_source + URL keyed by a content hash.
+
+    Methods:
+        get(driver): Return the snapshot for the driver's current page.
+        clear(): Drop every cached snapshot.
+    """
+    _snapshots = OrderedDict()
+    _no_token = weakref.WeakSet()
+    _lock = Lock()
+    max_size = 4
+
+    @classmethod
+    def _token(cls, driver):
+        if driver in cls._no_token:
+            return None
+        try:
+            token = driver.execute_script(SNAPSHOT_TOKEN_JS)
+        except Exception:
+            token = None
+        if isinstance(token, (list, tuple)) and len(token) == 3:
+            return tuple(token)
+        try:
+            cls._no_token.add(driver)
+        except TypeError:
+            pass
+        return None
+
+    @classmethod
+    def get(cls, driver):
+        token = cls._token(driver)
+        if token is not None:
+            page_id, version, url = token
+            key = ("token", page_id, version)
+            snapshot = cls._cached(key)
+            if snapshot is not None:
+                return snapshot
+            page_source = driver.page_source
+        else:
+            page_source = driver.page_source
+            try:
+                url = driver.current_url
+            except Exception:
+                url = None
+            key = (url, DomSnapshot.fingerprint(page_source))
+            snapshot = cls._cached(key)
+            if snapshot is not None:
+                return snapshot
+
+        snapshot = DomSnapshot(url, page_source)
+
+        with cls._lock:
+            cls._snapshots[key] = snapshot
+            cls._snapshots.move_to_end(key)
+            while len(cls._snapshots) > cls.max_size:
+                cls._snapshots.popitem(last=False)
+
+        return snapshot
+
+    @classmethod
+    def _cached(cls, key):
+        with cls._lock:
+            snapshot = cls._snapshots.get(key)
+            if snapshot is not None:
+                cls._snapshots.move_to_end(key)
+            return snapshot
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._snapshots.clear()
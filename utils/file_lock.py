@@ -0,0 +1,42 @@
+# utils/file_lock.py
+import os
+import time
+from contextlib import contextmanager
+
+
+@contextmanager
+def file_lock(path, timeout=30, poll=0.05):
+    """Hold an exclusive OS lock (flock / msvcrt) on ``path`` across processes.
+
+    Guards read-merge-write cycles on files shared by xdist workers. The
+    lock file is created if missing and left in place; the OS drops the
+    lock when the holder exits, so a killed worker never blocks the rest.
+
+    Raises:
+        TimeoutError: The lock was not acquired within ``timeout`` seconds.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    handle = open(path, "a+b")
+    try:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(handle):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Could not lock {path} within {timeout}s")
+            time.sleep(poll)
+        yield
+    finally:
+        handle.close()  # closing the descriptor drops the lock
+
+
+def _try_lock(handle):
+    handle.seek(0)
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,129 @@
+# utils/fuzzy_index.py
+import heapq
+from collections import Counter
+from difflib import SequenceMatcher
+
+
+class CandidateIndex:
+    """Pre-filtering index in front of ``SequenceMatcher.ratio()``.
+
+    Used by the self-healing engine to find attribute values similar to a
+    broken locator without scoring every value in the DOM. Candidates are
+    pruned in three cheap stages before the exact (quadratic) ratio:
+
+        1. Length bound   - ``2 * min(la, lb) / (la + lb)`` is the best
+                            ratio two strings of these lengths can reach.
+        2. Trigram order  - values sharing the most character trigrams
+                            with the query are scored first, so the
+                            running best rises early and prunes harder.
+        3. real_quick_ratio / quick_ratio upper bounds, computed from
+           precomputed lengths and character counts so rejected values
+           never pay for ``set_seq2``.
+
+    Every stage is an upper bound (or only an ordering), so the ranking
+    is identical to an exhaustive scan: highest ratio wins, ties go to the
+    value that appears first in document order.
+
+    Args:
+        values (iterable[str]): Attribute values in document order.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, values):
+        self._values = list(values)
+        self._lowered = [value.lower() for value in self._values]
+        self._chars = [Counter(value) for value in self._lowered]
+        self._by_length = {}
+        self._grams = {}
+
+        for position, value in enumerate(self._lowered):
+            self._by_length.setdefault(len(value), []).append(position)
+            for gram in self._trigrams(value):
+                self._grams.setdefault(gram, []).append(position)
+
+    def __len__(self):
+        return len(self._values)
+
+    @classmethod
+    def _trigrams(cls, value):
+        size = cls.GRAM_SIZE
+        return {value[i:i + size] for i in range(len(value) - size + 1)}
+
+    @staticmethod
+    def _ratio_bound(length_a, length_b):
+        # Same arithmetic as difflib's _calculate_ratio with matches = min(la, lb)
+        total = length_a + length_b
+        if not total:
+            return 1.0
+        return 2.0 * min(length_a, length_b) / total
+
+    def top_k(self, query, k=1, threshold=0.7):
+        """Return up to ``k`` ``(value, score)`` pairs with score > threshold.
+
+        Results are ordered best first, ties broken by document order.
+        """
+        query = query.lower()
+        query_length = len(query)
+
+        positions = []
+        for length, bucket in self._by_length.items():
+            if self._ratio_bound(query_length, length) > threshold:
+                positions.extend(bucket)
+
+        if not positions:
+            return []
+
+        overlap = Counter()
+        for gram in self._trigrams(query):
+            overlap.update(self._grams.get(gram, ()))
+        positions.sort(key=lambda position: (-overlap[position], position))
+
+        matcher = SequenceMatcher(None)
+        matcher.set_seq1(query)
+
+        # Min-heap of (score, -position): heap[0] is the current k-th best
+        best = []
+
+        def can_beat(bound, position):
+            if bound <= threshold:
+                return False
+            if len(best) < k:
+                return True
+            worst_score, worst_neg_position = best[0]
+            return bound > worst_score or (bound == worst_score and position < -worst_neg_position)
+
+        query_chars = Counter(query)
+
+        for position in positions:
+            candidate = self._lowered[position]
+            total = query_length + len(candidate)
+
+            # real_quick_ratio(): length-only bound
+            if not can_beat(self._ratio_bound(query_length, len(candidate)), position):
+                continue
+
+            # quick_ratio(): multiset intersection of characters
+            candidate_chars = self._chars[position]
+            shared = sum(min(count, candidate_chars[char]) for char, count in query_chars.items())
+            if not can_beat(2.0 * shared / total if total else 1.0, position):
+                continue
+
+            matcher.set_seq2(candidate)
+            score = matcher.ratio()
+            if not can_beat(score, position):
+                continue
+
+            entry = (score, -position)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            else:
+                heapq.heapreplace(best, entry)
+
+        ranked = sorted(best, key=lambda entry: (-entry[0], -entry[1]))
+        return [(self._values[-neg_position], score) for score, neg_position in ranked]
+
+    def best_match(self, query, threshold=0.7):
+        """Single best value scoring above ``threshold``, or None."""
+        result = self.top_k(query, k=1, threshold=threshold)
+        return result[0][0] if result else None
@@ -0,0 +1,216 @@
+# utils/healed_locator_store.py
+import json
+import os
+import tempfile
+import time
+from threading import Lock
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+from utils.file_lock import file_lock
+
+logger = get_logger(__name__)
+
+
+class HealedLocatorStore:
+    """Persistent map of broken locators to their healed replacements.
+
+    BasePage consults the store before the first attempt of a step, so a
+    locator that is already known to be broken goes straight to its healed
+    replacement instead of burning a full wait timeout first.
+
+    Each entry holds:
+        locator (list):       Original (by, value) locator.
+        healed (list):        Healed (by, value) locator.
+        hits (int):           Times the healed locator was used successfully.
+        last_verified (float): Epoch seconds of the last successful use.
+        url (str):            Page URL the heal was recorded on.
+
+    Entries are evicted when the healed locator stops working or when they
+    have not been verified for ``healing.store_max_age_hours``.
+
+    New heals and evictions are written as they happen, so other xdist
+    workers stop paying the timeout for the same broken locator and a
+    crashed worker loses nothing but hit counters; those are kept in
+    memory and written by flush() at session end. Every write happens
+    under an exclusive file lock (``<store>.lock``): the worker re-reads
+    the file, applies its pending changes on top and replaces the file
+    (temp file + os.replace), so concurrent workers neither lose each
+    other's entries nor observe a truncated file. A lookup that misses
+    re-reads the file when it changed since the last read, to pick up
+    heals recorded by other workers.
+    """
+    _entries = None
+    _dirty = set()
+    _evicted = set()
+    _mtime = None
+    _lock = Lock()
+
+    # ------------------------------------------------------------------
+    # CONFIG
+    # ------------------------------------------------------------------
+    @classmethod
+    def enabled(cls):
+        enabled = ConfigManager.get("healing", "store_enabled")
+        return True if enabled is None else bool(enabled)
+
+    @classmethod
+    def _path(cls):
+        return ConfigManager.get("healing", "store_path") or "reports/healed_locators.json"
+
+    @classmethod
+    def _max_age(cls):
+        hours = ConfigManager.get("healing", "store_max_age_hours")
+        return hours * 3600 if hours else None
+
+    @staticmethod
+    def _key(locator):
+        return str(tuple(locator))
+
+    # ------------------------------------------------------------------
+    # PERSISTENCE
+    # ------------------------------------------------------------------
+    @classmethod
+    def _read(cls):
+        path = cls._path()
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable healed locator store {path}: {e}")
+            return {}
+
+    @staticmethod
+    def _modified(path):
+        # os.replace() puts a new inode in place, even within one mtime tick
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def _load(cls):
+        if cls._entries is None:
+            cls._mtime = cls._modified(cls._path())
+            cls._entries = cls._read()
+        return cls._entries
+
+    @classmethod
+    def _merged(cls, stored):
+        """``stored`` with this worker's pending changes applied on top."""
+        for key in cls._evicted:
+            stored.pop(key, None)
+        for key in cls._dirty:
+            if key in cls._entries:
+                stored[key] = cls._entries[key]
+        return stored
+
+    @classmethod
+    def _refresh(cls):
+        """Re-read the file if another worker has written it since."""
+        path = cls._path()
+        mtime = cls._modified(path)
+        if mtime == cls._mtime:
+            return
+        cls._mtime = mtime
+        cls._entries = cls._merged(cls._read())
+
+    @classmethod
+    def _save(cls):
+        path = cls._path()
+        try:
+            # Read-merge-replace as one step across workers
+            with file_lock(path + ".lock"):
+                merged = cls._merged(cls._read())
+
+                directory = os.path.dirname(path) or "."
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    json.dump(merged, f, indent=4)
+                os.replace(tmp_path, path)
+                cls._mtime = cls._modified(path)
+
+            cls._entries = merged
+            cls._dirty.clear()
+            cls._evicted.clear()
+        except Exception as e:
+            logger.warning(f"Could not persist healed locator store {path}: {e}")
+
+    # ------------------------------------------------------------------
+    # PUBLIC API
+    # ------------------------------------------------------------------
+    @classmethod
+    def lookup(cls, locator):
+        """Return the healed (by, value) locator for ``locator`` or None."""
+        if not isinstance(locator, tuple) or not cls.enabled():
+            return None
+
+        key = cls._key(locator)
+        with cls._lock:
+            entry = cls._load().get(key)
+            if not entry:
+                cls._refresh()
+                entry = cls._entries.get(key)
+            if not entry:
+                return None
+
+            max_age = cls._max_age()
+            if max_age and time.time() - entry.get("last_verified", 0) > max_age:
+                logger.info(f"Healed locator for {locator} expired, evicting")
+                cls._entries.pop(key, None)
+                cls._dirty.discard(key)
+                cls._evicted.add(key)
+                return None
+
+            return tuple(entry["healed"])
+
+    @classmethod
+    def record(cls, locator, healed, url=None):
+        """Store a freshly verified heal for ``locator`` and persist it."""
+        if not isinstance(locator, tuple) or not cls.enabled():
+            return
+
+        key = cls._key(locator)
+        with cls._lock:
+            cls._load()[key] = {
+                "locator": list(locator),
+                "healed": list(healed),
+                "hits": 1,
+                "last_verified": time.time(),
+                "url": url,
+            }
+            cls._dirty.add(key)
+            cls._evicted.discard(key)
+            cls._save()
+
+    @classmethod
+    def mark_verified(cls, locator):
+        """Count a successful use; persisted lazily by flush()."""
+        key = cls._key(locator)
+        with cls._lock:
+            entry = cls._load().get(key)
+            if entry:
+                entry["hits"] = entry.get("hits", 0) + 1
+                entry["last_verified"] = time.time()
+                cls._dirty.add(key)
+
+    @classmethod
+    def evict(cls, locator):
+        """Forget the heal for ``locator`` (the healed locator stopped working)."""
+        key = cls._key(locator)
+        with cls._lock:
+            cls._load().pop(key, None)
+            cls._dirty.discard(key)
+            cls._evicted.add(key)
+            cls._save()
+
+    @classmethod
+    def flush(cls):
+        """Persist pending hit counters and expiries (session end)."""
+        with cls._lock:
+            if cls._entries is not None and (cls._dirty or cls._evicted):
+                cls._save()
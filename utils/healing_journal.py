@@ -0,0 +1,231 @@
+# utils/healing_journal.py
+import glob
+import json
+import os
+import time
+from collections import Counter
+from threading import Lock
+
+from core.configManager import ConfigManager
+
+
+class HealingJournal:
+    """Append-only, per-worker JSON-lines journal of self-healing events.
+
+    Every xdist worker appends to its own ``healing-<worker>.jsonl`` shard,
+    one line per heal, so writes are O(1) and workers never contend on the
+    same file. At session end the controller calls ``compact()``, which
+    folds the shards into a ``healing.jsonl`` tail of recent raw heals and
+    rewrites the aggregated ``healing_log.json`` summary.
+
+    The tail is bounded: heals older than ``healing.journal_max_age_hours``
+    or beyond the newest ``healing.journal_max_entries`` are rolled up into
+    per-locator totals (``rollup.json``) and dropped, so the journal stays
+    the same size however many sessions it has seen. stats() adds the
+    rolled-up totals to the tail, so the summary still counts every heal.
+
+    Args:
+        directory (str): Folder holding the journal shards.
+        worker_id (str): xdist worker id; defaults to PYTEST_XDIST_WORKER.
+
+    Methods:
+        append(old, new, url): Record one heal.
+        entries(directory): Iterate the raw heals still in the tail.
+        stats(directory): Aggregated heal stats per locator (all heals).
+        compact(directory, summary_path): Merge shards, roll up old heals,
+            write summary.
+    """
+    HISTORY_FILE = "healing.jsonl"
+    ROLLUP_FILE = "rollup.json"
+    DEFAULT_MAX_ENTRIES = 1000
+
+    _lock = Lock()
+
+    def __init__(self, directory="reports/healing_journal", worker_id=None):
+        self.directory = directory
+        self.worker_id = worker_id or os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.path = os.path.join(directory, f"healing-{self.worker_id}.jsonl")
+        os.makedirs(directory, exist_ok=True)
+
+    def append(self, old, new, url=None):
+        record = {
+            "ts": time.time(),
+            "worker": self.worker_id,
+            "old": list(old) if isinstance(old, tuple) else old,
+            "new": list(new) if isinstance(new, tuple) else new,
+            "url": url,
+        }
+        line = (json.dumps(record) + "\n").encode("utf-8")
+
+        # Single O_APPEND write per record: no read-modify-write, no truncation
+        with self._lock:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+    # ------------------------------------------------------------------
+    # QUERY API
+    # ------------------------------------------------------------------
+    @classmethod
+    def _files(cls, directory):
+        history = os.path.join(directory, cls.HISTORY_FILE)
+        shards = sorted(glob.glob(os.path.join(directory, "healing-*.jsonl")))
+        return ([history] if os.path.exists(history) else []) + shards
+
+    @classmethod
+    def _read_lines(cls, path):
+        with open(path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Torn last line from a killed worker
+                    continue
+
+    @classmethod
+    def entries(cls, directory="reports/healing_journal"):
+        """Yield the raw heals in the tail and the pending shards."""
+        for path in cls._files(directory):
+            yield from cls._read_lines(path)
+
+    @classmethod
+    def stats(cls, directory="reports/healing_journal"):
+        """
+        Aggregate heals per original locator.
+
+        Returns:
+            dict: str(old) -> {"old", "new", "count", "healed_to",
+                               "first_seen", "last_seen", "workers", "urls"}
+                  where "new" is the most recent replacement and
+                  "healed_to" counts every replacement seen.
+        """
+        summary = cls._read_rollup(directory)
+        for entry in cls.entries(directory):
+            cls._fold(summary, entry)
+        return summary
+
+    @staticmethod
+    def _locator(value):
+        return tuple(value) if isinstance(value, list) else value
+
+    @classmethod
+    def _fold(cls, summary, entry):
+        old = cls._locator(entry["old"])
+        new = cls._locator(entry["new"])
+
+        item = summary.setdefault(str(old), {
+            "old": old,
+            "new": new,
+            "count": 0,
+            "healed_to": Counter(),
+            "first_seen": entry["ts"],
+            "last_seen": entry["ts"],
+            "workers": set(),
+            "urls": set(),
+        })
+        item["count"] += 1
+        item["healed_to"][str(new)] += 1
+        item["first_seen"] = min(item["first_seen"], entry["ts"])
+        if entry["ts"] >= item["last_seen"]:
+            item["last_seen"] = entry["ts"]
+            item["new"] = new
+        item["workers"].add(entry.get("worker"))
+        if entry.get("url"):
+            item["urls"].add(entry["url"])
+
+    @staticmethod
+    def _serializable(summary):
+        return {
+            key: {
+                **item,
+                "healed_to": dict(item["healed_to"]),
+                "workers": sorted(w for w in item["workers"] if w),
+                "urls": sorted(item["urls"]),
+            }
+            for key, item in summary.items()
+        }
+
+    @classmethod
+    def _read_rollup(cls, directory):
+        path = os.path.join(directory, cls.ROLLUP_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r") as f:
+            rollup = json.load(f)
+        return {
+            key: {
+                **item,
+                "old": cls._locator(item["old"]),
+                "new": cls._locator(item["new"]),
+                "healed_to": Counter(item["healed_to"]),
+                "workers": set(item["workers"]),
+                "urls": set(item["urls"]),
+            }
+            for key, item in rollup.items()
+        }
+
+    @staticmethod
+    def _write_json(path, data):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    # COMPACTION
+    # ------------------------------------------------------------------
+    @classmethod
+    def _limits(cls):
+        max_entries = ConfigManager.get("healing", "journal_max_entries")
+        hours = ConfigManager.get("healing", "journal_max_age_hours")
+        return (
+            cls.DEFAULT_MAX_ENTRIES if max_entries is None else max_entries,
+            hours * 3600 if hours else None,
+        )
+
+    @classmethod
+    def compact(cls, directory="reports/healing_journal", summary_path="reports/healing_log.json"):
+        """
+        Fold worker shards into the tail, roll heals that fell out of it
+        into rollup.json and write the summary.
+
+        Must only run once no worker is appending (session end on the
+        xdist controller).
+        """
+        if not os.path.isdir(directory):
+            return {}
+
+        history = os.path.join(directory, cls.HISTORY_FILE)
+        shards = sorted(glob.glob(os.path.join(directory, "healing-*.jsonl")))
+        entries = sorted(cls.entries(directory), key=lambda entry: entry["ts"])
+
+        max_entries, max_age = cls._limits()
+        cutoff = time.time() - max_age if max_age else None
+        keep = [entry for entry in entries if cutoff is None or entry["ts"] >= cutoff]
+        keep = keep[len(keep) - max_entries:] if max_entries < len(keep) else keep
+        kept = {id(entry) for entry in keep}
+        expired = [entry for entry in entries if id(entry) not in kept]
+
+        if expired:
+            rollup = cls._read_rollup(directory)
+            for entry in expired:
+                cls._fold(rollup, entry)
+            cls._write_json(os.path.join(directory, cls.ROLLUP_FILE), cls._serializable(rollup))
+
+        tmp_path = history + ".tmp"
+        with open(tmp_path, "w") as out:
+            for entry in keep:
+                out.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, history)
+        for shard in shards:
+            os.remove(shard)
+
+        summary = cls.stats(directory)
+        cls._write_json(summary_path, cls._serializable(summary))
+        return summary
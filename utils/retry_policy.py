@@ -0,0 +1,190 @@
+# utils/retry_policy.py
+import os
+import random
+import time
+from threading import Lock
+
+from core.configManager import ConfigManager
+
+
+class RetryPolicy:
+    """Retry rules for BasePage._safe_action.
+
+    Replaces the fixed ``time.sleep(0.3)`` loop with:
+        - exponential backoff with jitter between attempts
+        - per-exception-class retry budgets (matched by class name, so
+          Selenium / Appium / wrapper exceptions all match)
+        - a total deadline for the whole step
+        - immediate failure for non-retryable errors
+
+    Args:
+        max_retries (int): Retries after the first attempt.
+        base_delay (float): Delay before the first retry (seconds).
+        multiplier (float): Backoff growth factor.
+        max_delay (float): Upper bound for a single delay.
+        jitter (float): Fraction of the delay randomised (0 = none).
+        deadline (float): Total seconds a step may take; None = unbounded.
+        attempt_timeout (float): Element wait per attempt, capped by the
+            remaining deadline.
+        exception_budgets (dict): Exception class name -> max retries.
+        non_retryable (iterable): Exception class names that fail at once.
+
+    Example:
+        policy = RetryPolicy.from_config(deadline=15)
+        page.click(*LOCATOR, retry_policy=policy)
+    """
+
+    NON_RETRYABLE = (
+        "InvalidSelectorException",
+        "InvalidArgumentException",
+        "InvalidSessionIdException",
+        "NoSuchWindowException",
+    )
+
+    def __init__(self, max_retries=3, base_delay=0.3, multiplier=2.0, max_delay=5.0,
+                 jitter=0.5, deadline=None, attempt_timeout=10,
+                 exception_budgets=None, non_retryable=None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+        self.attempt_timeout = attempt_timeout
+        self.exception_budgets = dict(exception_budgets or {})
+        self.non_retryable = tuple(non_retryable if non_retryable is not None else self.NON_RETRYABLE)
+
+    @classmethod
+    def from_config(cls, **overrides):
+        """Build a policy from the ``retry_policy`` section of config.yaml.
+
+        ``retries.step_retry`` stays the default retry count; keyword
+        arguments override individual settings for a single call site.
+        """
+        settings = dict(ConfigManager.get("retry_policy") or {})
+        settings.setdefault("max_retries", ConfigManager.get("retries", "step_retry"))
+        settings = {k: v for k, v in settings.items() if v is not None}
+        settings.update(overrides)
+        return cls(**settings)
+
+    def start(self):
+        """Begin tracking a single step."""
+        return RetryState(self)
+
+    def delay(self, retry):
+        delay = min(self.max_delay, self.base_delay * (self.multiplier ** (retry - 1)))
+        if self.jitter:
+            delay *= 1 - self.jitter * random.random()
+        return delay
+
+
+class RetryState:
+    """Per-step bookkeeping for a RetryPolicy (attempt timing, budgets, deadline)."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.started = time.monotonic()
+        self.retries = 0
+        self.per_exception = {}
+        self.sleep_time = 0.0
+        self.failed_time = 0.0
+        self._attempt_started = self.started
+
+    def remaining(self):
+        if self.policy.deadline is None:
+            return None
+        return self.policy.deadline - (time.monotonic() - self.started)
+
+    def begin_attempt(self):
+        self._attempt_started = time.monotonic()
+
+    def attempt_timeout(self):
+        remaining = self.remaining()
+        if remaining is None:
+            return self.policy.attempt_timeout
+        return max(0.0, min(self.policy.attempt_timeout, remaining))
+
+    def attempt_failed(self):
+        self.failed_time += time.monotonic() - self._attempt_started
+
+    def retry_refusal(self, exception, count=True):
+        """
+        Return None if another attempt is allowed, else the reason why not.
+
+        ``count=False`` checks the deadline / error class only, for retries
+        that do not consume the retry budget (e.g. after self-healing).
+        """
+        name = type(exception).__name__
+
+        if name in self.policy.non_retryable:
+            return f"{name} is not retryable"
+
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            return f"step deadline of {self.policy.deadline}s exceeded"
+
+        if not count:
+            return None
+
+        if self.retries >= self.policy.max_retries:
+            return f"retry limit {self.policy.max_retries} reached"
+
+        budget = self.policy.exception_budgets.get(name)
+        if budget is not None and self.per_exception.get(name, 0) >= budget:
+            return f"retry budget {budget} for {name} exhausted"
+
+        return None
+
+    def backoff(self, exception):
+        """Consume one retry and sleep for the backoff delay (deadline-capped)."""
+        name = type(exception).__name__
+        self.retries += 1
+        self.per_exception[name] = self.per_exception.get(name, 0) + 1
+
+        delay = self.policy.delay(self.retries)
+        remaining = self.remaining()
+        if remaining is not None:
+            delay = max(0.0, min(delay, remaining))
+
+        time.sleep(delay)
+        self.sleep_time += delay
+        return delay
+
+    def finish(self):
+        RetryMetrics.record(self)
+
+
+class RetryMetrics:
+    """Per-test accounting of time spent on retries.
+
+    Keyed by the running test id (PYTEST_CURRENT_TEST); conftest pops the
+    totals at teardown and attaches them to the test report.
+    """
+    _totals = {}
+    _lock = Lock()
+
+    @staticmethod
+    def _current_test():
+        # "<nodeid> (<phase>)"; parametrize ids may contain spaces themselves
+        return os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
+
+    @classmethod
+    def record(cls, state):
+        if not state.retries and not state.failed_time:
+            return
+        with cls._lock:
+            totals = cls._totals.setdefault(cls._current_test(), {
+                "steps_retried": 0,
+                "retries": 0,
+                "retry_sleep_s": 0.0,
+                "failed_attempts_s": 0.0,
+            })
+            totals["steps_retried"] += 1
+            totals["retries"] += state.retries
+            totals["retry_sleep_s"] += state.sleep_time
+            totals["failed_attempts_s"] += state.failed_time
+
+    @classmethod
+    def pop(cls, test_id):
+        with cls._lock:
+            return cls._totals.pop(test_id, None)
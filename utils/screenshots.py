@@ -0,0 +1,185 @@
+# utils/screenshots.py
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import allure
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+from core.profiler import StepProfiler
+from utils.attachments import AttachmentSink
+
+# Optional: downscaling / JPEG / WebP encoding
+try:
+    from PIL import Image
+except Exception:
+    Image = None
+
+logger = get_logger(__name__)
+
+
+class ScreenshotRecorder:
+    """Failure screenshot capture with a configurable policy.
+
+    Policies (``screenshots.policy`` in config.yaml):
+        every_attempt   - capture every failed attempt (legacy behaviour)
+        first_and_last  - capture the first failed attempt and the final failure
+        final_failure   - capture only when the step finally fails
+        ring_buffer     - keep the last ``buffer_size`` failed attempts of the
+                          test in memory; attach them only if the test fails
+
+    Captured PNGs are optionally downscaled (``max_width``) and re-encoded
+    (``format``: png | jpeg | webp, requires Pillow) on a background thread
+    so the calling step only pays for the driver round trip. Frames are
+    attached to Allure when the step ends (``flush``) or, for the ring
+    buffer, when the test fails (``flush_buffer``).
+
+    Args:
+        driver: Driver manager or raw Selenium/Appium driver.
+    """
+    POLICIES = ("every_attempt", "first_and_last", "final_failure", "ring_buffer")
+
+    FORMATS = {
+        "png": ("PNG", allure.attachment_type.PNG, None),
+        "jpeg": ("JPEG", allure.attachment_type.JPG, None),
+        "webp": ("WEBP", "image/webp", "webp"),
+    }
+
+    _ring = deque()
+    _ring_lock = Lock()
+    _executor = None
+    _executor_lock = Lock()
+
+    def __init__(self, driver):
+        self.driver = driver
+        settings = ConfigManager.get("screenshots") or {}
+
+        self.policy = settings.get("policy") or "every_attempt"
+        if self.policy not in self.POLICIES:
+            logger.warning(f"Unknown screenshot policy '{self.policy}', using every_attempt")
+            self.policy = "every_attempt"
+
+        self.buffer_size = settings.get("buffer_size") or 3
+        self.image_format = (settings.get("format") or "png").lower()
+        self.max_width = settings.get("max_width")
+        self.quality = settings.get("quality") or 70
+        self.encode_async = settings.get("encode_async", True)
+
+        if self.image_format not in self.FORMATS:
+            logger.warning(f"Unknown screenshot format '{self.image_format}', using png")
+            self.image_format = "png"
+        if Image is None and (self.image_format != "png" or self.max_width):
+            logger.warning("Pillow not installed; screenshots stay full-size PNG")
+            self.image_format = "png"
+            self.max_width = None
+
+        self._pending = []
+
+    # ------------------------------------------------------------------
+    # CAPTURE
+    # ------------------------------------------------------------------
+    def wants(self, attempt, final):
+        if self.policy == "every_attempt" or self.policy == "ring_buffer":
+            return True
+        if self.policy == "first_and_last":
+            return attempt == 1 or final
+        return final
+
+    def capture(self, name, attempt=1, final=False):
+        """Capture a frame if the policy asks for it (cheap no-op otherwise)."""
+        if not self.wants(attempt, final):
+            return
+        with StepProfiler.span("screenshot"):
+            self._capture(name)
+
+    def _capture(self, name):
+        # Unwrap WebDriverManager / MobileDriverManager at capture time
+        real_driver = getattr(self.driver, "driver", self.driver)
+        try:
+            if not hasattr(real_driver, "get_screenshot_as_png"):
+                return
+            png = real_driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.warning(f"Screenshot capture failed: {e}")
+            return
+
+        frame = (name, self._encode_later(png))
+
+        if self.policy == "ring_buffer":
+            with self._ring_lock:
+                self._ring.append(frame)
+                while len(self._ring) > self.buffer_size:
+                    self._ring.popleft()
+        else:
+            self._pending.append(frame)
+
+    def _encode_later(self, png):
+        if self.image_format == "png" and not self.max_width:
+            return png
+        if not self.encode_async:
+            return self._encode(png)
+
+        cls = type(self)
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-encoder")
+        return cls._executor.submit(self._encode, png)
+
+    def _encode(self, png):
+        try:
+            image = Image.open(io.BytesIO(png))
+            if self.max_width and image.width > self.max_width:
+                height = int(image.height * self.max_width / image.width)
+                image = image.resize((self.max_width, height))
+
+            pil_format = self.FORMATS[self.image_format][0]
+            if pil_format == "JPEG":
+                image = image.convert("RGB")
+
+            out = io.BytesIO()
+            image.save(out, format=pil_format, quality=self.quality)
+            return out.getvalue()
+        except Exception as e:
+            logger.warning(f"Screenshot encoding failed, keeping PNG: {e}")
+            return png
+
+    # ------------------------------------------------------------------
+    # ATTACH
+    # ------------------------------------------------------------------
+    @classmethod
+    def _attach(cls, frames, image_format):
+        _, attachment_type, extension = cls.FORMATS[image_format]
+        for name, payload in frames:
+            try:
+                body = payload.result() if hasattr(payload, "result") else payload
+                # An encoding fallback hands back the original PNG
+                if body[:8] == b"\x89PNG\r\n\x1a\n":
+                    AttachmentSink.attach(body, name=name, attachment_type=allure.attachment_type.PNG)
+                else:
+                    AttachmentSink.attach(body, name=name, attachment_type=attachment_type, extension=extension)
+            except Exception as e:
+                logger.warning(f"Screenshot attach failed: {e}")
+
+    def flush(self):
+        """Attach frames captured during the current step."""
+        frames, self._pending = self._pending, []
+        if frames:
+            with StepProfiler.span("screenshot", "attach screenshots"):
+                self._attach(frames, self.image_format)
+
+    @classmethod
+    def flush_buffer(cls):
+        """Attach the ring buffer (test failed) and empty it."""
+        with cls._ring_lock:
+            frames = list(cls._ring)
+            cls._ring.clear()
+        image_format = (ConfigManager.get("screenshots", "format") or "png").lower()
+        cls._attach(frames, image_format if image_format in cls.FORMATS else "png")
+
+    @classmethod
+    def discard_buffer(cls):
+        """Drop buffered frames (test passed)."""
+        with cls._ring_lock:
+            cls._ring.clear()
@@ -1,9 +1,9 @@
 # utils/self_healing.py
 import re
-import json
 import os
-from bs4 import BeautifulSoup
-from difflib import SequenceMatcher
+
+from utils.dom_snapshot import DomSnapshotCache
+from utils.healing_journal import HealingJournal
 
 
 class SelfHealingEngine:
@@ -15,11 +15,11 @@ class SelfHealingEngine:
         else:
             self.driver = driver
 
+        # log_path is the aggregated summary written by HealingJournal.compact()
+        # at session end; individual heals go to an append-only journal
         self.log_path = log_path
         os.makedirs(os.path.dirname(log_path), exist_ok=True)
-
-    def similarity(self, a, b):
-        return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        self.journal = HealingJournal(os.path.join(os.path.dirname(log_path), "healing_journal"))
 
     def self_heal_locator(self, locator):
         """
@@ -32,14 +32,14 @@ class SelfHealingEngine:
         by, original_value = locator
 
         # 🔥 IMPORTANT: use real selenium driver's page_source
-        page_source = self.driver.page_source
-        soup = BeautifulSoup(page_source, "html.parser")
+        # Parsed + indexed once per page state and shared across heals
+        snapshot = DomSnapshotCache.get(self.driver)
 
         # --- Case 1: pure ID locator -------------------------------------
         if by.lower() == "id":
-            healed = self._heal_by_similarity("id", original_value, soup)
+            healed = self._heal_by_similarity("id", original_value, snapshot)
             if healed:
-                self._log(locator, healed)
+                self._log(locator, healed, snapshot.url)
                 return healed
 
         # --- Case 2: XPATH with @id / @name / @placeholder / @aria-label --
@@ -48,55 +48,48 @@ class SelfHealingEngine:
             id_match = re.search(r"@id=['\"]([^'\"]+)['\"]", original_value)
             if id_match:
                 id_value = id_match.group(1)
-                healed = self._heal_by_similarity("id", id_value, soup)
+                healed = self._heal_by_similarity("id", id_value, snapshot)
                 if healed:
-                    self._log(locator, healed)
+                    self._log(locator, healed, snapshot.url)
                     return healed
 
             name_match = re.search(r"@name=['\"]([^'\"]+)['\"]", original_value)
             if name_match:
                 name_value = name_match.group(1)
-                healed = self._heal_by_similarity("name", name_value, soup)
+                healed = self._heal_by_similarity("name", name_value, snapshot)
                 if healed:
-                    self._log(locator, healed)
+                    self._log(locator, healed, snapshot.url)
                     return healed
 
             placeholder_match = re.search(r"@placeholder=['\"]([^'\"]+)['\"]", original_value)
             if placeholder_match:
                 placeholder_value = placeholder_match.group(1)
-                healed = self._heal_by_similarity("placeholder", placeholder_value, soup)
+                healed = self._heal_by_similarity("placeholder", placeholder_value, snapshot)
                 if healed:
-                    self._log(locator, healed)
+                    self._log(locator, healed, snapshot.url)
                     return healed
 
             aria_match = re.search(r"@aria-label=['\"]([^'\"]+)['\"]", original_value)
             if aria_match:
                 aria_value = aria_match.group(1)
-                healed = self._heal_by_similarity("aria-label", aria_value, soup)
+                healed = self._heal_by_similarity("aria-label", aria_value, snapshot)
                 if healed:
-                    self._log(locator, healed)
+                    self._log(locator, healed, snapshot.url)
                     return healed
 
         # --- Fallback: try raw value against other attributes ------------
         for attr in ["name", "placeholder", "aria-label"]:
-            healed = self._heal_by_similarity(attr, original_value, soup)
+            healed = self._heal_by_similarity(attr, original_value, snapshot)
             if healed:
-                self._log(locator, healed)
+                self._log(locator, healed, snapshot.url)
                 return healed
 
         return None
 
-    def _heal_by_similarity(self, attr, original_value, soup):
-        best_match = None
-        best_score = 0.0
-
-        for tag in soup.find_all(attrs={attr: True}):
-            current = tag.get(attr)
-            score = self.similarity(original_value, current)
-
-            if score > best_score and score > 0.7:
-                best_score = score
-                best_match = current
+    def _heal_by_similarity(self, attr, original_value, snapshot):
+        # Same ranking as scoring every value with SequenceMatcher.ratio(),
+        # but implausible candidates are pruned before the exact ratio
+        best_match = snapshot.candidates(attr).best_match(original_value, threshold=0.7)
 
         if best_match:
             if attr == "id":
@@ -105,16 +98,5 @@ class SelfHealingEngine:
 
         return None
 
-    def _log(self, old, new):
-        data = {}
-        if os.path.exists(self.log_path):
-            with open(self.log_path, "r") as f:
-                try:
-                    data = json.load(f)
-                except Exception:
-                    data = {}
-
-        data[str(old)] = {"old": old, "new": new}
-
-        with open(self.log_path, "w") as f:
-            json.dump(data, f, indent=4)
+    def _log(self, old, new, url=None):
+        self.journal.append(old, new, url)
@@ -0,0 +1,165 @@
+# utils/timing_store.py
+import json
+import os
+import re
+import tempfile
+
+from core.configManager import ConfigManager
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TimingStore:
+    """Historical per-test durations, used to order the next run longest-first.
+
+    Durations (setup + call + teardown) are recorded by the controller
+    process from the test reports it receives, so xdist workers never write
+    the file. They are kept per ``<platform>:<env>`` profile as an
+    exponentially weighted mean, so one slow outlier does not dominate.
+
+    Ordering: order(items, profile, workers, chunk) sorts collected items
+    longest-first; tests without history are placed as if they took the
+    mean known duration. Once running, xdist hands pending tests to
+    whichever worker frees up, so the long flows start early and the
+    short tests fill the gaps at the end (greedy LPT bin-packing).
+
+    The first tests are dealt round-robin over the workers instead:
+    LoadScheduling sends each worker a consecutive chunk at start, which
+    with a plain longest-first list would queue the longest tests all on
+    gw0. Worker k's chunk gets ranks k, k + workers, k + 2 * workers, ...
+    (loadgroup sends one test at a time, so chunk is 1 and the order is
+    already dealt).
+
+    File format (timings.path):
+        {"<platform>:<env>": {"<nodeid>": {"mean": 12.3, "runs": 4}}}
+    """
+    ALPHA = 0.3
+
+    _durations = {}
+    _called = set()
+    _history = None
+
+    # ------------------------------------------------------------------
+    # CONFIG
+    # ------------------------------------------------------------------
+    @classmethod
+    def enabled(cls):
+        enabled = ConfigManager.get("timings", "enabled")
+        return True if enabled is None else bool(enabled)
+
+    @classmethod
+    def _path(cls):
+        return ConfigManager.get("timings", "path") or "reports/test_timings.json"
+
+    @staticmethod
+    def profile(platform, env):
+        return f"{platform}:{env}"
+
+    @staticmethod
+    def _key(nodeid):
+        # Strip the "@group" suffix xdist adds under loadgroup scheduling
+        return re.sub(r"@[^\[\]/:@]*$", "", nodeid)
+
+    # ------------------------------------------------------------------
+    # PERSISTENCE
+    # ------------------------------------------------------------------
+    @classmethod
+    def _read(cls):
+        path = cls._path()
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable timing store {path}: {e}")
+            return {}
+
+    @classmethod
+    def _load(cls):
+        if cls._history is None:
+            cls._history = cls._read()
+        return cls._history
+
+    # ------------------------------------------------------------------
+    # PUBLIC API
+    # ------------------------------------------------------------------
+    @classmethod
+    def record(cls, report):
+        """Add one phase report's duration to its test's total for this run."""
+        if report.skipped:
+            return
+        key = cls._key(report.nodeid)
+        cls._durations[key] = cls._durations.get(key, 0.0) + (report.duration or 0.0)
+        if report.when == "call":
+            cls._called.add(key)
+
+    @classmethod
+    def durations(cls, profile):
+        """{nodeid: mean seconds} recorded for ``profile``."""
+        return {
+            nodeid: entry["mean"]
+            for nodeid, entry in (cls._load().get(profile) or {}).items()
+        }
+
+    @classmethod
+    def order(cls, items, profile, workers=1, chunk=1):
+        """Sort ``items`` in place, longest expected duration first.
+
+        With ``workers`` > 1 and ``chunk`` > 1 the first ``workers * chunk``
+        items are dealt so each worker's initial chunk mixes long and short.
+        """
+        known = cls.durations(profile)
+        if not known:
+            return
+
+        default = sum(known.values()) / len(known)
+        expected = {item.nodeid: known.get(cls._key(item.nodeid), default) for item in items}
+        # sort() is stable: equal estimates keep collection order
+        ranked = sorted(items, key=lambda item: expected[item.nodeid], reverse=True)
+
+        head = workers * chunk if workers > 1 and chunk > 1 else 0
+        head = min(head, len(ranked))
+        dealt = [ranked[k + j * workers] for k in range(workers) for j in range(chunk) if k + j * workers < head]
+        items[:] = dealt + ranked[head:]
+
+        total = sum(expected.values())
+        logger.info(
+            f"Ordered {len(items)} tests longest-first from {profile} timings "
+            f"({len(known)} known, {total:.0f}s expected in total"
+            + (f", first {head} dealt over {workers} workers)" if head else ")")
+        )
+
+    @classmethod
+    def save(cls, profile):
+        """Fold this run's durations into the store (controller, session end)."""
+        # Tests skipped before their call phase would only skew the estimates
+        durations = {k: v for k, v in cls._durations.items() if k in cls._called}
+        if not durations:
+            return
+
+        path = cls._path()
+        try:
+            merged = cls._read()
+            timings = merged.setdefault(profile, {})
+            for nodeid, duration in durations.items():
+                entry = timings.get(nodeid)
+                if entry is None:
+                    timings[nodeid] = {"mean": round(duration, 3), "runs": 1}
+                else:
+                    mean = cls.ALPHA * duration + (1 - cls.ALPHA) * entry["mean"]
+                    timings[nodeid] = {"mean": round(mean, 3), "runs": entry.get("runs", 0) + 1}
+
+            directory = os.path.dirname(path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(merged, f, indent=4, sort_keys=True)
+            os.replace(tmp_path, path)
+
+            cls._history = merged
+            cls._durations.clear()
+            cls._called.clear()
+        except Exception as e:
+            logger.warning(f"Could not persist timing store {path}: {e}")
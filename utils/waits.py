@@ -1,8 +1,7 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 import allure
 from core.logger import get_logger
+from core.wait_engine import EventWaitEngine, WaitCondition
 
 
 class WaitUtils:
@@ -10,6 +9,11 @@ class WaitUtils:
         self.driver = driver
         self.logger = get_logger(self.__class__.__name__)
 
+    def _engine(self, poll_frequency=0.5):
+        """Event-driven wait engine on the raw Selenium/Appium driver."""
+        # Unwrap WebDriverManager / MobileDriverManager
+        return EventWaitEngine(getattr(self.driver, "driver", self.driver), poll_frequency)
+
     @allure.step("Wait until element is visible: {locator}")
     def wait_until_visible(self, by, locator, timeout=20, poll_frequency=0.5):
         """
@@ -18,12 +22,12 @@ class WaitUtils:
         :param by: locator strategy, e.g. By.XPATH
         :param locator: locator string
         :param timeout: maximum time to wait (seconds)
-        :param poll_frequency: how often to check (seconds)
+        :param poll_frequency: how often to check (seconds) when the wait
+                               falls back to polling
         :return: WebElement if found, None otherwise
         """
         try:
-            wait = WebDriverWait(self.driver, timeout, poll_frequency)
-            element = wait.until(EC.visibility_of_element_located((by, locator)))
+            element = self._engine(poll_frequency).wait(by, locator, "visible", timeout)
             # allure.attach(
             #     self.driver.get_screenshot_as_png(),
             #     name="ElementVisible",
@@ -47,9 +51,7 @@ class WaitUtils:
     def wait_until_clickable(self, by, locator, timeout=10):
         """Wait until the element becomes clickable."""
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((by, locator))
-            )
+            return self._engine().wait(by, locator, "clickable", timeout)
         except TimeoutException:
             allure.attach(
                 f"Element not clickable: {locator} after {timeout}s",
@@ -62,9 +64,7 @@ class WaitUtils:
     def wait_until_text_present(self, by, locator, text, timeout=10):
         """Wait until a specific text appears in an element."""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.text_to_be_present_in_element((by, locator), text)
-            )
+            self._engine().wait(by, locator, "text", timeout, text=text)
         except TimeoutException:
             allure.attach(
                 f"Text '{text}' not found in element: {locator} after {timeout}s",
@@ -72,3 +72,62 @@ class WaitUtils:
                 attachment_type=allure.attachment_type.TEXT
             )
             raise
+
+    @allure.step("Wait until element is invisible: {locator}")
+    def wait_until_invisible(self, by, locator, timeout=10):
+        """Wait until an element is gone or hidden (spinners, overlays, toasts)."""
+        try:
+            return self._engine().wait(by, locator, "absent", timeout)
+        except TimeoutException:
+            allure.attach(
+                f"Element still visible: {locator} after {timeout}s",
+                name="Wait Failure - Invisible",
+                attachment_type=allure.attachment_type.TEXT
+            )
+            raise
+
+    @allure.step("Wait for the first of several conditions")
+    def wait_for_any(self, conditions, timeout=10):
+        """
+        Wait until any one of several conditions holds, in a single wait.
+
+        :param conditions: WaitCondition / (by, locator, condition, text, name)
+                           tuples; condition defaults to "present"
+        :param timeout: maximum time to wait (seconds)
+        :return: (name, element) of the condition that fired; name falls back
+                 to the condition's index. Earlier conditions win ties.
+        """
+        conditions = [WaitCondition(*c) for c in conditions]
+        try:
+            index, element = self._engine().wait_any(conditions, timeout)
+        except TimeoutException:
+            allure.attach(
+                "\n".join(f"({c.by}, {c.value}) {c.condition}" for c in conditions),
+                name=f"Wait Failure - None of {len(conditions)} conditions after {timeout}s",
+                attachment_type=allure.attachment_type.TEXT
+            )
+            raise
+
+        name = conditions[index].name if conditions[index].name is not None else index
+        self.logger.info(f"Condition fired: {name} ({conditions[index].by}, {conditions[index].value})")
+        return name, element
+
+    @allure.step("Wait for all conditions")
+    def wait_for_all(self, conditions, timeout=10):
+        """
+        Wait until every condition holds at the same time, in a single wait.
+
+        :param conditions: WaitCondition / (by, locator, condition, text, name) tuples
+        :param timeout: maximum time to wait (seconds)
+        :return: list of elements (True for "absent" conditions), in order
+        """
+        conditions = [WaitCondition(*c) for c in conditions]
+        try:
+            return self._engine().wait_all(conditions, timeout)
+        except TimeoutException:
+            allure.attach(
+                "\n".join(f"({c.by}, {c.value}) {c.condition}" for c in conditions),
+                name=f"Wait Failure - Not all of {len(conditions)} conditions after {timeout}s",
+                attachment_type=allure.attachment_type.TEXT
+            )
+            raise